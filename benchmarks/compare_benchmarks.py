@@ -0,0 +1,43 @@
+"""
+Compare two JSON reports of run_benchmarks.py and
+exit with an error if throughput has dropped more than the threshold
+"""
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+
+def load_results(file_path: str) -> Dict[Tuple, Dict]:
+    with open(file_path) as file:
+        report = json.load(file)
+    return {
+        (result['document'], result['stage'], result['transformers']): result
+        for result in report['results']}
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='allowed relative drop of throughput')
+    options = parser.parse_args(arguments)
+
+    baseline = load_results(options.baseline)
+    current = load_results(options.current)
+    regressions = 0
+    for key in sorted(set(baseline) & set(current), key=str):
+        before = baseline[key]['nodes_per_second']
+        after = current[key]['nodes_per_second']
+        change = after / before - 1
+        is_regression = change < -options.threshold
+        regressions += is_regression
+        print('{0:>18} {1:>14} transformers={2:<5} {3:+7.1%}{4}'.format(
+            key[0], key[1], str(key[2]), change,
+            ' REGRESSION' if is_regression else ''))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Generators of synthetic XML documents for benchmarks
+"""
+import random
+
+
+def generate_wide(size: int, seed: int = 0) -> str:
+    """
+    Document with many small records on one level
+    :param size: number of records
+    :param seed: seed of random values
+    :return: XML text
+    """
+    rand = random.Random(seed)
+    records = [
+        '<record><id>{0}</id><name>name {1}</name>'
+        '<value>{2}</value></record>'.format(
+            index, rand.randint(0, 1000), rand.random())
+        for index in range(size)]
+    return '<root>{0}</root>'.format(''.join(records))
+
+
+def generate_deep(size: int, seed: int = 0) -> str:
+    """
+    Document with nested elements
+    :param size: depth of the document
+    :param seed: seed of random values
+    :return: XML text
+    """
+    rand = random.Random(seed)
+    parts = ['<level depth="{0}"><value>{1}</value>'.format(
+        index, rand.randint(0, 1000)) for index in range(size)]
+    return ''.join(parts) + '</level>' * size
+
+
+def generate_attribute_heavy(size: int, seed: int = 0) -> str:
+    """
+    Document with many attributes in every record
+    :param size: number of records
+    :param seed: seed of random values
+    :return: XML text
+    """
+    rand = random.Random(seed)
+    records = []
+    for index in range(size):
+        attributes = ' '.join(
+            'attr{0}="{1}"'.format(number, rand.randint(0, 1000))
+            for number in range(20))
+        records.append('<record id="{0}" {1}>{2}</record>'.format(
+            index, attributes, rand.random()))
+    return '<root>{0}</root>'.format(''.join(records))
+
+
+def generate_namespace_heavy(size: int, seed: int = 0) -> str:
+    """
+    Document with elements from several namespaces
+    :param size: number of records
+    :param seed: seed of random values
+    :return: XML text
+    """
+    rand = random.Random(seed)
+    namespaces = ' '.join(
+        'xmlns:ns{0}="http://example.com/ns{0}"'.format(number)
+        for number in range(5))
+    records = [
+        '<ns0:record><ns1:id>{0}</ns1:id><ns2:name>name {1}</ns2:name>'
+        '<ns3:value>{2}</ns3:value><ns4:flag>true</ns4:flag>'
+        '</ns0:record>'.format(index, rand.randint(0, 1000), rand.random())
+        for index in range(size)]
+    return '<ns0:root {0}>{1}</ns0:root>'.format(namespaces, ''.join(records))
+
+
+def generate_transformer_heavy(size: int, seed: int = 0) -> str:
+    """
+    Document with typed values for default transformers
+    :param size: number of records
+    :param seed: seed of random values
+    :return: XML text
+    """
+    rand = random.Random(seed)
+    records = [
+        '<record><id type="integer">{0}</id>'
+        '<count type="integer">{1}</count>'
+        '<active type="bool">{2}</active>'
+        '<created type="datetime">2020-01-{3:02d}T10:{4:02d}:00Z</created>'
+        '</record>'.format(
+            index, rand.randint(0, 1000),
+            rand.choice(['true', 'false']),
+            rand.randint(1, 28), rand.randint(0, 59))
+        for index in range(size)]
+    return '<root>{0}</root>'.format(''.join(records))
+
+
+GENERATORS = {
+    'wide': generate_wide,
+    'deep': generate_deep,
+    'attribute_heavy': generate_attribute_heavy,
+    'namespace_heavy': generate_namespace_heavy,
+    'transformer_heavy': generate_transformer_heavy,
+}
@@ -0,0 +1,169 @@
+"""
+Benchmarks of XmlTextToDict, XmlFileToDict, XmlToDict.get_dict
+and DictToXml (alone and in a round trip) on synthetic documents.
+Results are printed and can be saved as JSON to compare versions:
+
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --output after.json
+    python benchmarks/compare_benchmarks.py before.json after.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ElementTree
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xmltodict3 import (  # noqa: E402
+    XmlToDict, XmlTextToDict, XmlFileToDict, DictToXml,
+    PullTransformers, DefaultTransformerList)
+from generators import GENERATORS  # noqa: E402
+
+
+DEFAULT_SIZES = {
+    'wide': 50000,
+    'deep': 5000,
+    'attribute_heavy': 20000,
+    'namespace_heavy': 30000,
+    'transformer_heavy': 30000,
+}
+
+
+def get_pull_transformers() -> PullTransformers:
+    pull_transformers = PullTransformers(*DefaultTransformerList)
+    pull_transformers.set_removing_types(True)
+    return pull_transformers
+
+
+def measure(function: Callable[[], Dict], repeat: int) -> Dict:
+    """
+    Run a function several times and measure the best time
+        and peak memory of the first run
+    :param function: function to measure
+    :param repeat: number of runs
+    :return: best time in seconds and peak memory in bytes
+    """
+    tracemalloc.start()
+    function()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return {'seconds': min(times), 'peak_memory': peak_memory}
+
+
+def run_document(name: str, size: int, repeat: int,
+                 file_path: str) -> List[Dict]:
+    """
+    Run all stages for one synthetic document
+    :param name: name of a generator
+    :param size: size for the generator
+    :param repeat: number of runs
+    :param file_path: path of a temporary file for XmlFileToDict
+    :return: list of results
+    """
+    text = GENERATORS[name](size)
+    with open(file_path, 'w') as file:
+        file.write(text)
+    root_node = ElementTree.fromstring(text)
+    node_count = sum(1 for _ in root_node.iter())
+    megabytes = len(text.encode('utf-8')) / 1024 / 1024
+    results = list()
+    for use_transformers in (False, True):
+        pull_transformers = None
+        if use_transformers:
+            pull_transformers = get_pull_transformers()
+        data = _convert(
+            XmlToDict(root_node, ignore_namespace=True), pull_transformers)
+        stages = {
+            'XmlTextToDict': lambda: _convert(
+                XmlTextToDict(text, ignore_namespace=True),
+                pull_transformers),
+            'XmlFileToDict': lambda: _convert(
+                XmlFileToDict(file_path, ignore_namespace=True),
+                pull_transformers),
+            'XmlToDict': lambda: _convert(
+                XmlToDict(root_node, ignore_namespace=True),
+                pull_transformers),
+            'DictToXml': lambda: _serialize(data, pull_transformers),
+            'RoundTrip': lambda: _serialize(_convert(
+                XmlTextToDict(text, ignore_namespace=True),
+                pull_transformers), pull_transformers),
+        }
+        for stage, function in stages.items():
+            result = measure(function, repeat)
+            result.update({
+                'document': name,
+                'stage': stage,
+                'transformers': use_transformers,
+                'size': size,
+                'nodes': node_count,
+                'megabytes': megabytes,
+                'mb_per_second': megabytes / result['seconds'],
+                'nodes_per_second': node_count / result['seconds'],
+            })
+            results.append(result)
+    return results
+
+
+def _convert(xml_to_dict, pull_transformers: Optional[PullTransformers]):
+    if pull_transformers is not None:
+        xml_to_dict.use_pull_transformers(pull_transformers)
+    return xml_to_dict.get_dict()
+
+
+def _serialize(data: Dict,
+               pull_transformers: Optional[PullTransformers]) -> str:
+    dict_to_xml = DictToXml(data)
+    if pull_transformers is not None:
+        dict_to_xml.use_pull_transformers(pull_transformers)
+    return dict_to_xml.get_xml()
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--documents', nargs='+', choices=sorted(GENERATORS),
+                        default=sorted(GENERATORS))
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='multiplier for sizes of documents')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='path to save results as JSON')
+    options = parser.parse_args(arguments)
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100000))
+    results = list()
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'benchmark.xml')
+        for name in options.documents:
+            size = max(int(DEFAULT_SIZES[name] * options.scale), 1)
+            for result in run_document(name, size, options.repeat,
+                                       file_path):
+                print('{document:>18} {stage:>14} transformers={tr:<5} '
+                      '{mb_per_second:8.2f} MB/s {nodes_per_second:12.0f} '
+                      'nodes/s {peak:8.1f} MB peak'.format(
+                          tr=str(result['transformers']),
+                          peak=result['peak_memory'] / 1024 / 1024,
+                          **result))
+                results.append(result)
+
+    if options.output:
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results,
+        }
+        with open(options.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Case with expensive transformers in an executor
+"""
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+import re
+from typing import Dict
+
+from xmltodict3 import (
+    XmlFileToDict, DefaultTransformerList, PullTransformers)
+from xmltodict3.transformers import AbstractTransformer
+
+
+class PriceTransformer(AbstractTransformer):
+    key = "price"
+
+    def get_value_or_raise_exception(self, node_data: Dict):
+        value = node_data['#text']
+        pattern = r'^\$(\d+\.?\d*)$'
+        pattern_match = re.match(pattern, value)
+        if not pattern_match:
+            raise TypeError(
+                'The value <{0}> has not matched with pattern <{1}>'.format(
+                    repr(value), pattern)
+            )
+        return Decimal(pattern_match.group(1))
+
+
+class DiscountTransformer(AbstractTransformer):
+    key = "discount"
+
+    def get_value_or_raise_exception(self, node_data: Dict):
+        value = node_data['#text']
+        pattern = r'^(\d+\.?\d*)\%$'
+        pattern_match = re.match(pattern, value)
+        if not pattern_match:
+            raise TypeError(
+                'The value <{0}> has not matched with pattern <{1}>'.format(
+                    repr(value), pattern)
+            )
+        return Decimal(pattern_match.group(1))
+
+
+expected_result = {
+    'breakfast_menu': {
+        'food': [
+            {
+                'calories': 650,
+                'description': 'Two of our famous Belgian Waffles '
+                               'with plenty of real maple syrup',
+                'name': 'Belgian Waffles',
+                'price': Decimal('5.95'),
+                'discount': Decimal('15'),
+            },
+            {
+                'calories': 900,
+                'description': 'Light Belgian waffles covered '
+                               'with strawberries and whipped cream',
+                'name': 'Strawberry Belgian Waffles',
+                'price': Decimal('7.95'),
+                'discount': Decimal('10.5'),
+            }
+        ]
+    }
+}
+
+# Typed nodes are collected during the conversion and transformed
+# in the executor by chunks of nodes with the same key.
+# ProcessPoolExecutor can be used for pure-Python CPU work
+# (with "if __name__ == '__main__':" on platforms which spawn processes)
+custom_transformer_list = DefaultTransformerList + [
+    PriceTransformer, DiscountTransformer]
+pull_transformers = PullTransformers(*custom_transformer_list)
+pull_transformers.set_removing_types(True)
+with ThreadPoolExecutor(max_workers=4) as executor:
+    pull_transformers.use_executor(executor, chunk_size=1000)
+    xml_to_dict = XmlFileToDict(file_path='data/ex4.xml')
+    xml_to_dict.use_pull_transformers(pull_transformers)
+    result = xml_to_dict.get_dict()
+
+assert result == expected_result, result
@@ -21,4 +21,10 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires='>=3.5',
+    extras_require={'lxml': ['lxml']},
+    entry_points={
+        'console_scripts': [
+            'xmltodict3=xmltodict3.cli:main',
+        ],
+    },
 )
@@ -0,0 +1,75 @@
+import asyncio
+
+from xmltodict3 import AsyncXmlStreamToDict
+import xmltodict3.transformers as transformers
+
+
+TEXT = b"<root><node type='integer'>1</node><other>2</other>" \
+       b"<node attr='a'><sub>3</sub></node></root>"
+
+
+class ChunkIterator:
+    def __init__(self, data: bytes, size: int):
+        self.chunks = [data[start:start + size]
+                       for start in range(0, len(data), size)]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if not self.chunks:
+            raise StopAsyncIteration
+        return self.chunks.pop(0)
+
+
+async def collect(xml_stream_to_dict: AsyncXmlStreamToDict):
+    result = []
+    async for item in xml_stream_to_dict:
+        result.append(item)
+    return result
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_async_iterator():
+    xml_stream_to_dict = AsyncXmlStreamToDict(
+        ChunkIterator(TEXT, 5), 'root/node')
+    result = run(collect(xml_stream_to_dict))
+    expected_result = [{'node': {'@type': 'integer', '#text': '1'}},
+                       {'node': {'sub': '3', '@attr': 'a'}}]
+    assert result == expected_result, result
+
+
+def test_stream_reader():
+    async def read_stream():
+        reader = asyncio.StreamReader()
+        reader.feed_data(TEXT)
+        reader.feed_eof()
+        xml_stream_to_dict = AsyncXmlStreamToDict(reader, chunk_size=7)
+        return await collect(xml_stream_to_dict)
+
+    result = run(read_stream())
+    expected_result = [{'root': {
+        'node': [{'@type': 'integer', '#text': '1'},
+                 {'sub': '3', '@attr': 'a'}],
+        'other': '2'}}]
+    assert result == expected_result, result
+
+
+def test_with_pull_transformers():
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer)
+    pull_transformers.set_removing_types(True)
+    xml_stream_to_dict = AsyncXmlStreamToDict(
+        ChunkIterator(TEXT, 1000), 'root/node', chunk_size=3)
+    xml_stream_to_dict.use_pull_transformers(pull_transformers)
+    result = run(collect(xml_stream_to_dict))
+    expected_result = [{'node': 1}, {'node': {'sub': '3', '@attr': 'a'}}]
+    assert result == expected_result, result
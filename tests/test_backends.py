@@ -0,0 +1,80 @@
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from xmltodict3 import XmlTextToDict, XmlFileToDict, TagNormalizer
+from xmltodict3 import ElementTreeBackend, LxmlBackend, ExpatBackend
+from xmltodict3 import PullTransformers, IntegerTransformer, BoolTransformer
+
+
+XML_TEXT = '<?xml version="1.0" encoding="UTF-8"?>' \
+           '<root xmlns="http://a.com/ns" xmlns:b="http://b.com/ns" a="1">' \
+           'text<!-- comment --><node type="integer">1</node>' \
+           '<node type="integer"> 2 </node><b:name b:c="2">test</b:name>' \
+           '<item><flag type="bool">true</flag>tail</item>' \
+           '<b:flag b:c="3">false</b:flag>' \
+           '<empty/><space> </space><text x="y">a<![CDATA[ & b]]></text>' \
+           '</root>'
+
+
+def get_xml_text_to_dict(parser_backend=None, xml_text=XML_TEXT):
+    xml_text_to_dict = XmlTextToDict(xml_text)
+    bool_transformer = BoolTransformer()
+    bool_transformer.set_tags('b:flag')
+    pull_transformers = PullTransformers(IntegerTransformer, bool_transformer)
+    pull_transformers.set_removing_types(True)
+    xml_text_to_dict.use_pull_transformers(pull_transformers)
+    xml_text_to_dict.use_tag_normalizer(
+        TagNormalizer(namespaces={'http://b.com/ns': 'b'}))
+    if parser_backend is not None:
+        xml_text_to_dict.use_parser_backend(parser_backend)
+    return xml_text_to_dict
+
+
+def test_expat_backend():
+    expected_result = get_xml_text_to_dict().get_dict()
+    root = expected_result['{http://a.com/ns}root']
+    assert root['b:name'] == \
+        {'@{http://b.com/ns}c': '2', '#text': 'test'}
+    assert root['b:flag'] == {'@{http://b.com/ns}c': '3', '#text': False}
+    assert get_xml_text_to_dict(ExpatBackend()).get_dict() == \
+        expected_result
+
+
+def test_expat_backend_with_file(tmpdir):
+    file_path = tmpdir.join('test.xml')
+    file_path.write_text(XML_TEXT, encoding='utf-8')
+    xml_file_to_dict = XmlFileToDict(str(file_path), ignore_namespace=True)
+    expected_result = xml_file_to_dict.get_dict()
+    xml_file_to_dict.use_parser_backend(ExpatBackend())
+    assert xml_file_to_dict.get_dict() == expected_result
+
+
+def test_expat_backend_in_chunks():
+    parser_backend = ExpatBackend()
+    parser_backend.chunk_size = 7
+    assert get_xml_text_to_dict(parser_backend).get_dict() == \
+        get_xml_text_to_dict().get_dict()
+
+
+def test_expat_backend_errors():
+    xml_text_to_dict = get_xml_text_to_dict(
+        ExpatBackend(), '<root><a></root>')
+    with pytest.raises(ElementTree.ParseError):
+        xml_text_to_dict.get_dict()
+    with pytest.raises(NotImplementedError):
+        get_xml_text_to_dict(ExpatBackend()).get_lazy_dict()
+
+
+def test_element_tree_backend():
+    xml_text_to_dict = get_xml_text_to_dict(ElementTreeBackend())
+    assert xml_text_to_dict.get_dict() == \
+        get_xml_text_to_dict().get_dict()
+    assert xml_text_to_dict.get_lazy_dict() == \
+        get_xml_text_to_dict().get_dict()
+
+
+def test_lxml_backend():
+    pytest.importorskip('lxml')
+    assert get_xml_text_to_dict(LxmlBackend()).get_dict() == \
+        get_xml_text_to_dict().get_dict()
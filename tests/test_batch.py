@@ -0,0 +1,107 @@
+import gzip
+import os
+
+import pytest
+
+from xmltodict3 import (
+    XmlFileToDict, convert_files, convert_file, iter_file_items)
+import xmltodict3.transformers as transformers
+
+
+def get_test_file_path(file_name: str) -> str:
+    current_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_path, 'test_data', file_name)
+
+
+def test_convert_files_ordered():
+    file_paths = [get_test_file_path('sample_food.xml'),
+                  get_test_file_path('sample_food_with_namespace.xml')] * 3
+    result = list(convert_files(
+        file_paths, workers=2, chunksize=2, ignore_namespace=True))
+    assert [file_path for file_path, _ in result] == file_paths
+    first_data = result[0][1]
+    assert all(data == first_data for _, data in result), result
+    assert first_data['breakfast_menu']['food'][0]['calories'] == '650'
+
+
+def test_convert_files_unordered_with_pull_transformers():
+    file_paths = [get_test_file_path('sample_food_with_types.xml'),
+                  get_test_file_path('sample_food.xml')]
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer)
+    pull_transformers.set_removing_types(True)
+    result = dict(convert_files(
+        file_paths, workers=2, ordered=False,
+        pull_transformers=pull_transformers))
+    assert set(result) == set(file_paths)
+    food = result[file_paths[0]]['breakfast_menu']['food'][0]
+    assert food['calories'] == 650, food
+    food = result[file_paths[1]]['breakfast_menu']['food'][0]
+    assert food['calories'] == '650', food
+
+
+SPLIT_TEXT = """<?xml version="1.0" encoding="UTF-8"?>
+<!-- <product>comment</product> -->
+<catalog xmlns="http://test.com/test_shema" version="1>0">
+    <info><name>Catalog</name></info>
+    <product id="1" note='a > b'><name>a</name>
+        <price type="integer">1</price></product>
+    <product id="2"><product>nested</product></product>
+    <product id="3" note="c/>d"/>
+    <separator/>
+    <product id="4"><name>d</name><price type="integer">4</price></product>
+    <product id="5">e</product>
+</catalog>
+"""
+
+
+def write_split_file(tmpdir) -> str:
+    file_path = str(tmpdir.join('split.xml'))
+    with open(file_path, 'w') as file:
+        file.write(SPLIT_TEXT)
+    return file_path
+
+
+def test_iter_file_items(tmpdir):
+    file_path = write_split_file(tmpdir)
+    result = list(iter_file_items(
+        file_path, 'catalog/product', workers=2, chunk_size=100,
+        ignore_namespace=True))
+    expected_result = list(XmlFileToDict(
+        file_path, ignore_namespace=True).iter_items('catalog/product'))
+    assert len(result) == 5
+    assert result == expected_result, result
+
+
+def test_convert_file(tmpdir):
+    file_path = write_split_file(tmpdir)
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer)
+    pull_transformers.set_removing_types(True)
+    for chunk_size in (1, 100, 10000):
+        for ignore_namespace in (True, False):
+            result = convert_file(
+                file_path, 'catalog/product', workers=2,
+                chunk_size=chunk_size, ignore_namespace=ignore_namespace,
+                pull_transformers=pull_transformers)
+            xml_to_dict = XmlFileToDict(
+                file_path, ignore_namespace=ignore_namespace)
+            xml_to_dict.use_pull_transformers(pull_transformers)
+            expected_result = xml_to_dict.get_dict()
+            assert result == expected_result, result
+
+
+def test_convert_file_with_invalid_path(tmpdir):
+    file_path = write_split_file(tmpdir)
+    with pytest.raises(ValueError):
+        convert_file(file_path, 'catalog')
+
+
+def test_convert_compressed_file(tmpdir):
+    file_path = str(tmpdir.join('test.xml.gz'))
+    with gzip.open(file_path, 'wb') as file:
+        file.write(b'<catalog><product>1</product></catalog>')
+    result = list(convert_files([file_path], workers=1))
+    assert result == [(file_path, {'catalog': {'product': '1'}})]
+    with pytest.raises(ValueError):
+        convert_file(file_path, 'catalog/product')
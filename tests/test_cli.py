@@ -0,0 +1,75 @@
+import gzip
+import io
+import json
+import pickle
+
+from xmltodict3.cli import main
+
+
+XML_TEXT = '<catalog><product id="1"><price type="integer">1</price>' \
+           '</product><product id="2"><price type="integer">2</price>' \
+           '</product></catalog>'
+TRANSFORMERS = 'xmltodict3.transformers:DefaultTransformerList'
+
+
+def get_product(index):
+    return {'product': {'price': index, '@id': str(index)}}
+
+
+def write_files(tmpdir):
+    tmpdir.join('a.xml').write(XML_TEXT)
+    with gzip.open(str(tmpdir.join('b.xml.gz')), 'wb') as file:
+        file.write(XML_TEXT.encode('utf-8'))
+
+
+def run(tmpdir, *arguments):
+    output_path = str(tmpdir.join('output'))
+    main(list(arguments) + ['--output-file', output_path])
+    with open(output_path, 'rb') as output_file:
+        return output_file.read()
+
+
+def test_stream_to_jsonl(tmpdir):
+    write_files(tmpdir)
+    result = run(tmpdir, str(tmpdir.join('*.xml*')),
+                 '--stream', 'catalog/product',
+                 '--transformers', TRANSFORMERS, '--remove-types')
+    assert [json.loads(line) for line in result.splitlines()] == \
+        [get_product(1), get_product(2)] * 2
+
+
+def test_documents_to_json_with_workers(tmpdir):
+    write_files(tmpdir)
+    result = run(tmpdir, str(tmpdir.join('a.xml')),
+                 str(tmpdir.join('b.xml.gz')), '--workers', '2',
+                 '--output', 'json', '--ignore-namespace')
+    document = {'catalog': {'product': [
+        {'price': {'@type': 'integer', '#text': '1'}, '@id': '1'},
+        {'price': {'@type': 'integer', '#text': '2'}, '@id': '2'}]}}
+    assert json.loads(result.decode('utf-8')) == [document, document]
+    result = run(tmpdir, str(tmpdir.join('a.xml')), '--output', 'json')
+    assert json.loads(result.decode('utf-8')) == document
+
+
+def test_stdin_to_pickle(tmpdir, monkeypatch, capsys):
+    monkeypatch.setattr(
+        'sys.stdin', io.TextIOWrapper(io.BytesIO(XML_TEXT.encode('utf-8'))))
+    result = run(tmpdir, '-', '--stream', 'catalog/product', '--output',
+                 'pickle', '--transformers', TRANSFORMERS,
+                 '--remove-types', '--stats')
+    result_file = io.BytesIO(result)
+    assert [pickle.load(result_file), pickle.load(result_file)] == \
+        [get_product(1), get_product(2)]
+    stats_output = capsys.readouterr().err
+    assert stats_output.startswith('records: 2, ')
+    assert 'MB/s' in stats_output and 'nodes/s' in stats_output
+
+
+def test_stream_with_workers_and_stats(tmpdir, capsys):
+    write_files(tmpdir)
+    result = run(tmpdir, str(tmpdir.join('a.xml')), '--stream', 'catalog',
+                 '--workers', '2', '--stats')
+    assert len(result.splitlines()) == 1
+    stats_output = capsys.readouterr().err
+    assert stats_output.startswith('records: 1, ')
+    assert 'MB/s' in stats_output and 'nodes/s' not in stats_output
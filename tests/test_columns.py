@@ -0,0 +1,128 @@
+import io
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from xmltodict3 import XmlTextToDict, XmlEventsToColumns, Column
+from xmltodict3 import PullTransformers, IntegerTransformer, BoolTransformer
+from xmltodict3 import TransformerException
+
+
+XML_TEXT = '<catalog><product id="1"><price type="integer">10</price>' \
+           '<name>apple</name><flag type="bool">true</flag></product>' \
+           '<product id="2"><price type="integer">20</price>' \
+           '<count>4</count>' \
+           '<tag>a</tag><tag>b</tag></product>' \
+           '<product id="3"><price type="integer"/>' \
+           '<name lang="en">pear</name><flag type="bool">false</flag>' \
+           '</product></catalog>'
+
+
+def get_columns(xml_text=XML_TEXT, removing_types=True, ignore_errors=True):
+    xml_text_to_dict = XmlTextToDict(xml_text)
+    integer_transformer = IntegerTransformer()
+    integer_transformer.set_tags('count')
+    pull_transformers = PullTransformers(integer_transformer, BoolTransformer)
+    pull_transformers.set_removing_types(removing_types)
+    pull_transformers.set_ignore_errors(ignore_errors)
+    xml_text_to_dict.use_pull_transformers(pull_transformers)
+    return xml_text_to_dict.get_columns('catalog/product')
+
+
+def test_get_columns():
+    columns = get_columns()
+    assert list(columns) == [
+        '@id', 'price/#text', 'name/#text', 'flag/#text', 'count/#text',
+        'tag/#text', 'name/@lang']
+    assert all(len(column) == 3 for column in columns.values())
+    assert columns['@id'].to_list() == ['1', '2', '3']
+    assert columns['price/#text'].values.typecode == 'q'
+    assert columns['price/#text'].to_list() == [10, 20, None]
+    assert columns['flag/#text'].to_list() == [True, None, False]
+    assert columns['name/#text'].to_list() == ['apple', None, 'pear']
+    assert columns['name/@lang'].to_list() == [None, None, 'en']
+    assert columns['tag/#text'].to_list() == [None, ['a', 'b'], None]
+    assert columns['count/#text'].values.typecode == 'q'
+    assert columns['count/#text'].to_list() == [None, 4, None]
+
+
+def test_get_columns_with_transformer_errors():
+    with pytest.raises(TransformerException):
+        get_columns(ignore_errors=False)
+    xml_text_to_dict = XmlTextToDict(XML_TEXT)
+    xml_text_to_dict.use_pull_transformers(
+        PullTransformers(IntegerTransformer))
+    with pytest.raises(TransformerException):
+        xml_text_to_dict.get_dict()
+
+
+def test_get_columns_with_types():
+    columns = get_columns(removing_types=False)
+    assert columns['price/@type'].to_list() == ['integer'] * 3
+
+
+def test_column_turns_into_list():
+    column = Column('integer')
+    column.append(0, 1)
+    column.append(2, 'x')
+    column.append(3, 2 ** 70)
+    assert column.to_list() == [1, None, 'x', 2 ** 70]
+
+
+def test_column_with_repeated_missing_values():
+    column = Column('integer')
+    column.append(0, None)
+    column.append(0, 1)
+    column.append(1, 2)
+    column.append(1, None)
+    column.append(2, None)
+    assert column.to_list() == [[None, 1], [2, None], None]
+    assert column.mask.tolist() == [1, 1, 0]
+
+
+def test_events_to_columns():
+    xml_events_to_columns = XmlEventsToColumns('root/item')
+    xml_text = '<root><item>1</item><item>2</item><other>3</other></root>'
+    events = ElementTree.iterparse(
+        io.StringIO(xml_text), events=('start', 'end'))
+    assert list(xml_events_to_columns.process_events(events)) == []
+    columns = xml_events_to_columns.get_columns()
+    assert columns['#text'].to_list() == ['1', '2']
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip('numpy')
+    columns = get_columns()
+    price = columns['price/#text'].to_numpy()
+    assert price.dtype == numpy.int64
+    assert price.mask.tolist() == [False, False, True]
+    assert columns['flag/#text'].to_numpy().dtype == numpy.bool_
+    assert columns['@id'].to_numpy().tolist() == ['1', '2', '3']
+
+
+def test_get_columns_with_node_data_hooks():
+    class FrenchBoolTransformer(BoolTransformer):
+        def check_node_data(self, node_data):
+            return node_data.get('@lang') != 'fr'
+
+    xml_text_to_dict = XmlTextToDict(
+        '<root><item><flag type="bool">true</flag></item>'
+        '<item><flag type="bool" lang="fr">x</flag></item></root>')
+    xml_text_to_dict.use_pull_transformers(
+        PullTransformers(FrenchBoolTransformer))
+    columns = xml_text_to_dict.get_columns('root/item')
+    assert columns['flag/#text'].to_list() == [True, 'x']
+
+
+def test_get_columns_with_overridden_value_method():
+    class HexIntegerTransformer(IntegerTransformer):
+        def get_text_value_or_raise_exception(self, text):
+            return int(text, 16)
+
+    xml_text_to_dict = XmlTextToDict(
+        '<root><item><n type="integer">11</n></item>'
+        '<item><n type="integer">10</n></item></root>')
+    xml_text_to_dict.use_pull_transformers(
+        PullTransformers(HexIntegerTransformer))
+    columns = xml_text_to_dict.get_columns('root/item')
+    assert columns['n/#text'].to_list() == [17, 16]
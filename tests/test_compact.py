@@ -0,0 +1,73 @@
+import pickle
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from xmltodict3 import XmlToDict, XmlToCompactDict, CompactNode
+from xmltodict3 import PullTransformers, IntegerTransformer, BoolTransformer
+
+
+XML_TEXT = '<root a="1"><node type="integer">1</node>' \
+           '<node type="integer">2</node><name>test</name>' \
+           '<item><flag type="bool">true</flag></item>' \
+           '<empty/><text x="y">value</text></root>'
+
+
+def get_pull_transformers(batch_mode=False):
+    pull_transformers = PullTransformers(
+        IntegerTransformer, BoolTransformer)
+    pull_transformers.set_removing_types(True)
+    pull_transformers.set_batch_mode(batch_mode)
+    return pull_transformers
+
+
+def test_compact_dict_equals_dict():
+    node = ElementTree.fromstring(XML_TEXT)
+    compact = XmlToCompactDict(node).get_dict()
+    assert isinstance(compact, CompactNode)
+    assert isinstance(compact['root'], CompactNode)
+    assert compact == XmlToDict(node).get_dict()
+    assert compact.to_dict() == XmlToDict(node).get_dict()
+    assert type(compact.to_dict()['root']['text']) is dict
+
+
+@pytest.mark.parametrize('batch_mode', [False, True])
+def test_compact_dict_with_transformers(batch_mode):
+    node = ElementTree.fromstring(XML_TEXT)
+    xml_to_dict = XmlToDict(node)
+    xml_to_dict.use_pull_transformers(get_pull_transformers())
+    compact_xml_to_dict = XmlToCompactDict(node)
+    compact_xml_to_dict.use_pull_transformers(
+        get_pull_transformers(batch_mode))
+    compact = compact_xml_to_dict.get_dict()
+    assert compact.to_dict() == xml_to_dict.get_dict()
+    assert compact['root']['node'] == [1, 2]
+    assert compact['root']['item']['flag'] is True
+
+
+def test_compact_node_mapping():
+    compact_node = CompactNode([('a', 1), ('b', [CompactNode([('c', 2)])])])
+    assert list(compact_node) == ['a', 'b']
+    assert len(compact_node) == 2
+    assert 'a' in compact_node and 'c' not in compact_node
+    assert compact_node.get('c') is None
+    assert compact_node['b'][0]['c'] == 2
+    compact_node['a'] = 3
+    assert compact_node['a'] == 3
+    with pytest.raises(KeyError):
+        compact_node['c'] = 1
+    assert repr(compact_node) == "CompactNode({'a': 3, 'b': [{'c': 2}]})"
+
+
+def test_compact_node_shares_keys():
+    first = CompactNode([('a', 1), ('b', 2)])
+    second = CompactNode([('a', 3), ('b', 4)])
+    assert first._shape is second._shape
+    assert not hasattr(first, '__dict__')
+
+
+def test_compact_node_pickle():
+    compact_node = CompactNode([('a', 1), ('b', CompactNode([('c', 2)]))])
+    loaded_node = pickle.loads(pickle.dumps(compact_node))
+    assert loaded_node == compact_node
+    assert loaded_node._shape is compact_node._shape
@@ -0,0 +1,121 @@
+import xml.etree.ElementTree as ElementTree
+
+from xmltodict3 import XmlToDict, XmlTextToDict, ConversionPlans
+from xmltodict3 import TagNormalizer
+import xmltodict3.transformers as transformers
+
+
+RECORDS_TEXT = """
+<catalog>
+    <product id="1">
+        <name>a</name>
+        <price type="integer">1</price>
+        <tag>x</tag>
+        <tag>y</tag>
+        <size><width>1</width><height>2</height></size>
+    </product>
+    <product id="2">
+        <name>b</name>
+        <price type="integer">2</price>
+        <tag>z</tag>
+        <size><width>3</width><height>4</height></size>
+    </product>
+    <product id="3">
+        <name>c</name>
+        <price type="integer">3</price>
+        <tag>x</tag>
+        <tag>y</tag>
+        <size><width>5</width><height>6</height><depth>7</depth></size>
+    </product>
+    <product id="4">
+        <name>d</name>
+        <price type="integer">4</price>
+        <tag>x</tag>
+        <tag>y</tag>
+        <size unit="cm"><width>5</width><height>6</height></size>
+    </product>
+    <product>
+        <name><first>e</first></name>
+        <price type="integer">5</price>
+        <tag>x</tag>
+        <tag>y</tag>
+        <size><width>5</width><height>6</height></size>
+    </product>
+    <product><a>1</a><b>2</b><a>3</a></product>
+</catalog>
+"""
+
+
+def get_items(conversion_plans=None):
+    integer_transformer = transformers.IntegerTransformer()
+    integer_transformer.set_tags('width')
+    pull_transformers = transformers.PullTransformers(integer_transformer)
+    pull_transformers.set_removing_types(True)
+    xml_to_dict = XmlTextToDict(RECORDS_TEXT)
+    xml_to_dict.use_pull_transformers(pull_transformers)
+    if conversion_plans is not None:
+        xml_to_dict.use_conversion_plans(conversion_plans)
+    return list(xml_to_dict.iter_items('catalog/product'))
+
+
+def test_plans_give_same_result():
+    conversion_plans = ConversionPlans()
+    result = get_items(conversion_plans)
+    expected_result = get_items()
+    assert result == expected_result, result
+    assert result[2]['product']['size'] == \
+        {'width': 5, 'height': '6', 'depth': '7'}
+    assert result[5]['product']['a'] == ['1', '3']
+
+
+def test_plans_are_reused():
+    conversion_plans = ConversionPlans()
+    text = "<root><node><a attr='1'>1</a><b>2</b></node>" \
+           "<node><a attr='2'>3</a><b>4</b></node></root>"
+    result = list()
+    for node in ElementTree.fromstring(text):
+        xml_to_dict = XmlToDict(node)
+        xml_to_dict.use_conversion_plans(conversion_plans)
+        result.append(xml_to_dict.get_dict())
+    expected_result = [
+        {'node': {'a': {'@attr': '1', '#text': '1'}, 'b': '2'}},
+        {'node': {'a': {'@attr': '2', '#text': '3'}, 'b': '4'}}]
+    assert result == expected_result, result
+    assert len(conversion_plans.plans) == 1
+
+
+def test_plans_cache_size():
+    conversion_plans = ConversionPlans(max_size=2)
+    text = "<root><a>1</a><b>2</b><c>3</c><a>4</a></root>"
+    for node in ElementTree.fromstring(text):
+        xml_to_dict = XmlToDict(node)
+        xml_to_dict.use_conversion_plans(conversion_plans)
+        xml_to_dict.get_dict()
+    tags = [key[4] for key in conversion_plans.plans]
+    assert tags == ['c', 'a'], tags
+
+
+def test_plans_follow_changes_of_options():
+    conversion_plans = ConversionPlans()
+    pull_transformers = transformers.PullTransformers()
+    tag_normalizer = TagNormalizer()
+    node = ElementTree.fromstring(
+        "<root><b type='bool'>true</b><c:d xmlns:c='http://c.com'>1</c:d>"
+        "</root>")
+    xml_to_dict = XmlToDict(node)
+    xml_to_dict.use_pull_transformers(pull_transformers)
+    xml_to_dict.use_tag_normalizer(tag_normalizer)
+    xml_to_dict.use_conversion_plans(conversion_plans)
+    assert xml_to_dict.get_dict() == {'root': {
+        'b': {'@type': 'bool', '#text': 'true'}, '{http://c.com}d': '1'}}
+
+    pull_transformers.add_transformers(transformers.BoolTransformer)
+    pull_transformers.set_removing_types(True)
+    tag_normalizer.set_namespaces({'http://c.com': 'c'})
+    assert xml_to_dict.get_dict() == {'root': {'b': True, 'c:d': '1'}}
+    assert len(conversion_plans.plans) == 2
+
+    pull_transformers.add_transformers(transformers.IntegerTransformer)
+    assert xml_to_dict.get_dict() == {'root': {'b': True, 'c:d': '1'}}
+    pull_transformers.set_tags('integer', 'c:d')
+    assert xml_to_dict.get_dict() == {'root': {'b': True, 'c:d': 1}}
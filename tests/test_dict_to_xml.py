@@ -0,0 +1,81 @@
+import datetime
+import io
+
+from xmltodict3 import DictToXml, XmlTextToDict, XmlToCompactDict
+from xmltodict3 import PullTransformers, DefaultTransformerList
+
+
+XML_TEXT = '<root xmlns:b="http://b.com/ns" a="1 &amp; &quot;2&quot;">' \
+           '<node type="integer">1</node><node type="integer">2</node>' \
+           '<b:name b:c="2">a &lt; b</b:name>' \
+           '<date type="datetime">2020-02-12T20:20:46Z</date>' \
+           '<item><flag type="bool">false</flag><empty/></item>' \
+           '<text x="y">value</text></root>'
+
+
+def get_pull_transformers():
+    pull_transformers = PullTransformers(*DefaultTransformerList)
+    pull_transformers.set_removing_types(True)
+    return pull_transformers
+
+
+def get_dict(xml_text, pull_transformers=None):
+    xml_text_to_dict = XmlTextToDict(xml_text)
+    xml_text_to_dict.use_pull_transformers(pull_transformers)
+    return xml_text_to_dict.get_dict()
+
+
+def test_round_trip():
+    data = get_dict(XML_TEXT)
+    assert get_dict(DictToXml(data).get_xml()) == data
+
+
+def test_round_trip_with_empty_strings():
+    data = {'root': {'a': '', 'b': None, 'c': {'@id': '1', '#text': ''},
+                     'd': ['', 'x']}}
+    assert get_dict(DictToXml(data).get_xml()) == data
+
+
+def test_round_trip_with_reverse_transformers():
+    pull_transformers = get_pull_transformers()
+    data = get_dict(XML_TEXT, pull_transformers)
+    assert data['root']['date'] == datetime.datetime(2020, 2, 12, 20, 20, 46)
+    dict_to_xml = DictToXml(data)
+    dict_to_xml.use_pull_transformers(pull_transformers)
+    xml_text = dict_to_xml.get_xml()
+    assert '<node type="integer">1</node>' in xml_text
+    assert '<flag type="bool">false</flag>' in xml_text
+    assert get_dict(xml_text, pull_transformers) == data
+
+
+def test_get_xml():
+    data = {'root': {
+        '@id': 1, 'a': ['x', None, {'@k': 'v', '#text': 'y'}],
+        'b': {'c': True}, '{http://a.com}d': {'{http://a.com}e': '1'}}}
+    assert DictToXml(data).get_xml() == \
+        '<root id="1"><a>x</a><a/><a k="v">y</a><b><c>True</c></b>' \
+        '<ns0:d xmlns:ns0="http://a.com"><ns0:e>1</ns0:e></ns0:d></root>'
+
+
+def test_write():
+    data = {'root': {'item': [str(index) for index in range(100)]}}
+    dict_to_xml = DictToXml(data, xml_declaration=True)
+    dict_to_xml.buffer_size = 50
+    text_file = io.StringIO()
+    dict_to_xml.write(text_file)
+    assert text_file.getvalue().startswith(
+        '<?xml version="1.0" encoding="utf-8"?><root><item>0</item>')
+    binary_file = io.BytesIO()
+    dict_to_xml.write(binary_file, encoding='windows-1251')
+    assert get_dict(binary_file.getvalue()) == data
+
+
+def test_deep_and_compact_data():
+    data = {'node': None}
+    for _ in range(5000):
+        data = {'node': data}
+    xml_text = DictToXml(data).get_xml()
+    assert xml_text.startswith('<node><node>')
+    compact_data = XmlToCompactDict(
+        XmlTextToDict(XML_TEXT).get_xml_to_dict_node().node).get_dict()
+    assert get_dict(DictToXml(compact_data).get_xml()) == get_dict(XML_TEXT)
@@ -0,0 +1,53 @@
+import io
+import json
+
+from xmltodict3 import export_jsonl, write_jsonl
+from xmltodict3 import PullTransformers, DefaultTransformerList
+
+
+XML_TEXT = '<catalog>' + ''.join(
+    '<product id="{0}"><price type="integer">{0}</price>'
+    '<date type="datetime">2020-02-12T20:20:46Z</date>'
+    '<name>тест {0}</name></product>'.format(index)
+    for index in range(10)) + '</catalog>'
+
+
+def get_expected_items():
+    return [{'product': {'price': index, 'date': '2020-02-12T20:20:46',
+                         'name': 'тест {0}'.format(index),
+                         '@id': str(index)}}
+            for index in range(10)]
+
+
+def write_xml_file(tmpdir):
+    file_path = tmpdir.join('catalog.xml')
+    file_path.write_text(XML_TEXT, encoding='utf-8')
+    return str(file_path)
+
+
+def read_jsonl(data):
+    return [json.loads(line) for line in data.decode('utf-8').splitlines()]
+
+
+def test_export_jsonl(tmpdir):
+    file_path = write_xml_file(tmpdir)
+    output_path = str(tmpdir.join('catalog.jsonl'))
+    pull_transformers = PullTransformers(*DefaultTransformerList)
+    pull_transformers.set_removing_types(True)
+    for workers in (0, 2):
+        count = export_jsonl(
+            file_path, output_path, 'catalog/product',
+            pull_transformers=pull_transformers, workers=workers,
+            batch_size=3)
+        assert count == 10
+        with open(output_path, 'rb') as output_file:
+            assert read_jsonl(output_file.read()) == get_expected_items()
+
+
+def test_write_jsonl_with_encoder():
+    output_file = io.BytesIO()
+    count = write_jsonl(
+        [{'a': 1}, {'a': 2}], output_file,
+        encoder=lambda item: json.dumps(item).encode('ascii'))
+    assert count == 2
+    assert output_file.getvalue() == b'{"a": 1}\n{"a": 2}\n'
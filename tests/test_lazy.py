@@ -0,0 +1,54 @@
+import xml.etree.ElementTree as ElementTree
+
+from xmltodict3 import XmlToDict, XmlTextToDict, LazyNode
+from xmltodict3 import PullTransformers, IntegerTransformer
+
+
+XML_TEXT = '<root a="1"><node type="integer">1</node>' \
+           '<node type="integer">2</node><name>test</name>' \
+           '<item b="2"><value type="integer">3</value></item>' \
+           '<item><value>4</value><value>5</value></item>' \
+           '<empty/></root>'
+
+
+def get_pull_transformers():
+    pull_transformers = PullTransformers(IntegerTransformer)
+    pull_transformers.set_removing_types(True)
+    return pull_transformers
+
+
+def test_lazy_dict_equals_dict():
+    node = ElementTree.fromstring(XML_TEXT)
+    xml_to_dict = XmlToDict(node)
+    xml_to_dict.use_pull_transformers(get_pull_transformers())
+    lazy_dict = xml_to_dict.get_lazy_dict()
+    assert isinstance(lazy_dict['root'], LazyNode)
+    assert lazy_dict == xml_to_dict.get_dict()
+    assert lazy_dict['root'].to_dict() == xml_to_dict.get_dict()['root']
+
+
+def test_lazy_dict_access():
+    xml_text_to_dict = XmlTextToDict(XML_TEXT)
+    xml_text_to_dict.use_pull_transformers(get_pull_transformers())
+    root = xml_text_to_dict.get_lazy_dict()['root']
+    assert list(root) == ['node', 'name', 'item', 'empty', '@a']
+    assert len(root) == 5
+    assert root['node'] == [1, 2]
+    assert root['@a'] == '1'
+    assert root['empty'] is None
+    assert root['item'][0]['value'] == 3
+    assert root['item'][1]['value'] == ['4', '5']
+    assert 'missing' not in root
+    assert root.get('missing') is None
+
+
+def test_lazy_dict_caches_values():
+    root = XmlTextToDict(XML_TEXT).get_lazy_dict()['root']
+    assert root._children is None
+    assert root['item'] is root['item']
+    assert list(root._values) == ['item']
+
+
+def test_lazy_dict_of_single_node():
+    assert XmlTextToDict('<root a="1">text</root>').get_lazy_dict() == \
+        {'root': {'@a': '1', '#text': 'text'}}
@@ -0,0 +1,85 @@
+import pytest
+
+from xmltodict3 import XmlTextToDict, XmlFileToDict, PathSelector
+from xmltodict3 import PullTransformers, IntegerTransformer, TagNormalizer
+
+
+XML_TEXT = '<catalog version="1">' \
+           '<product id="1"><name>apple</name><price>10</price></product>' \
+           '<product id="2"><name>orange</name><price>20</price></product>' \
+           '<info><name>shop</name><address>street</address></info>' \
+           '</catalog>'
+
+
+def get_dict(paths, xml_text=XML_TEXT):
+    xml_text_to_dict = XmlTextToDict(xml_text)
+    xml_text_to_dict.use_path_selector(PathSelector(paths))
+    return xml_text_to_dict.get_dict()
+
+
+def test_split_path():
+    assert PathSelector.split_path('/a/b') == [('a', False), ('b', False)]
+    assert PathSelector.split_path('//a/*') == [('a', True), ('*', False)]
+    assert PathSelector.split_path('{http://a.com/b}a//b') == \
+        [('{http://a.com/b}a', False), ('b', True)]
+    with pytest.raises(ValueError):
+        PathSelector.split_path('/')
+
+
+def test_select_path():
+    assert get_dict('catalog/product/name') == {
+        'catalog': {'product': [{'name': 'apple', '@id': '1'},
+                                {'name': 'orange', '@id': '2'}],
+                    '@version': '1'}}
+
+
+def test_select_subtree():
+    assert get_dict(['catalog/info', '/catalog/product/price']) == {
+        'catalog': {'product': [{'price': '10', '@id': '1'},
+                                {'price': '20', '@id': '2'}],
+                    'info': {'name': 'shop', 'address': 'street'},
+                    '@version': '1'}}
+
+
+def test_select_any_depth():
+    assert get_dict('//name') == {
+        'catalog': {'product': [{'name': 'apple', '@id': '1'},
+                                {'name': 'orange', '@id': '2'}],
+                    'info': {'name': 'shop'},
+                    '@version': '1'}}
+    assert get_dict('catalog/*/address') == {
+        'catalog': {'info': {'address': 'street'}, '@version': '1'}}
+
+
+def test_select_root_and_nothing():
+    assert get_dict('catalog') == XmlTextToDict(XML_TEXT).get_dict()
+    assert get_dict('shop/product') == {
+        'catalog': {'@version': '1', '#text': None}}
+
+
+def test_select_skips_conversion():
+    xml_text = '<root><a type="integer">1</a><b type="integer">x</b></root>'
+    xml_text_to_dict = XmlTextToDict(xml_text)
+    pull_transformers = PullTransformers(IntegerTransformer)
+    pull_transformers.set_removing_types(True)
+    xml_text_to_dict.use_pull_transformers(pull_transformers)
+    xml_text_to_dict.use_path_selector(PathSelector('root/a'))
+    assert xml_text_to_dict.get_dict() == {'root': {'a': 1}}
+
+
+def test_select_with_namespaces():
+    xml_text = '<root xmlns="http://a.com/ns"><a>1</a><b>2</b></root>'
+    xml_text_to_dict = XmlTextToDict(xml_text)
+    xml_text_to_dict.use_tag_normalizer(
+        TagNormalizer(namespaces={'http://a.com/ns': 'ns'}))
+    xml_text_to_dict.use_path_selector(PathSelector('ns:root/ns:b'))
+    assert xml_text_to_dict.get_dict() == {'ns:root': {'ns:b': '2'}}
+
+
+def test_select_in_file(tmpdir):
+    file_path = tmpdir.join('catalog.xml')
+    file_path.write(XML_TEXT)
+    xml_file_to_dict = XmlFileToDict(str(file_path))
+    xml_file_to_dict.use_path_selector(PathSelector('catalog/info/name'))
+    assert xml_file_to_dict.get_dict() == {
+        'catalog': {'info': {'name': 'shop'}, '@version': '1'}}
@@ -0,0 +1,78 @@
+import pytest
+
+from xmltodict3 import XmlTextToDict, ConversionStats
+import xmltodict3.transformers as transformers
+
+
+TEXT = "<root><node><value type='integer'>1</value>" \
+       "<flag type='bool'>true</flag></node>" \
+       "<node><value type='integer'>2</value><name>a</name></node></root>"
+
+
+def get_pull_transformers(ignore_errors: bool = False):
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer, transformers.BoolTransformer)
+    pull_transformers.set_removing_types(True)
+    pull_transformers.set_ignore_errors(ignore_errors)
+    return pull_transformers
+
+
+def test_get_dict_with_stats():
+    stats = ConversionStats()
+    xml_to_dict = XmlTextToDict(TEXT)
+    xml_to_dict.use_pull_transformers(get_pull_transformers())
+    xml_to_dict.use_stats(stats)
+    result = xml_to_dict.get_dict()
+    expected_result = {'root': {'node': [
+        {'value': 1, 'flag': True}, {'value': 2, 'name': 'a'}]}}
+    assert result == expected_result, result
+    assert stats.node_count == 7
+    assert stats.max_depth == 3
+    assert stats.parse_time > 0
+    assert stats.conversion_time > 0
+    transformer_stats = stats.as_dict()['transformers']
+    assert transformer_stats['integer']['calls'] == 2
+    assert transformer_stats['bool']['calls'] == 1
+    assert transformer_stats['integer']['errors'] == 0
+
+
+def test_iter_items_with_stats():
+    calls = list()
+    stats = ConversionStats(callback=calls.append)
+    xml_to_dict = XmlTextToDict(TEXT)
+    xml_to_dict.use_stats(stats)
+    result = list(xml_to_dict.iter_items('root/node'))
+    assert len(result) == 2
+    assert stats.node_count == 6
+    assert stats.max_depth == 3
+    assert stats.parse_time > 0
+    assert calls == [stats, stats]
+    assert stats.transformers == {}
+
+
+def test_stats_with_transformer_errors():
+    stats = ConversionStats()
+    text = "<root><value type='integer'>a</value></root>"
+    xml_to_dict = XmlTextToDict(text)
+    xml_to_dict.use_pull_transformers(get_pull_transformers())
+    xml_to_dict.use_stats(stats)
+    with pytest.raises(transformers.TransformerException):
+        xml_to_dict.get_dict()
+    assert stats.transformers['integer'].errors == 1
+    assert stats.transformers['integer'].calls == 1
+
+
+def test_stats_follow_changes_of_pull_transformers():
+    stats = ConversionStats()
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer)
+    xml_to_dict = XmlTextToDict("<root><b type='bool'>true</b></root>")
+    xml_to_dict.use_pull_transformers(pull_transformers)
+    xml_to_dict.use_stats(stats)
+    assert xml_to_dict.get_dict() == {
+        'root': {'b': {'@type': 'bool', '#text': 'true'}}}
+
+    pull_transformers.add_transformers(transformers.BoolTransformer())
+    pull_transformers.set_removing_types(True)
+    assert xml_to_dict.get_dict() == {'root': {'b': True}}
+    assert stats.transformers['bool'].calls == 1
@@ -0,0 +1,64 @@
+import xml.etree.ElementTree as ElementTree
+
+from xmltodict3 import XmlToDict, XmlTextToDict, TagNormalizer
+
+
+NAMESPACE_TEXT = '<root xmlns="http://test.com/test_shema" ' \
+                 'xmlns:xs="http://www.w3.org/2001/XMLSchema">' \
+                 '<xs:node>1</xs:node><node>2</node></root>'
+
+
+def test_normalize_tag():
+    tag_normalizer = TagNormalizer()
+    assert tag_normalizer.get_tag('root') == 'root'
+    assert tag_normalizer.get_tag('{http://a.com}root') == \
+        '{http://a.com}root'
+
+
+def test_normalize_tag_with_ignore_namespace():
+    tag_normalizer = TagNormalizer(ignore_namespace=True)
+    assert tag_normalizer.get_tag('root') == 'root'
+    assert tag_normalizer.get_tag('{http://a.com}root') == 'root'
+    assert tag_normalizer.tags == {
+        'root': 'root', '{http://a.com}root': 'root'}
+
+
+def test_normalize_tag_with_max_size():
+    tag_normalizer = TagNormalizer(max_size=2)
+    for tag in ('a', 'b', 'c', 'a'):
+        assert tag_normalizer.get_tag(tag) == tag
+    assert len(tag_normalizer.tags) == 2
+
+
+def test_change_tag_normalizer():
+    tag_normalizer = TagNormalizer()
+    assert tag_normalizer.get_tag('{http://a.com}root') == \
+        '{http://a.com}root'
+    tag_normalizer.set_namespaces({'http://a.com': 'a'})
+    assert tag_normalizer.get_tag('{http://a.com}root') == 'a:root'
+    tag_normalizer.set_namespaces({})
+    tag_normalizer.set_ignore_namespace(True)
+    assert tag_normalizer.get_tag('{http://a.com}root') == 'root'
+    assert tag_normalizer.version == 3
+
+
+def test_xml_to_dict_with_namespaces():
+    tag_normalizer = TagNormalizer(namespaces={
+        'http://www.w3.org/2001/XMLSchema': 'xs',
+        'http://test.com/test_shema': ''})
+    xml_to_dict = XmlToDict(ElementTree.fromstring(NAMESPACE_TEXT))
+    xml_to_dict.use_tag_normalizer(tag_normalizer)
+    expected_result = {'root': {'xs:node': '1', 'node': '2'}}
+    result = xml_to_dict.get_dict()
+    assert result == expected_result, result
+
+
+def test_iter_items_with_namespaces():
+    tag_normalizer = TagNormalizer(
+        ignore_namespace=True,
+        namespaces={'http://www.w3.org/2001/XMLSchema': 'xs'})
+    xml_to_dict = XmlTextToDict(NAMESPACE_TEXT)
+    xml_to_dict.use_tag_normalizer(tag_normalizer)
+    expected_result = [{'xs:node': '1'}]
+    result = list(xml_to_dict.iter_items('root/xs:node'))
+    assert result == expected_result, result
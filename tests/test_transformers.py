@@ -147,6 +147,78 @@ def test_datetime_transformation_custom_datetime_format():
     assert result == expected_result, result
 
 
+def test_datetime_transformation_several_datetime_formats():
+    transformer = transformers.DateTimeTransformer()
+    transformer.set_datetime_format("%Y-%m-%d %H:%M:%S", "%d.%m.%Y")
+    result = transformer.get_values(['2020-02-12 20:20:46', '12.02.2020'])
+    expected_result = [datetime.datetime(2020, 2, 12, 20, 20, 46),
+                       datetime.datetime(2020, 2, 12)]
+    assert result == expected_result, result
+    with pytest.raises(transformers.TransformerException):
+        transformer.get_values(['2020-02-12T20:20:46Z'])
+
+
+def test_datetime_transformation_default_format_fallback():
+    transformer = transformers.DateTimeTransformer()
+    node_data = {'@type': 'datetime', '#text': '2020-2-3t20:20:46z'}
+    expected_result = datetime.datetime(2020, 2, 3, 20, 20, 46)
+    result = transformer.get_value(node_data)
+    assert result == expected_result, result
+    with pytest.raises(transformers.TransformerException):
+        transformer.get_value({'@type': 'datetime',
+                               '#text': '2020-13-03T20:20:46Z'})
+
+
+def test_datetime_transformation_timezone_aware():
+    transformer = transformers.DateTimeTransformer()
+    transformer.set_timezone_aware(True)
+    node_data = {'@type': 'datetime', '#text': '2020-02-12T20:20:46Z'}
+    expected_result = datetime.datetime(
+        2020, 2, 12, 20, 20, 46, tzinfo=datetime.timezone.utc)
+    result = transformer.get_value(node_data)
+    assert result == expected_result, result
+    assert result.tzinfo is not None
+
+
+def test_datetime_transformation_iso_format():
+    transformer = transformers.DateTimeTransformer()
+    transformer.set_iso_format(True)
+    utc = datetime.timezone.utc
+    cases = [
+        ('2020-02-12T20:20:46Z',
+         datetime.datetime(2020, 2, 12, 20, 20, 46, tzinfo=utc)),
+        ('2020-02-12', datetime.datetime(2020, 2, 12)),
+        ('2020-02-12 20:20', datetime.datetime(2020, 2, 12, 20, 20)),
+        ('2020-02-12T20:20:46.5Z',
+         datetime.datetime(2020, 2, 12, 20, 20, 46, 500000, tzinfo=utc)),
+        ('2020-02-12T20:20:46+0300',
+         datetime.datetime(2020, 2, 12, 17, 20, 46, tzinfo=utc)),
+        ('2020-02-12T20:20:46-01:30',
+         datetime.datetime(2020, 2, 12, 21, 50, 46, tzinfo=utc)),
+    ]
+    for value, expected_result in cases:
+        result = transformer.get_value({'#text': value})
+        assert result == expected_result, (value, result)
+        assert (result.tzinfo is None) == (expected_result.tzinfo is None)
+    with pytest.raises(transformers.TransformerException):
+        transformer.get_value({'#text': '12.02.2020'})
+    transformer.set_datetime_format('%d.%m.%YZ')
+    assert transformer.get_value({'#text': '12.02.2020Z'}) == \
+        datetime.datetime(2020, 2, 12, tzinfo=utc)
+    with pytest.raises(ValueError):
+        transformer.set_datetime_format()
+
+
+def test_datetime_transformation_memo():
+    transformer = transformers.DateTimeTransformer()
+    transformer.memo_size = 2
+    values = ['2020-02-12T20:20:46Z', '2020-02-12T20:20:46Z',
+              '2020-02-13T20:20:46Z', '2020-02-14T20:20:46Z']
+    result = transformer.get_values(values)
+    assert result[0] is result[1]
+    assert len(transformer.memo) <= 2
+
+
 def test_pull_transformers_no_transformer():
     transformer_list = transformers.DefaultTransformerList
     pull_transformers = transformers.PullTransformers(*transformer_list)
@@ -217,3 +289,174 @@ def test_pull_transformers_instance():
     result = pull_transformers.transform_node(node_data)
 
     assert result == expected_result, result
+
+
+def test_batch_transformation():
+    transformer = transformers.IntegerTransformer(removing_types=True)
+    node_data_list = [{'@type': 'integer', '#text': '1'},
+                      {'@type': 'bool', '#text': 'true'},
+                      {'@type': 'integer', '#text': '2', '@attr': 'a'}]
+    transformer.transform_nodes(node_data_list)
+    expected_result = [{'#text': 1},
+                       {'@type': 'bool', '#text': 'true'},
+                       {'#text': 2, '@attr': 'a'}]
+    assert node_data_list == expected_result, node_data_list
+
+
+def test_batch_transformation_with_ignore_errors():
+    transformer = transformers.BoolTransformer(ignore_errors=True)
+    node_data_list = [{'@type': 'bool', '#text': 'True'},
+                      {'@type': 'bool', '#text': None}]
+    transformer.transform_nodes(node_data_list)
+    expected_result = [{'@type': 'bool', '#text': True},
+                       {'@type': 'bool', '#text': None}]
+    assert node_data_list == expected_result, node_data_list
+
+
+def test_pull_transformers_batch_transformation():
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer, transformers.BoolTransformer)
+    node_data_list = [{'@type': 'integer', '#text': '1'},
+                      {'@type': 'bool', '#text': 'false'},
+                      {'@type': 'float', '#text': '1.5'}]
+    pull_transformers.transform_nodes(node_data_list)
+    expected_result = [{'@type': 'integer', '#text': 1},
+                       {'@type': 'bool', '#text': False},
+                       {'@type': 'float', '#text': '1.5'}]
+    assert node_data_list == expected_result, node_data_list
+
+
+class HexIntegerTransformer(transformers.IntegerTransformer):
+    def get_text_value_or_raise_exception(self, text):
+        return int(text, 16)
+
+
+def test_batch_transformation_with_overridden_value_method():
+    transformer = HexIntegerTransformer(removing_types=True)
+    assert not transformer.vectorized
+    assert transformers.IntegerTransformer().vectorized
+    node_data_list = [{'@type': 'integer', '#text': '11'},
+                      {'@type': 'integer', '#text': '10'}]
+    transformer.transform_nodes(node_data_list)
+    assert node_data_list == [{'#text': 17}, {'#text': 16}], node_data_list
+    assert transformer.get_leaf_values(
+        [({'type': 'integer'}, '11'), ({}, '10')]) == [17, 16]
+
+
+class CountingIntegerTransformer(transformers.IntegerTransformer):
+    calls = 0
+
+    def get_value_or_raise_exception(self, node_data):
+        self.calls += 1
+        return super().get_value_or_raise_exception(node_data)
+
+    def get_values_or_raise_exception(self, values):
+        self.calls += len(values)
+        return super().get_values_or_raise_exception(values)
+
+
+def test_pull_transformers_memo():
+    transformer = CountingIntegerTransformer(removing_types=True)
+    pull_transformers = transformers.PullTransformers(transformer)
+    pull_transformers.set_memo_size(2)
+    result = [
+        pull_transformers.transform_node(
+            {'@type': 'integer', '#text': value})
+        for value in ('1', '1', '2', '1', '3', '2')]
+    expected_result = [{'#text': int(value)}
+                       for value in ('1', '1', '2', '1', '3', '2')]
+    assert result == expected_result, result
+    assert transformer.calls == 4
+    assert list(pull_transformers.memo) == [
+        ('integer', '3'), ('integer', '2')]
+
+
+def test_pull_transformers_memo_with_errors():
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer(ignore_errors=True))
+    pull_transformers.set_memo_size(10)
+    node_data = {'@type': 'integer', '#text': 'a'}
+    result = pull_transformers.transform_node(node_data)
+    assert result == {'@type': 'integer', '#text': 'a'}, result
+    assert len(pull_transformers.memo) == 0
+
+
+def test_pull_transformers_memo_with_batch_transformation():
+    transformer = CountingIntegerTransformer()
+    pull_transformers = transformers.PullTransformers(transformer)
+    pull_transformers.set_memo_size(10)
+    for _ in range(2):
+        node_data_list = [{'@type': 'integer', '#text': value}
+                          for value in ('1', '2', '1')]
+        pull_transformers.transform_nodes(node_data_list)
+        expected_result = [{'@type': 'integer', '#text': value}
+                           for value in (1, 2, 1)]
+        assert node_data_list == expected_result, node_data_list
+    assert transformer.calls == 3
+
+
+def test_pull_transformers_intern_values():
+    pull_transformers = transformers.PullTransformers()
+    pull_transformers.set_intern_values(True)
+    first_text = ''.join(['val', 'ue'])
+    second_text = ''.join(['valu', 'e'])
+    first_result = pull_transformers.transform_node({'#text': first_text})
+    second_result = pull_transformers.transform_node({'#text': second_text})
+    assert first_result['#text'] is second_result['#text']
+
+
+class CurrencyTransformer(transformers.AbstractTextTransformer):
+    key = 'usd'
+    attribute = 'currency'
+
+    def get_text_value_or_raise_exception(self, text):
+        return round(float(text) * 100)
+
+
+def test_pull_transformers_dispatch():
+    integer_transformer = transformers.IntegerTransformer()
+    integer_transformer.set_tags('count')
+    pull_transformers = transformers.PullTransformers(
+        integer_transformer, transformers.BoolTransformer,
+        CurrencyTransformer)
+    get_leaf_transformer = pull_transformers.get_leaf_transformer
+    assert get_leaf_transformer('value', {'type': 'bool'}).key == 'bool'
+    assert get_leaf_transformer('count', {}) is integer_transformer
+    assert get_leaf_transformer('count', {'type': 'bool'}).key == 'bool'
+    assert get_leaf_transformer('price', {'currency': 'usd'}).key == 'usd'
+    assert get_leaf_transformer('price', {'type': 'usd'}) is None
+    assert get_leaf_transformer('value', {'type': 'float'}) is None
+
+    node_data = {'@currency': 'usd', '#text': '1.5'}
+    result = pull_transformers.transform_node(node_data)
+    assert result == {'@currency': 'usd', '#text': 150}, result
+
+
+@pytest.mark.parametrize('memo_size', [0, 10])
+def test_pull_transformers_leaf_function(memo_size):
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer)
+    pull_transformers.set_memo_size(memo_size)
+    leaf_function = pull_transformers.get_leaf_function(
+        'value', {'type': 'integer'})
+    result = leaf_function({'type': 'integer', 'attr': 'a'}, '1')
+    assert result == {'@type': 'integer', '@attr': 'a', '#text': 1}, result
+    pull_transformers.set_removing_types(True)
+    leaf_function = pull_transformers.get_leaf_function(
+        'value', {'type': 'integer'})
+    assert leaf_function({'type': 'integer'}, '1') == 1
+    result = leaf_function({'type': 'integer', 'attr': 'a'}, '1')
+    assert result == {'@attr': 'a', '#text': 1}, result
+    with pytest.raises(transformers.TransformerException):
+        leaf_function({'type': 'integer'}, 'a')
+    pull_transformers.set_ignore_errors(True)
+    assert leaf_function({'type': 'integer'}, 'a') == 'a'
+
+
+def test_leaf_transformation_uses_overridden_methods():
+    transformer = CountingIntegerTransformer(removing_types=True)
+    assert not transformer.text_only
+    assert transformer.transform_leaf({'type': 'integer'}, '1') == 1
+    assert transformer.transform_leaves(
+        [({'type': 'integer'}, '2'), ({}, '3')]) == [2, 3]
+    assert transformer.calls == 3
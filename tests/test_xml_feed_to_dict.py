@@ -0,0 +1,53 @@
+import pytest
+
+from xmltodict3 import XmlFeedToDict
+import xmltodict3.transformers as transformers
+
+
+def test_simple_case():
+    xml_feed_to_dict = XmlFeedToDict()
+    assert xml_feed_to_dict.feed(b"<root><node>1</no") == []
+    assert xml_feed_to_dict.feed(b"de></root>") == [{'root': {'node': '1'}}]
+    assert xml_feed_to_dict.close() == []
+
+
+def test_items_by_path():
+    text = b"<root><node>1</node><other>2</other>" \
+           b"<node attr='a'><sub>3</sub></node></root>"
+    xml_feed_to_dict = XmlFeedToDict('root/node')
+    result = []
+    for i in range(len(text)):
+        result.extend(xml_feed_to_dict.feed(text[i:i + 1]))
+    result.extend(xml_feed_to_dict.close())
+    expected_result = [{'node': '1'},
+                       {'node': {'sub': '3', '@attr': 'a'}}]
+    assert result == expected_result, result
+
+
+def test_items_with_namespace():
+    text = "<root xmlns=\"http://test.com/test_shema\">" \
+           "<node>1</node><node>2</node></root>"
+    xml_feed_to_dict = XmlFeedToDict('root/node', ignore_namespace=True)
+    result = xml_feed_to_dict.feed(text)
+    expected_result = [{'node': '1'}, {'node': '2'}]
+    assert result == expected_result, result
+
+
+def test_items_with_pull_transformers():
+    text = b"<root><node type='integer'>1</node>" \
+           b"<node type='bool'>true</node></root>"
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer, transformers.BoolTransformer)
+    pull_transformers.set_removing_types(True)
+    xml_feed_to_dict = XmlFeedToDict('root/node')
+    xml_feed_to_dict.use_pull_transformers(pull_transformers)
+    result = xml_feed_to_dict.feed(text)
+    expected_result = [{'node': 1}, {'node': True}]
+    assert result == expected_result, result
+
+
+def test_incomplete_xml():
+    xml_feed_to_dict = XmlFeedToDict()
+    xml_feed_to_dict.feed(b"<root><node>1</node>")
+    with pytest.raises(SyntaxError):
+        xml_feed_to_dict.close()
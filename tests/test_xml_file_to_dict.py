@@ -1,6 +1,11 @@
+import bz2
+import gzip
+import lzma
 import os
 
-from xmltodict3 import XmlFileToDict
+import pytest
+
+from xmltodict3 import XmlFileToDict, ExpatBackend, MemoryMapFile
 
 
 SAMPLE_FOOD_DICT = {
@@ -66,3 +71,91 @@ def test_simple_case_with_name_space():
         sample_xml_file_path, ignore_namespace=True).get_dict()
     expected_result = SAMPLE_FOOD_DICT
     assert result == expected_result, result
+
+
+def test_iter_items():
+    current_path = os.path.dirname(os.path.abspath(__file__))
+    sample_xml_file_path = os.path.join(
+        current_path, 'test_data/sample_food.xml')
+    result = list(XmlFileToDict(sample_xml_file_path).iter_items(
+        'breakfast_menu/food'))
+    expected_result = [
+        {'food': food}
+        for food in SAMPLE_FOOD_DICT['breakfast_menu']['food']]
+    assert result == expected_result, result
+
+
+def test_iter_items_with_name_space():
+    current_path = os.path.dirname(os.path.abspath(__file__))
+    sample_xml_file_path = os.path.join(
+        current_path, 'test_data/sample_food_with_namespace.xml')
+    result = list(XmlFileToDict(
+        sample_xml_file_path, ignore_namespace=True).iter_items(
+        'breakfast_menu/food/name'))
+    expected_result = [
+        {'name': food['name']}
+        for food in SAMPLE_FOOD_DICT['breakfast_menu']['food']]
+    assert result == expected_result, result
+
+
+def test_iter_items_without_path():
+    current_path = os.path.dirname(os.path.abspath(__file__))
+    sample_xml_file_path = os.path.join(
+        current_path, 'test_data/sample_food.xml')
+    result = list(XmlFileToDict(sample_xml_file_path).iter_items())
+    expected_result = [SAMPLE_FOOD_DICT]
+    assert result == expected_result, result
+
+
+def test_memory_map():
+    current_path = os.path.dirname(os.path.abspath(__file__))
+    sample_xml_file_path = os.path.join(
+        current_path, 'test_data/sample_food.xml')
+    xml_file_to_dict = XmlFileToDict(sample_xml_file_path)
+    xml_file_to_dict.set_memory_map(True)
+    assert isinstance(xml_file_to_dict.get_xml_source(), MemoryMapFile)
+    assert xml_file_to_dict.get_dict() == SAMPLE_FOOD_DICT
+    assert list(xml_file_to_dict.iter_items()) == [SAMPLE_FOOD_DICT]
+    xml_file_to_dict.use_parser_backend(ExpatBackend())
+    assert xml_file_to_dict.get_dict() == SAMPLE_FOOD_DICT
+
+
+def test_memory_map_file(tmpdir):
+    file_path = tmpdir.join('test.xml')
+    file_path.write('<root><a>1</a><b>2</b></root>')
+    memory_map_file = MemoryMapFile(str(file_path))
+    assert memory_map_file.read(0) == b''
+    assert memory_map_file.read(4) == b'<roo'
+    assert memory_map_file.read(6) == b't><a>1'
+    assert memory_map_file.read() == b'</a><b>2</b></root>'
+    assert memory_map_file.read() == b''
+    assert memory_map_file.read(4) == b''
+    assert memory_map_file.readable()
+    memory_map_file.close()
+    assert memory_map_file.buffer.closed
+    with pytest.raises(ValueError):
+        memory_map_file.read()
+    empty_file_path = tmpdir.join('empty.xml')
+    empty_file_path.write('')
+    assert MemoryMapFile(str(empty_file_path)).read() == b''
+
+
+def test_compressed_files(tmpdir):
+    current_path = os.path.dirname(os.path.abspath(__file__))
+    sample_xml_file_path = os.path.join(
+        current_path, 'test_data/sample_food.xml')
+    with open(sample_xml_file_path, 'rb') as file:
+        xml_data = file.read()
+    for extension, opener in (('gz', gzip.open), ('bz2', bz2.open),
+                              ('xz', lzma.open)):
+        file_path = str(tmpdir.join('sample_food.xml.' + extension))
+        with opener(file_path, 'wb') as file:
+            file.write(xml_data)
+        xml_file_to_dict = XmlFileToDict(file_path)
+        xml_file_to_dict.set_memory_map(True)
+        assert xml_file_to_dict.get_dict() == SAMPLE_FOOD_DICT
+        assert list(xml_file_to_dict.iter_items('breakfast_menu/food')) == [
+            {'food': food}
+            for food in SAMPLE_FOOD_DICT['breakfast_menu']['food']]
+        xml_file_to_dict.use_parser_backend(ExpatBackend())
+        assert xml_file_to_dict.get_dict() == SAMPLE_FOOD_DICT
@@ -81,3 +81,23 @@ def test_xml_file_with_pull_transformers():
     result = xml_to_dict.get_dict()
     expected_result = SAMPLE_FOOD_DICT
     assert result == expected_result, result
+
+
+def test_xml_file_iter_items_with_pull_transformers():
+    current_path = os.path.dirname(os.path.abspath(__file__))
+    sample_xml_file_path = os.path.join(
+        current_path, 'test_data/sample_food_with_types.xml')
+
+    transformer_list = transformers.DefaultTransformerList
+    transformer_list += [PriceTransformer]
+    pull_transformers = transformers.PullTransformers(*transformer_list)
+    pull_transformers.set_removing_types(True)
+
+    xml_to_dict = XmlFileToDict(sample_xml_file_path)
+    xml_to_dict.use_pull_transformers(pull_transformers)
+
+    result = list(xml_to_dict.iter_items('breakfast_menu/food'))
+    expected_result = [
+        {'food': food}
+        for food in SAMPLE_FOOD_DICT['breakfast_menu']['food']]
+    assert result == expected_result, result
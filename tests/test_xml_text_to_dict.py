@@ -1,4 +1,7 @@
-from xmltodict3 import XmlTextToDict
+import io
+import xml.etree.ElementTree as ElementTree
+
+from xmltodict3 import XmlTextToDict, XmlEventsToDict
 
 
 def test_mixed_nested_case_with_attributes_with_namespace():
@@ -9,3 +12,43 @@ def test_mixed_nested_case_with_attributes_with_namespace():
         '#text': '1', '@attr': 'attr_value1', '@attr2': 'attr_value2'}, '3']}}
     result = XmlTextToDict(text, ignore_namespace=True).get_dict()
     assert result == expected_result, result
+
+
+def test_iter_items_with_namespace_in_path():
+    text = "<root xmlns=\"http://test.com/test_shema\">" \
+           "<node>1</node><other>2</other><node>3</node></root>"
+    expected_result = [{'{http://test.com/test_shema}node': '1'},
+                       {'{http://test.com/test_shema}node': '3'}]
+    result = list(XmlTextToDict(text).iter_items(
+        '{http://test.com/test_shema}root/{http://test.com/test_shema}node'))
+    assert result == expected_result, result
+
+
+def test_iter_items_removes_processed_nodes():
+    text = "<root><node><sub>1</sub></node><skip>2</skip>" \
+           "<node><sub>3</sub></node></root>"
+    xml_events_to_dict = XmlEventsToDict('root/node')
+    events = ElementTree.iterparse(
+        io.StringIO(text), events=('start', 'end'))
+    result = []
+    root_node = None
+    for event, node in events:
+        if root_node is None:
+            root_node = node
+        result.extend(xml_events_to_dict.process_events([(event, node)]))
+        if event == 'end' and node is not root_node:
+            assert node not in list(root_node)
+    expected_result = [{'node': {'sub': '1'}}, {'node': {'sub': '3'}}]
+    assert result == expected_result, result
+
+
+def test_bytes_input():
+    xml_text = '<?xml version="1.0" encoding="windows-1251"?>' \
+               '<root><name>тест</name><item>1</item><item>2</item></root>'
+    xml_bytes = xml_text.encode('windows-1251')
+    expected_result = {'root': {'name': 'тест', 'item': ['1', '2']}}
+    assert XmlTextToDict(xml_bytes).get_dict() == expected_result
+    assert XmlTextToDict(bytearray(xml_bytes)).get_dict() == \
+        expected_result
+    assert list(XmlTextToDict(xml_bytes).iter_items('root/item')) == \
+        [{'item': '1'}, {'item': '2'}]
@@ -171,3 +171,24 @@ def test_tag_with_schema():
         '#text': 'data', '@type': 'integer'}}}
     result = XmlToDict(etree_element, ignore_namespace=True).get_dict()
     assert result == expected_result, result
+
+
+def test_deeply_nested_case():
+    depth = 50000
+    text = "<node>" * depth + "1" + "</node>" * depth
+    etree_element = ElementTree.fromstring(text)
+    result = XmlToDict(etree_element).get_dict()
+    for _ in range(depth):
+        result = result['node']
+    assert result == '1', result
+
+
+def test_nested_case_with_siblings_after_subtree():
+    text = "<root><node><sub>1</sub><sub>2</sub></node>" \
+           "<node>3</node><other a='b'><sub>4</sub></other></root>"
+    etree_element = ElementTree.fromstring(text)
+    expected_result = {'root': {
+        'node': [{'sub': ['1', '2']}, '3'],
+        'other': {'sub': '4', '@a': 'b'}}}
+    result = XmlToDict(etree_element).get_dict()
+    assert result == expected_result, result
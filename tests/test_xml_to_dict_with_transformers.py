@@ -1,6 +1,9 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import datetime
 import xml.etree.ElementTree as ElementTree
 
+import pytest
+
 from xmltodict3 import XmlToDict
 import xmltodict3.transformers as transformers
 
@@ -99,3 +102,182 @@ def test_xml_to_dict_with_default_transformers_2():
     result = xml_to_dict.get_dict()
 
     assert result == expected_result, result
+
+
+def test_batch_mode():
+    text = "<root><node attr='a'><value type='integer'>1</value>" \
+           "<value type='integer'>2</value><flag type='bool'>true</flag>" \
+           "<other type='unknown'>3</other></node>" \
+           "<node><value type='integer' attr='b'>3</value>" \
+           "<flag type='bool'>false</flag><date type='datetime'>" \
+           "2020-01-01T10:20:30Z</date></node></root>"
+    pull_transformers = transformers.PullTransformers(
+        *transformers.DefaultTransformerList)
+    pull_transformers.set_removing_types(True)
+    expected_result = {'root': {'node': [
+        {'@attr': 'a', 'value': [1, 2], 'flag': True,
+         'other': {'@type': 'unknown', '#text': '3'}},
+        {'value': {'@attr': 'b', '#text': 3}, 'flag': False,
+         'date': datetime.datetime(2020, 1, 1, 10, 20, 30)}]}}
+    result = XmlToDict(ElementTree.fromstring(text))
+    result.use_pull_transformers(pull_transformers)
+    assert result.get_dict() == expected_result
+
+    pull_transformers.set_batch_mode(True)
+    result = XmlToDict(ElementTree.fromstring(text))
+    result.use_pull_transformers(pull_transformers)
+    assert result.get_dict() == expected_result
+
+
+def test_batch_mode_with_errors():
+    text = "<root><value type='integer'>1</value>" \
+           "<value type='integer'>a</value></root>"
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer)
+    pull_transformers.set_batch_mode(True)
+    xml_to_dict = XmlToDict(ElementTree.fromstring(text))
+    xml_to_dict.use_pull_transformers(pull_transformers)
+    with pytest.raises(transformers.TransformerException):
+        xml_to_dict.get_dict()
+
+    pull_transformers.set_ignore_errors(True)
+    pull_transformers.set_removing_types(True)
+    expected_result = {'root': {'value': [1, 'a']}}
+    result = xml_to_dict.get_dict()
+    assert result == expected_result, result
+
+
+@pytest.mark.parametrize('executor_class',
+                         [ThreadPoolExecutor, ProcessPoolExecutor])
+@pytest.mark.parametrize('memo_size', [0, 16])
+def test_executor(executor_class, memo_size):
+    text = "<root>{0}<flag type='bool'>true</flag>" \
+           "<value type='integer' attr='a'>7</value></root>".format(
+               "<value type='integer'>1</value>"
+               "<value type='integer'>2</value>" * 5)
+    pull_transformers = transformers.PullTransformers(
+        *transformers.DefaultTransformerList)
+    pull_transformers.set_removing_types(True)
+    pull_transformers.set_memo_size(memo_size)
+    expected_result = {'root': {
+        'value': [1, 2] * 5 + [{'@attr': 'a', '#text': 7}], 'flag': True}}
+    with executor_class(max_workers=2) as executor:
+        pull_transformers.use_executor(executor, chunk_size=3)
+        assert pull_transformers.batch_mode
+        xml_to_dict = XmlToDict(ElementTree.fromstring(text))
+        xml_to_dict.use_pull_transformers(pull_transformers)
+        assert xml_to_dict.get_dict() == expected_result
+        assert xml_to_dict.get_dict() == expected_result
+
+
+def test_executor_with_errors():
+    text = "<root><value type='integer'>1</value>" \
+           "<value type='integer'>a</value></root>"
+    pull_transformers = transformers.PullTransformers(
+        transformers.IntegerTransformer)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pull_transformers.use_executor(executor, chunk_size=1)
+        xml_to_dict = XmlToDict(ElementTree.fromstring(text))
+        xml_to_dict.use_pull_transformers(pull_transformers)
+        with pytest.raises(transformers.TransformerException):
+            xml_to_dict.get_dict()
+
+        pull_transformers.set_ignore_errors(True)
+        pull_transformers.set_removing_types(True)
+        assert xml_to_dict.get_dict() == {'root': {'value': [1, 'a']}}
+
+
+@pytest.mark.parametrize('batch_mode', [False, True])
+def test_transformers_chosen_by_tag_and_attribute(batch_mode):
+    class WeightTransformer(transformers.AbstractTextTransformer):
+        key = 'kg'
+        attribute = 'unit'
+
+        def get_text_value_or_raise_exception(self, text):
+            return float(text)
+
+    text = "<root><item><count>2</count><weight unit='kg'>1.5</weight>" \
+           "<count type='bool'>true</count></item><item>" \
+           "<count id='c'>3</count><weight unit='lb'>2</weight>" \
+           "</item></root>"
+    integer_transformer = transformers.IntegerTransformer()
+    integer_transformer.set_tags('count')
+    pull_transformers = transformers.PullTransformers(
+        integer_transformer, transformers.BoolTransformer, WeightTransformer)
+    pull_transformers.set_removing_types(True)
+    pull_transformers.set_batch_mode(batch_mode)
+    expected_result = {'root': {'item': [
+        {'count': [2, True], 'weight': 1.5},
+        {'count': {'@id': 'c', '#text': 3},
+         'weight': {'@unit': 'lb', '#text': '2'}}]}}
+    xml_to_dict = XmlToDict(ElementTree.fromstring(text))
+    xml_to_dict.use_pull_transformers(pull_transformers)
+    assert xml_to_dict.get_dict() == expected_result
+
+
+class FrenchBoolTransformer(transformers.BoolTransformer):
+    def check_node_data(self, node_data):
+        return super().check_node_data(node_data) \
+            and node_data.get('@lang') != 'fr'
+
+
+class WrappingTransformer(transformers.AbstractTextTransformer):
+    key = 'wrap'
+
+    def get_text_value_or_raise_exception(self, text):
+        return text
+
+    def transform_node(self, node_data):
+        return {'wrapped': node_data['#text']}
+
+
+class UnitIntegerTransformer(transformers.IntegerTransformer):
+    def remove_type_from_node_data(self, node_data):
+        node_data.pop('@unit', None)
+        return super().remove_type_from_node_data(node_data)
+
+
+class SafeIntegerTransformer(transformers.IntegerTransformer):
+    key = 'safe'
+
+    def get_safe_value(self, node_data):
+        return -1
+
+
+class LangTransformer(transformers.AbstractTextTransformer):
+    key = 'lang'
+
+    def get_text_value_or_raise_exception(self, text):
+        return text
+
+    def get_value_or_raise_exception(self, node_data):
+        return '{0}:{1}'.format(node_data['@lang'], node_data['#text'])
+
+
+@pytest.mark.parametrize('mode', ['plain', 'memo', 'batch', 'executor'])
+def test_transformers_with_node_data_hooks(mode):
+    text = "<root><a type='bool' lang='fr'>x</a>" \
+           "<b type='bool'>true</b><c type='wrap'>y</c>" \
+           "<d type='integer' unit='kg'>5</d><e type='safe'>zz</e>" \
+           "<f type='lang' lang='en'>z</f></root>"
+    pull_transformers = transformers.PullTransformers(
+        FrenchBoolTransformer, WrappingTransformer, UnitIntegerTransformer,
+        SafeIntegerTransformer(ignore_errors=True), LangTransformer)
+    pull_transformers.set_removing_types(True)
+    if mode == 'memo':
+        pull_transformers.set_memo_size(10)
+    elif mode == 'batch':
+        pull_transformers.set_batch_mode(True)
+    expected_result = {'root': {
+        'a': {'@type': 'bool', '@lang': 'fr', '#text': 'x'},
+        'b': True, 'c': {'wrapped': 'y'}, 'd': 5, 'e': -1,
+        'f': {'@lang': 'en', '#text': 'en:z'}}}
+    xml_to_dict = XmlToDict(ElementTree.fromstring(text))
+    xml_to_dict.use_pull_transformers(pull_transformers)
+    if mode == 'executor':
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pull_transformers.use_executor(executor, chunk_size=1)
+            result = xml_to_dict.get_dict()
+    else:
+        result = xml_to_dict.get_dict()
+    assert result == expected_result, result
@@ -1,5 +1,21 @@
-from xmltodict3.xml_to_dict import XmlToDict, XmlFileToDict, XmlTextToDict
+from xmltodict3.xml_to_dict import (
+    XmlToDict, XmlFileToDict, XmlTextToDict, XmlEventsToDict, XmlFeedToDict,
+    XmlEventsToColumns)
+from xmltodict3.dict_to_xml import DictToXml
 from xmltodict3.transformers import (
     IntegerTransformer, BoolTransformer, DateTimeTransformer,
     PullTransformers, DefaultTransformerList)
-from xmltodict3.exceptions import TransformerException
+from xmltodict3.exceptions import TransformerException, PlanMismatchException
+from xmltodict3.plans import ConversionPlans
+from xmltodict3.tags import TagNormalizer
+from xmltodict3.stats import ConversionStats
+from xmltodict3.compact import CompactNode, XmlToCompactDict
+from xmltodict3.columns import Column
+from xmltodict3.lazy import LazyNode
+from xmltodict3.paths import PathSelector
+from xmltodict3.backends import ElementTreeBackend, LxmlBackend, ExpatBackend
+from xmltodict3.backends import get_default_parser_backend
+from xmltodict3.sources import MemoryMapFile
+from xmltodict3.async_xml_to_dict import AsyncXmlStreamToDict
+from xmltodict3.batch import convert_files, convert_file, iter_file_items
+from xmltodict3.jsonl import export_jsonl, write_jsonl
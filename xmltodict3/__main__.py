@@ -0,0 +1,4 @@
+from xmltodict3.cli import main
+
+
+main()
@@ -0,0 +1,95 @@
+"""
+Classes for transformation from asynchronous streams with XML
+to python dictionary
+"""
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterable, Dict, Optional, Union
+
+from xmltodict3.transformers import PullTransformers
+from xmltodict3.xml_to_dict import XmlFeedToDict
+
+
+class AsyncXmlStreamToDict:
+    """
+    Class to work with asynchronous streams of XML
+        (asyncio.StreamReader or an async iterator over bytes).
+        An instance is an async iterator over extracted data
+        of the elements matching the path
+    >>> async for item in AsyncXmlStreamToDict(reader, 'catalog/product'):
+    ...     print(item)
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, stream: Union[asyncio.StreamReader, AsyncIterable],
+                 path: Optional[str] = None, ignore_namespace: bool = False,
+                 chunk_size: Optional[int] = None):
+        """
+        Init instance
+        :param stream: asyncio.StreamReader or an async iterator over bytes
+        :param path: path of the elements to extract from the root,
+            for example "catalog/product". The root element is
+            extracted if the path is not passed
+        :param ignore_namespace: removing namespace from tags
+        :param chunk_size: max size of data which is parsed at once.
+            Big parts of a stream are split, so the event loop is not
+            blocked for a long time
+        """
+        self.stream = stream
+        self.path = path
+        self.ignore_namespace = ignore_namespace
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+        self._xml_feed_to_dict = XmlFeedToDict(
+            path, ignore_namespace=ignore_namespace)
+        self._items = deque()
+        self._stream_iterator = None
+        self._is_closed = False
+
+    def __aiter__(self) -> 'AsyncXmlStreamToDict':
+        return self
+
+    async def __anext__(self) -> Dict:
+        while not self._items:
+            if self._is_closed:
+                raise StopAsyncIteration
+            data = await self._read()
+            if data:
+                await self._feed(data)
+            else:
+                self._is_closed = True
+                self._items.extend(self._xml_feed_to_dict.close())
+        return self._items.popleft()
+
+    async def _read(self) -> Any:
+        """
+        Read the next part of the stream
+        :return: part of XML or empty bytes at the end of the stream
+        """
+        if isinstance(self.stream, asyncio.StreamReader):
+            return await self.stream.read(self.chunk_size)
+        if self._stream_iterator is None:
+            self._stream_iterator = self.stream.__aiter__()
+        try:
+            return await self._stream_iterator.__anext__()
+        except StopAsyncIteration:
+            return b''
+
+    async def _feed(self, data: Union[bytes, str]) -> None:
+        """
+        Parse data by chunks, giving control back to the event loop
+            after every chunk
+        :param data: part of XML
+        """
+        for start in range(0, len(data), self.chunk_size):
+            chunk = data[start:start + self.chunk_size]
+            self._items.extend(self._xml_feed_to_dict.feed(chunk))
+            await asyncio.sleep(0)
+
+    def use_pull_transformers(
+            self, pull_transformers: PullTransformers) -> None:
+        """
+        Set up pull_transformation for using into XmlToDict objects
+        :param pull_transformers: PullTransformers instance
+        """
+        self._xml_feed_to_dict.use_pull_transformers(pull_transformers)
@@ -0,0 +1,217 @@
+"""
+Parser backends which turn XML sources into data for conversion
+"""
+from collections import defaultdict
+import io
+from xml.parsers import expat
+import xml.etree.ElementTree as ElementTree
+from typing import Any, Dict, List, Union, TYPE_CHECKING
+
+from xmltodict3.sources import XmlSource
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover
+    lxml_etree = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from xmltodict3.xml_to_dict import XmlToDict
+
+
+class AbstractParserBackend:
+    """
+    Abstract class of parser backends. Backends which build trees
+        implement get_root_node, other backends implement get_dict
+    """
+    builds_tree = True
+
+    def get_root_node(self, source: XmlSource) -> ElementTree.Element:
+        """
+        Parse XML into a tree
+        :param source: a file path or a file object
+        :return: root of the tree
+        """
+        raise NotImplementedError
+
+    def get_dict(self, source: XmlSource,
+                 xml_to_dict_node: 'XmlToDict') -> Dict:
+        """
+        Parse XML and extract data
+        :param source: a file path or a file object
+        :param xml_to_dict_node: XmlToDict instance
+            which options are used for conversion
+        :return: extracted data as a python dict
+        """
+        raise NotImplementedError
+
+
+class ElementTreeBackend(AbstractParserBackend):
+    """Backend which uses xml.etree.ElementTree"""
+    def get_root_node(self, source: XmlSource) -> ElementTree.Element:
+        return ElementTree.parse(source).getroot()
+
+
+class LxmlBackend(AbstractParserBackend):
+    """
+    Backend which uses lxml.etree. Comments and
+        processing instructions are removed from the tree
+    """
+    def __init__(self):
+        if not self.is_available():
+            raise ImportError('lxml is not installed')
+        self.parser = lxml_etree.XMLParser(
+            remove_comments=True, remove_pis=True)
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Check that lxml is installed
+        :return: result of check
+        """
+        return lxml_etree is not None
+
+    def get_root_node(self, source: XmlSource) -> Any:
+        if isinstance(source, io.StringIO):
+            source = io.BytesIO(source.getvalue().encode('utf-8'))
+        return lxml_etree.parse(source, self.parser).getroot()
+
+
+class ExpatBackend(AbstractParserBackend):
+    """
+    Backend which builds dicts from events of xml.parsers.expat
+        during parsing, so a tree of the document is never created.
+        Conversion plans and statistics are not used
+    """
+    builds_tree = False
+    chunk_size = 1 << 20
+
+    def get_dict(self, source: XmlSource,
+                 xml_to_dict_node: 'XmlToDict') -> Dict:
+        dict_builder = ExpatDictBuilder(xml_to_dict_node)
+        parser = expat.ParserCreate(namespace_separator=' ')
+        parser.buffer_text = True
+        parser.StartElementHandler = dict_builder.start
+        parser.EndElementHandler = dict_builder.end
+        parser.CharacterDataHandler = dict_builder.data
+        try:
+            if isinstance(source, str):
+                with open(source, 'rb') as file_object:
+                    self._parse(parser, file_object)
+            else:
+                self._parse(parser, source)
+        except expat.ExpatError as error:
+            raise ElementTree.ParseError(str(error)) from error
+        return dict_builder.get_dict()
+
+    def _parse(self, parser: Any, file_object: io.IOBase) -> None:
+        """
+        Feed the parser with data of a file object
+        :param parser: expat parser
+        :param file_object: a file object
+        """
+        data = file_object.read(self.chunk_size)
+        while data:
+            parser.Parse(data, False)
+            data = file_object.read(self.chunk_size)
+        parser.Parse(b'', True)
+
+
+class ExpatDictBuilder:
+    """
+    Handler of expat events which builds the same data as
+        XmlToDict.get_dict, using methods of a XmlToDict instance
+    """
+    def __init__(self, xml_to_dict_node: 'XmlToDict'):
+        """
+        Init instance
+        :param xml_to_dict_node: XmlToDict instance
+            which options are used for conversion
+        """
+        self.xml_to_dict_node = xml_to_dict_node
+        self.get_tag = xml_to_dict_node.get_tag_normalizer().get_tag
+        self.names = dict()
+        self.stack = list()
+        self.result = None
+
+    def start(self, name: str, attributes: Dict[str, str]) -> None:
+        stack = self.stack
+        if stack and stack[-1][3] is None:
+            stack[-1][3] = defaultdict(list)
+        stack.append(
+            [self.get_tag(self._get_name(name)), attributes, list(), None])
+
+    def end(self, name: str) -> None:
+        tag, attributes, text_parts, children_data = self.stack.pop()
+        xml_to_dict_node = self.xml_to_dict_node
+        if children_data is None:
+            if attributes:
+                attributes = {self._get_name(attribute_name): attribute_value
+                              for attribute_name, attribute_value
+                              in attributes.items()}
+            value = xml_to_dict_node._get_leaf_data(
+                tag, attributes, self._get_value(text_parts))
+        else:
+            value = xml_to_dict_node._group_children_data(children_data)
+            value.update(self._get_attributes(attributes))
+        if self.stack:
+            self.stack[-1][3][tag].append(value)
+        else:
+            self.result = {tag: value}
+
+    def data(self, data: str) -> None:
+        node = self.stack[-1]
+        if node[3] is None:
+            node[2].append(data)
+
+    def get_dict(self) -> Dict:
+        """
+        Get extracted data
+        :return: extracted data as a python dict
+        """
+        return self.result
+
+    def _get_name(self, name: str) -> str:
+        """
+        Convert a name from expat format "uri name"
+            into ElementTree format "{uri}name"
+        :param name: name of a tag or an attribute
+        :return: converted name
+        """
+        converted_name = self.names.get(name)
+        if converted_name is None:
+            converted_name = name
+            if ' ' in name:
+                converted_name = '{{{0}}}{1}'.format(*name.split(' ', 1))
+            self.names[name] = converted_name
+        return converted_name
+
+    def _get_attributes(self, attributes: Dict[str, str]) -> Dict:
+        """
+        Get node attributes marked with "@"
+        :param attributes: attributes from expat
+        :return: node attributes as dict
+        """
+        return {'@' + self._get_name(attribute_name): attribute_value
+                for attribute_name, attribute_value in attributes.items()}
+
+    @staticmethod
+    def _get_value(text_parts: List[str]) -> Union[str, None]:
+        """
+        Get node value like XmlToDict._get_value
+        :param text_parts: text data of the node
+        :return: node value
+        """
+        if not text_parts:
+            return None
+        return ''.join(text_parts).strip()
+
+
+def get_default_parser_backend() -> AbstractParserBackend:
+    """
+    Get the fastest available backend which builds trees:
+        lxml if it is installed, otherwise xml.etree.ElementTree
+    :return: backend instance
+    """
+    if LxmlBackend.is_available():
+        return LxmlBackend()
+    return ElementTreeBackend()
@@ -0,0 +1,385 @@
+"""
+Functions for parallel transformation of XML files
+to python dictionaries, using a pool of processes
+"""
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import multiprocessing
+import os
+import re
+import xml.etree.ElementTree as ElementTree
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from xmltodict3.sources import get_compression_opener
+from xmltodict3.transformers import PullTransformers
+from xmltodict3.xml_to_dict import XmlEventsToDict, XmlFileToDict, XmlToDict
+
+
+_worker_options = dict()
+_chunk_tag = 'xmltodict3-chunk'
+_tag_end_pattern = re.compile(rb'(?:[^>"\']|"[^"]*"|\'[^\']*\')*>')
+
+
+def convert_files(file_paths: Iterable[str], workers: Optional[int] = None,
+                  chunksize: int = 1, ordered: bool = True,
+                  ignore_namespace: bool = False,
+                  pull_transformers: Optional[PullTransformers] = None
+                  ) -> Iterator[Tuple[str, Dict]]:
+    """
+    Extract data from XML files in worker processes.
+        Options (ignore_namespace, pull_transformers) are sent
+        to every worker once, when the worker starts
+    >>> for file_path, data in convert_files(['a.xml', 'b.xml'], workers=2):
+    ...     print(file_path, data)
+    :param file_paths: paths to XML files
+    :param workers: number of worker processes,
+        the number of CPUs is used by default
+    :param chunksize: number of files which are sent to a worker at once
+    :param ordered: if True then results are returned in order of
+        file_paths, otherwise results are returned as they are completed
+    :param ignore_namespace: removing namespace from tags
+    :param pull_transformers: PullTransformers instance
+    :return: iterator over pairs of a file path and extracted data
+    """
+    pool = multiprocessing.Pool(
+        workers, _init_worker, (ignore_namespace, pull_transformers))
+    with pool:
+        if ordered:
+            results = pool.imap(_convert_file, file_paths, chunksize)
+        else:
+            results = pool.imap_unordered(
+                _convert_file, file_paths, chunksize)
+        for result in results:
+            yield result
+
+
+def iter_file_items(file_path: str, path: str,
+                    workers: Optional[int] = None,
+                    chunk_size: Optional[int] = None,
+                    ignore_namespace: bool = False,
+                    pull_transformers: Optional[PullTransformers] = None
+                    ) -> Iterator[Dict]:
+    """
+    Extract data from every element matching the path
+        in a big XML file, using worker processes.
+        The file is scanned for the elements and split into byte ranges
+        which are converted by the workers.
+        The scanning finds elements by their tag only, so the tag of
+        the elements should not be used at other levels of the document,
+        in comments or CDATA sections.
+        Namespaces which are declared below the root element are not
+        passed to the workers
+    >>> for item in iter_file_items('big.xml', 'catalog/product'):
+    ...     print(item)
+    :param file_path: path to a XML file
+    :param path: path of the elements from the root,
+        for example "catalog/product"
+    :param workers: number of worker processes,
+        the number of CPUs is used by default
+    :param chunk_size: approximate size in bytes of a range
+        which is sent to a worker
+    :param ignore_namespace: removing namespace from tags
+    :param pull_transformers: PullTransformers instance
+    :return: iterator over extracted data in order of the document
+    """
+    header, footer, ranges, _ = _split_file(
+        file_path, path, workers, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _convert_file_range, file_path, header, footer, start, end,
+                ignore_namespace, pull_transformers)
+            for start, end in ranges]
+        for future in futures:
+            for item in future.result():
+                yield item
+
+
+def convert_file(file_path: str, path: str, workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None,
+                 ignore_namespace: bool = False,
+                 pull_transformers: Optional[PullTransformers] = None
+                 ) -> Dict:
+    """
+    Extract data from a big XML file, using worker processes
+        for the elements matching the path.
+        The result is the same as the result of XmlFileToDict.get_dict.
+        Restrictions of iter_file_items are applied
+    :param file_path: path to a XML file
+    :param path: path of the repeated elements from the root,
+        for example "catalog/product"
+    :param workers: number of worker processes,
+        the number of CPUs is used by default
+    :param chunk_size: approximate size in bytes of a range
+        which is sent to a worker
+    :param ignore_namespace: removing namespace from tags
+    :param pull_transformers: PullTransformers instance
+    :return: extracted data as a python dict
+    """
+    header, footer, ranges, skeleton = _split_file(
+        file_path, path, workers, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _convert_file_range, file_path, header, footer, start, end,
+                ignore_namespace, pull_transformers)
+            for start, end in ranges]
+        xml_to_dict_node = XmlToDict(
+            ElementTree.fromstring(skeleton),
+            ignore_namespace=ignore_namespace)
+        xml_to_dict_node.use_pull_transformers(pull_transformers)
+        skeleton_data = xml_to_dict_node.get_dict()
+        chunks = [future.result() for future in futures]
+    _put_chunks_into_skeleton(skeleton_data, chunks)
+    return skeleton_data
+
+
+def _init_worker(ignore_namespace: bool,
+                 pull_transformers: Optional[PullTransformers]) -> None:
+    """
+    Save options of transformation in a worker process
+    :param ignore_namespace: removing namespace from tags
+    :param pull_transformers: PullTransformers instance
+    """
+    _worker_options['ignore_namespace'] = ignore_namespace
+    _worker_options['pull_transformers'] = pull_transformers
+
+
+def _convert_file(file_path: str) -> Tuple[str, Dict]:
+    """
+    Extract data from a XML file, using options of the worker process
+    :param file_path: path to a XML file
+    :return: pair of the file path and extracted data
+    """
+    xml_to_dict = XmlFileToDict(
+        file_path, ignore_namespace=_worker_options['ignore_namespace'])
+    xml_to_dict.use_pull_transformers(_worker_options['pull_transformers'])
+    return file_path, xml_to_dict.get_dict()
+
+
+def _convert_file_range(file_path: str, header: bytes, footer: bytes,
+                        start: int, end: int, ignore_namespace: bool,
+                        pull_transformers: Optional[PullTransformers]
+                        ) -> List[Dict]:
+    """
+    Extract data from the elements in a byte range of a XML file
+        in a worker process. The range is wrapped with the header
+        (the prolog and the start tag of the root element) and
+        the end tag of the root element to be parsed
+    :param file_path: path to a XML file
+    :param header: beginning of the file up to the end of the root start tag
+    :param footer: end tag of the root element
+    :param start: start of the range
+    :param end: end of the range
+    :param ignore_namespace: removing namespace from tags
+    :param pull_transformers: PullTransformers instance
+    :return: list of extracted data
+    """
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    root_node = ElementTree.fromstring(header + data + footer)
+    result = list()
+    for node in root_node:
+        xml_to_dict_node = XmlToDict(node, ignore_namespace=ignore_namespace)
+        xml_to_dict_node.use_pull_transformers(pull_transformers)
+        result.append(xml_to_dict_node.get_dict())
+    return result
+
+
+def _split_file(file_path: str, path: str, workers: Optional[int],
+                chunk_size: Optional[int]
+                ) -> Tuple[bytes, bytes, List[Tuple[int, int]], bytes]:
+    """
+    Find byte ranges of the elements matching the path.
+        Neighbouring elements are grouped into one range
+        if there are no other elements between them
+    :param file_path: path to a XML file
+    :param path: path of the elements from the root
+    :param workers: number of worker processes
+    :param chunk_size: approximate size in bytes of a range
+    :return: header, footer, ranges and the file content
+        where the ranges are replaced by placeholders
+    """
+    if get_compression_opener(file_path) is not None:
+        raise ValueError(
+            'Compressed file cannot be split: {0}'.format(file_path))
+    tags = XmlEventsToDict.split_path(path)
+    if len(tags) < 2:
+        raise ValueError(
+            'Path has to contain at least two tags: {0}'.format(path))
+    local_tag = re.sub(r'{[^}]+}', '', tags[-1]).encode('utf-8')
+
+    with open(file_path, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if chunk_size is None:
+                chunk_size = _get_default_chunk_size(len(buffer), workers)
+            root_start, root_end = _find_root_start_tag(buffer)
+            root_tag = re.match(
+                rb'<([^\s/>]+)', buffer[root_start:root_end]).group(1)
+            header = buffer[:root_end]
+            footer = b'</' + root_tag + b'>'
+            ranges = _group_ranges(
+                buffer, _find_elements(buffer, local_tag, root_end),
+                chunk_size)
+            skeleton = _get_skeleton(buffer, ranges)
+        finally:
+            buffer.close()
+    return header, footer, ranges, skeleton
+
+
+def _get_default_chunk_size(file_size: int, workers: Optional[int]) -> int:
+    """
+    Split a file into several ranges for every worker
+    :param file_size: size of a file in bytes
+    :param workers: number of worker processes
+    :return: size of a range in bytes
+    """
+    workers = workers or os.cpu_count() or 1
+    return max(file_size // (workers * 4), 1)
+
+
+def _find_root_start_tag(buffer: Any) -> Tuple[int, int]:
+    """
+    Find the start tag of the root element,
+        skipping XML declaration, processing instructions,
+        comments and DOCTYPE
+    :param buffer: content of a file
+    :return: start and end positions of the root start tag
+    """
+    position = buffer.find(b'<')
+    while position != -1:
+        if buffer[position:position + 2] == b'<?':
+            position = buffer.find(b'?>', position) + 2
+        elif buffer[position:position + 4] == b'<!--':
+            position = buffer.find(b'-->', position) + 3
+        elif buffer[position:position + 2] == b'<!':
+            bracket = buffer.find(b'[', position)
+            end = buffer.find(b'>', position)
+            if bracket != -1 and bracket < end:
+                end = buffer.find(b'>', buffer.find(b']', bracket))
+            position = end + 1
+        else:
+            return position, _find_tag_end(buffer, position)
+        position = buffer.find(b'<', position)
+    raise ValueError('Root element is not found')
+
+
+def _find_tag_end(buffer: Any, position: int) -> int:
+    """
+    Find the end of a tag, skipping quoted values of attributes,
+        which can contain ">"
+    :param buffer: content of a file
+    :param position: position inside the tag
+    :return: position after ">" of the tag
+    """
+    tag_end_match = _tag_end_pattern.match(buffer, position)
+    if tag_end_match is None:
+        raise ValueError('Tag at {0} is not closed'.format(position))
+    return tag_end_match.end()
+
+
+def _find_elements(buffer: Any, local_tag: bytes,
+                   position: int) -> Iterator[Tuple[int, int]]:
+    """
+    Find byte ranges of the outermost elements with the tag.
+        Tags with any namespace prefix are matched
+    :param buffer: content of a file
+    :param local_tag: tag without namespace
+    :param position: position to start searching from
+    :return: iterator over start and end positions of the elements
+    """
+    pattern = re.compile(
+        rb'<(/?)(?:[^\s/>:]+:)?' + re.escape(local_tag) + rb'(?=[\s/>])')
+    depth = 0
+    start = None
+    for tag_match in pattern.finditer(buffer, position):
+        end = _find_tag_end(buffer, tag_match.end())
+        if tag_match.group(1):
+            depth -= 1
+        elif buffer[end - 2:end - 1] != b'/':
+            depth += 1
+            if depth == 1:
+                start = tag_match.start()
+            continue
+        elif depth == 0:
+            start = tag_match.start()
+        if depth == 0:
+            yield start, end
+
+
+def _group_ranges(buffer: Any, element_ranges: Iterable[Tuple[int, int]],
+                  chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Group ranges of neighbouring elements into ranges of chunk_size.
+        Elements are not grouped if there is something other
+        than text between them
+    :param buffer: content of a file
+    :param element_ranges: start and end positions of the elements
+    :param chunk_size: approximate size in bytes of a range
+    :return: list of grouped ranges
+    """
+    ranges = list()
+    range_start = range_end = None
+    for start, end in element_ranges:
+        if range_start is not None and (
+                end - range_start > chunk_size
+                or buffer.find(b'<', range_end, start) != -1):
+            ranges.append((range_start, range_end))
+            range_start = None
+        if range_start is None:
+            range_start = start
+        range_end = end
+    if range_start is not None:
+        ranges.append((range_start, range_end))
+    return ranges
+
+
+def _get_skeleton(buffer: Any, ranges: List[Tuple[int, int]]) -> bytes:
+    """
+    Replace the ranges in the file content by placeholder elements
+    :param buffer: content of a file
+    :param ranges: start and end positions of the ranges
+    :return: content without the ranges
+    """
+    parts = list()
+    position = 0
+    for index, (start, end) in enumerate(ranges):
+        parts.append(buffer[position:start])
+        parts.append('<{0} xmlns="" index="{1}"/>'.format(
+            _chunk_tag, index).encode('utf-8'))
+        position = end
+    parts.append(buffer[position:])
+    return b''.join(parts)
+
+
+def _put_chunks_into_skeleton(skeleton_data: Dict,
+                              chunks: List[List[Dict]]) -> None:
+    """
+    Replace placeholders in extracted data of the skeleton
+        by extracted data of the ranges
+    :param skeleton_data: extracted data of the file content
+        without the ranges
+    :param chunks: extracted data of the ranges
+    """
+    stack = [skeleton_data]
+    while stack:
+        node_data = stack.pop()
+        if isinstance(node_data, list):
+            stack.extend(node_data)
+            continue
+        if not isinstance(node_data, dict):
+            continue
+        if _chunk_tag in node_data:
+            placeholders = node_data.pop(_chunk_tag)
+            if not isinstance(placeholders, list):
+                placeholders = [placeholders]
+            children_data = defaultdict(list)
+            for placeholder in placeholders:
+                for item in chunks[int(placeholder['@index'])]:
+                    for tag, value in item.items():
+                        children_data[tag].append(value)
+            node_data.update(XmlToDict._group_children_data(children_data))
+        stack.extend(node_data.values())
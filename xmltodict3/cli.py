@@ -0,0 +1,276 @@
+"""
+Command-line interface: conversion of XML files to JSONL, JSON or pickle
+
+    xmltodict3 data/*.xml --workers 4 --output jsonl > result.jsonl
+    xmltodict3 big.xml.gz --stream catalog/product --stats
+    cat file.xml | xmltodict3 - --output json
+"""
+import argparse
+import glob
+import importlib
+import os
+import pickle
+import sys
+import time
+import xml.etree.ElementTree as ElementTree
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+from xmltodict3.batch import convert_files, iter_file_items
+from xmltodict3.jsonl import encode_json, write_jsonl
+from xmltodict3.sources import get_compression_opener
+from xmltodict3.stats import ConversionStats
+from xmltodict3.transformers import PullTransformers
+from xmltodict3.xml_to_dict import (
+    XmlEventsToDict, XmlFileToDict, XmlTextToDict)
+
+
+STDIN = '-'
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    """
+    Console entry point
+    :param arguments: command line arguments
+    """
+    options = get_argument_parser().parse_args(arguments)
+    file_paths = get_file_paths(options.inputs)
+    pull_transformers = None
+    if options.transformers:
+        pull_transformers = load_pull_transformers(options.transformers)
+        pull_transformers.set_removing_types(options.remove_types)
+    stats = ConversionStats() if options.stats else None
+
+    output_file = sys.stdout.buffer
+    if options.output_file:
+        output_file = open(options.output_file, 'wb')
+    start = time.perf_counter()
+    try:
+        records = iter_records(
+            file_paths, options.stream, options.workers,
+            options.ignore_namespace, pull_transformers, stats)
+        single = len(file_paths) == 1 and not options.stream
+        count = write_records(records, options.output, output_file, single)
+    finally:
+        if options.output_file:
+            output_file.close()
+    if stats is not None:
+        print_stats(file_paths, count, stats,
+                    time.perf_counter() - start, sys.stderr,
+                    nodes_counted=options.workers <= 0)
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    """
+    Get a parser of command line arguments
+    :return: argparse.ArgumentParser instance
+    """
+    parser = argparse.ArgumentParser(
+        prog='xmltodict3',
+        description='Convert XML files to JSONL, JSON or pickle')
+    parser.add_argument(
+        'inputs', nargs='*', default=[STDIN],
+        help='paths or glob patterns of XML files (compressed files are '
+             'supported), "-" is stdin, stdin is used by default')
+    parser.add_argument(
+        '--stream', metavar='PATH',
+        help='convert every element matching the path, for example '
+             '"catalog/product", instead of whole documents')
+    parser.add_argument(
+        '--workers', type=int, default=0,
+        help='number of worker processes: files are converted in '
+             'parallel, with --stream a file is split between workers')
+    parser.add_argument('--ignore-namespace', action='store_true',
+                        help='remove namespaces from tags')
+    parser.add_argument(
+        '--transformers', metavar='MODULE:LIST',
+        help='list of transformers, for example '
+             '"xmltodict3.transformers:DefaultTransformerList"')
+    parser.add_argument('--remove-types', action='store_true',
+                        help='remove "@type" of transformed values')
+    parser.add_argument('--output', choices=('jsonl', 'json', 'pickle'),
+                        default='jsonl', help='output format')
+    parser.add_argument('--output-file',
+                        help='path to an output file, stdout by default')
+    parser.add_argument(
+        '--stats', action='store_true',
+        help='print MB/s and nodes/s to stderr (stdin is not counted '
+             'in MB/s, nodes/s is printed only without worker processes)')
+    return parser
+
+
+def get_file_paths(inputs: Iterable[str]) -> List[str]:
+    """
+    Expand glob patterns
+    :param inputs: paths, glob patterns or "-"
+    :return: paths
+    """
+    file_paths = list()
+    for pattern in inputs:
+        if pattern == STDIN or not glob.has_magic(pattern):
+            file_paths.append(pattern)
+            continue
+        matched_paths = sorted(glob.glob(pattern))
+        if not matched_paths:
+            raise SystemExit('No files match {0}'.format(pattern))
+        file_paths.extend(matched_paths)
+    return file_paths
+
+
+def load_pull_transformers(name: str) -> PullTransformers:
+    """
+    Import a list of transformers
+    :param name: "module:list", for example
+        "xmltodict3.transformers:DefaultTransformerList"
+    :return: PullTransformers instance
+    """
+    module_name, _, attribute_name = name.partition(':')
+    if not attribute_name:
+        raise SystemExit(
+            'Transformers have to be passed as "module:list": {0}'.format(
+                name))
+    sys.path.insert(0, os.getcwd())
+    try:
+        module = importlib.import_module(module_name)
+    finally:
+        sys.path.pop(0)
+    return PullTransformers(*getattr(module, attribute_name))
+
+
+def iter_records(file_paths: List[str], stream: Optional[str],
+                 workers: int, ignore_namespace: bool,
+                 pull_transformers: Optional[PullTransformers],
+                 stats: Optional[ConversionStats]) -> Iterator[Dict]:
+    """
+    Convert files into records: whole documents or, with stream,
+        elements matching the path
+    :param file_paths: paths to XML files or "-"
+    :param stream: path of the elements or None
+    :param workers: number of worker processes
+    :param ignore_namespace: removing namespace from tags
+    :param pull_transformers: PullTransformers instance
+    :param stats: ConversionStats instance
+    :return: iterator over records
+    """
+    if workers > 0 and not stream and STDIN not in file_paths:
+        for _, data in convert_files(
+                file_paths, workers=workers,
+                ignore_namespace=ignore_namespace,
+                pull_transformers=pull_transformers):
+            yield data
+        return
+
+    for file_path in file_paths:
+        if file_path == STDIN:
+            yield from _iter_stdin_records(
+                stream, ignore_namespace, pull_transformers, stats)
+        elif stream and workers > 0 \
+                and _can_split_file(file_path, stream):
+            yield from iter_file_items(
+                file_path, stream, workers=workers,
+                ignore_namespace=ignore_namespace,
+                pull_transformers=pull_transformers)
+        else:
+            xml_file_to_dict = XmlFileToDict(
+                file_path, ignore_namespace=ignore_namespace)
+            xml_file_to_dict.use_pull_transformers(pull_transformers)
+            xml_file_to_dict.use_stats(stats)
+            if stream:
+                yield from xml_file_to_dict.iter_items(stream)
+            else:
+                yield xml_file_to_dict.get_dict()
+
+
+def _can_split_file(file_path: str, stream: str) -> bool:
+    """
+    Check that elements matching the path can be converted
+        by worker processes: the file is not compressed
+        and the path is below the root element
+    :param file_path: path to a XML file
+    :param stream: path of the elements
+    :return: result of check
+    """
+    return len(XmlEventsToDict.split_path(stream)) >= 2 \
+        and get_compression_opener(file_path) is None
+
+
+def _iter_stdin_records(stream: Optional[str], ignore_namespace: bool,
+                        pull_transformers: Optional[PullTransformers],
+                        stats: Optional[ConversionStats]
+                        ) -> Iterator[Dict]:
+    """
+    Convert XML from stdin. With stream the input is parsed
+        incrementally, otherwise it is read at once
+    :param stream: path of the elements or None
+    :param ignore_namespace: removing namespace from tags
+    :param pull_transformers: PullTransformers instance
+    :param stats: ConversionStats instance
+    :return: iterator over records
+    """
+    if not stream:
+        xml_text_to_dict = XmlTextToDict(
+            sys.stdin.buffer.read(), ignore_namespace=ignore_namespace)
+        xml_text_to_dict.use_pull_transformers(pull_transformers)
+        xml_text_to_dict.use_stats(stats)
+        yield xml_text_to_dict.get_dict()
+        return
+    xml_events_to_dict = XmlEventsToDict(
+        stream, ignore_namespace=ignore_namespace)
+    xml_events_to_dict.use_pull_transformers(pull_transformers)
+    xml_events_to_dict.use_stats(stats)
+    events = ElementTree.iterparse(
+        sys.stdin.buffer, events=('start', 'end'))
+    yield from xml_events_to_dict.process_events(events)
+
+
+def write_records(records: Iterable[Dict], output_format: str,
+                  output_file: IO, single: bool = False) -> int:
+    """
+    Write records in an output format
+    :param records: records
+    :param output_format: "jsonl", "json" or "pickle"
+    :param output_file: binary file object
+    :param single: if True then one JSON object is written
+        instead of an array
+    :return: number of written records
+    """
+    if output_format == 'jsonl':
+        return write_jsonl(records, output_file)
+    count = 0
+    if output_format == 'pickle':
+        for record in records:
+            pickle.dump(record, output_file, pickle.HIGHEST_PROTOCOL)
+            count += 1
+        return count
+    if not single:
+        output_file.write(b'[')
+    for record in records:
+        if count:
+            output_file.write(b',\n')
+        output_file.write(encode_json(record).encode('utf-8'))
+        count += 1
+    output_file.write(b'\n' if single else b']\n')
+    return count
+
+
+def print_stats(file_paths: List[str], count: int,
+                stats: ConversionStats, seconds: float,
+                stats_file: IO, nodes_counted: bool = True) -> None:
+    """
+    Print throughput of the conversion
+    :param file_paths: paths to XML files or "-"
+    :param count: number of records
+    :param stats: collected statistics
+    :param seconds: time of the conversion
+    :param stats_file: text file object
+    :param nodes_counted: if False then nodes/s is not printed,
+        because nodes converted by worker processes are not counted
+    """
+    megabytes = sum(
+        os.path.getsize(file_path) for file_path in file_paths
+        if file_path != STDIN) / 1024 / 1024
+    seconds = max(seconds, 1e-9)
+    line = 'records: {0}, time: {1:.3f} s, {2:.2f} MB/s'.format(
+        count, seconds, megabytes / seconds)
+    if nodes_counted:
+        line += ', {0:.0f} nodes/s'.format(stats.node_count / seconds)
+    stats_file.write(line + '\n')
@@ -0,0 +1,135 @@
+"""
+Columns of values for columnar output of records
+"""
+from array import array
+from typing import Any, List, Optional
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class Column:
+    """
+    Values of one leaf path of records.
+        Values of transformers with a typecode are kept in array.array,
+        other values are kept in a list. The column is turned into
+        a list if a value does not fit the array.
+        Values of a path repeated in one record are kept as a list
+    """
+    typecodes = {'integer': 'q', 'bool': 'b'}
+
+    def __init__(self, key: Optional[str] = None):
+        """
+        Init instance
+        :param key: key of a transformer of the first value
+        """
+        self.key = key
+        typecode = self.typecodes.get(key)
+        if typecode is not None:
+            self.values = array(typecode)
+        else:
+            self.values = list()
+        self.mask = array('b')
+        self.last_row = -1
+
+    def append(self, row: int, value: Any) -> None:
+        """
+        Add a value of a record. None is a missing value
+        :param row: index of the record
+        :param value: value of the leaf path
+        """
+        if row == self.last_row:
+            self._append_repeated(value)
+            return
+        self.last_row = row
+        if value is None:
+            self.fill(row + 1)
+            return
+        self.fill(row)
+        try:
+            self.values.append(value)
+        except (TypeError, OverflowError):
+            self._to_list()
+            self.values.append(value)
+        self.mask.append(1)
+
+    def _append_repeated(self, value: Any) -> None:
+        """
+        Add a value of a path repeated in the last record.
+            Values of the record are kept as a list with None
+            for missing values, and the record is not missing
+        :param value: value of the leaf path
+        """
+        self._to_list()
+        last_value = self.values[-1]
+        if not isinstance(last_value, list):
+            self.values[-1] = last_value = [last_value]
+        last_value.append(value)
+        self.mask[-1] = 1
+
+    def fill(self, row_count: int) -> None:
+        """
+        Add missing values up to the number of records
+        :param row_count: number of records
+        """
+        missing_count = row_count - len(self.mask)
+        if missing_count <= 0:
+            return
+        if isinstance(self.values, array):
+            self.values.extend(array(self.values.typecode, [0]) *
+                               missing_count)
+        else:
+            self.values.extend([None] * missing_count)
+        self.mask.extend(array('b', [0]) * missing_count)
+
+    def _to_list(self) -> None:
+        """
+        Turn the column into a list, which keeps values of any types
+        """
+        if isinstance(self.values, array):
+            if self.values.typecode == 'b':
+                self.values = [bool(value) for value in self.values]
+            else:
+                self.values = self.values.tolist()
+            for row, is_valid in enumerate(self.mask):
+                if not is_valid:
+                    self.values[row] = None
+
+    def to_list(self) -> List[Any]:
+        """
+        Get values as a list. Missing values are None
+        :return: list of values
+        """
+        if isinstance(self.values, list):
+            return list(self.values)
+        values = self.values.tolist()
+        if self.values.typecode == 'b':
+            values = [bool(value) for value in values]
+        return [value if is_valid else None
+                for value, is_valid in zip(values, self.mask)]
+
+    def to_numpy(self) -> Any:
+        """
+        Get values as a NumPy array without copying of typed values.
+            A masked array is returned if some values are missing
+        :return: numpy.ndarray or numpy.ma.MaskedArray
+        """
+        if numpy is None:
+            raise ImportError('numpy is not installed')
+        if isinstance(self.values, list):
+            values = numpy.empty(len(self.values), dtype=object)
+            values[:] = self.values
+        else:
+            values = numpy.frombuffer(
+                self.values, dtype=self.values.typecode)
+            if self.values.typecode == 'b':
+                values = values.view(numpy.bool_)
+        if all(self.mask):
+            return values
+        mask = numpy.frombuffer(self.mask, dtype='b') == 0
+        return numpy.ma.masked_array(values, mask=mask)
+
+    def __len__(self) -> int:
+        return len(self.mask)
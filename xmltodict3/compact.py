@@ -0,0 +1,167 @@
+"""
+Classes for transformation from xml.etree.ElementTree objects
+to compact mappings, which use less memory than python dictionaries
+"""
+from collections.abc import Mapping
+import xml.etree.ElementTree as ElementTree
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from xmltodict3.xml_to_dict import XmlToDict
+
+
+class NodeShape:
+    """
+    Keys of compact nodes and positions of their values.
+        Nodes with the same keys share one instance
+    """
+    __slots__ = ('keys', 'positions')
+    _shapes = dict()
+    max_shapes = 10000
+
+    def __init__(self, keys: Tuple[str, ...]):
+        self.keys = keys
+        self.positions = {key: position for position, key in enumerate(keys)}
+
+    @classmethod
+    def get_shape(cls, keys: Tuple[str, ...]) -> 'NodeShape':
+        """
+        Get a shared instance for keys
+        :param keys: keys of a node
+        :return: NodeShape instance
+        """
+        shape = cls._shapes.get(keys)
+        if shape is None:
+            shape = cls(keys)
+            if len(cls._shapes) < cls.max_shapes:
+                cls._shapes[keys] = shape
+        return shape
+
+
+class CompactNode(Mapping):
+    """
+    Read-only mapping with node data.
+        Keys are kept in a shared NodeShape, so a node keeps
+        only a list of values
+    """
+    __slots__ = ('_shape', '_values')
+
+    def __init__(self, items: Iterable[Tuple[str, Any]] = ()):
+        """
+        Init instance
+        :param items: pairs of a key and a value
+        """
+        items = tuple(items)
+        self._shape = NodeShape.get_shape(tuple(key for key, _ in items))
+        self._values = [value for _, value in items]
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._shape.positions[key]]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """
+        Replace a value of an existing key
+        :param key: existing key
+        :param value: new value
+        """
+        self._values[self._shape.positions[key]] = value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._shape.keys)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return '{0}({1!r})'.format(self.__class__.__name__, self.to_dict())
+
+    def __getstate__(self) -> Tuple:
+        return self._shape.keys, self._values
+
+    def __setstate__(self, state: Tuple) -> None:
+        keys, self._values = state
+        self._shape = NodeShape.get_shape(keys)
+
+    def to_dict(self) -> Dict:
+        """
+        Convert the node and all nested nodes to python dicts
+        :return: node data as a python dict
+        """
+        result = dict()
+        stack = [(self, result)]
+        while stack:
+            node, node_dict = stack.pop()
+            for key, value in zip(node._shape.keys, node._values):
+                node_dict[key] = self._copy_value(value, stack)
+        return result
+
+    @staticmethod
+    def _copy_value(value: Any, stack: list) -> Any:
+        """
+        Replace compact nodes in a value by empty dicts,
+            which are filled later from the stack
+        :param value: value of a node
+        :param stack: stack of nodes to convert
+        :return: copied value
+        """
+        if isinstance(value, CompactNode):
+            value_dict = dict()
+            stack.append((value, value_dict))
+            return value_dict
+        if isinstance(value, list):
+            return [CompactNode._copy_value(item, stack) for item in value]
+        return value
+
+
+class XmlToCompactDict(XmlToDict):
+    """
+    Class to work with xml.etree.ElementTree objects.
+        The result is built from CompactNode instances instead of dicts.
+        Conversion plans and statistics are not used
+    """
+    def get_dict(self) -> CompactNode:
+        """
+        Extract data from xml.etree.ElementTree object
+            which has been passed during initialization of an instance
+        :return: extracted data as a CompactNode
+        """
+        tag = self.get_tag()
+        value = self._get_node_value(self.node)
+        return CompactNode(((tag, value),))
+
+    @staticmethod
+    def _group_single_node_data(node_data: Dict) -> Any:
+        """
+        Group node data if node data has just a value,
+            otherwise convert it to a CompactNode
+        :param node_data: node data to group
+        :return: grouped node data
+        """
+        node_data = XmlToDict._group_single_node_data(node_data)
+        if isinstance(node_data, dict):
+            node_data = CompactNode(node_data.items())
+        return node_data
+
+    @staticmethod
+    def _group_leaf_data(leaf_data: Any) -> Any:
+        """
+        Convert data of a transformed node with attributes
+            to a CompactNode
+        :param leaf_data: data of the node from a transformer
+        :return: grouped node data
+        """
+        if type(leaf_data) is dict:
+            leaf_data = CompactNode(leaf_data.items())
+        return leaf_data
+
+    def _get_dict_from_node_with_children(
+            self, node: ElementTree.Element,
+            children_data: Dict) -> CompactNode:
+        """
+        Get node attributes and data from child nodes
+        :param node: XML object
+        :param children_data: collected data from child nodes
+        :return: node data
+        """
+        value = super()._get_dict_from_node_with_children(
+            node, children_data)
+        return CompactNode(value.items())
@@ -0,0 +1,274 @@
+"""
+Classes for transformation from python dictionary to XML
+"""
+from collections.abc import Mapping
+import io
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from xmltodict3.transformers import PullTransformers
+
+
+class DictToXml:
+    """
+    Class to write python dicts in the format of XmlToDict.get_dict
+        as XML: keys which start with "@" are attributes,
+        "#text" is text of a node, lists are repeated nodes
+        and None is an empty node.
+        Tags like "{uri}tag" are written with generated prefixes
+    """
+    buffer_size = 1 << 16
+
+    def __init__(self, data: Dict, xml_declaration: bool = False):
+        """
+        Init instance
+        :param data: python dict with a root tag as a key
+        :param xml_declaration: writing of the XML declaration
+        """
+        self.data = data
+        self.xml_declaration = xml_declaration
+        self._pull_transformers = None
+        self._prefixes = dict()
+
+    def get_xml(self) -> str:
+        """
+        Convert data which has been passed during initialization
+            of an instance to XML
+        :return: string with XML
+        """
+        return ''.join(self.iter_xml())
+
+    def write(self, file_object: io.IOBase,
+              encoding: Optional[str] = None) -> None:
+        """
+        Write XML into a file object (a file, a socket file, etc.)
+            in parts of about buffer_size characters,
+            so the whole XML is never kept in memory
+        :param file_object: file object with method "write"
+        :param encoding: encoding of bytes which are written,
+            strings are written if it is not passed
+        """
+        buffer = list()
+        buffer_length = 0
+        for part in self.iter_xml(encoding):
+            buffer.append(part)
+            buffer_length += len(part)
+            if buffer_length >= self.buffer_size:
+                self._write_buffer(file_object, buffer, encoding)
+                buffer = list()
+                buffer_length = 0
+        self._write_buffer(file_object, buffer, encoding)
+
+    @staticmethod
+    def _write_buffer(file_object: io.IOBase, buffer: List[str],
+                      encoding: Optional[str]) -> None:
+        """
+        Write collected parts of XML into a file object
+        :param file_object: file object with method "write"
+        :param buffer: parts of XML
+        :param encoding: encoding of bytes or None for strings
+        """
+        if not buffer:
+            return
+        data = ''.join(buffer)
+        if encoding is not None:
+            data = data.encode(encoding, 'xmlcharrefreplace')
+        file_object.write(data)
+
+    def iter_xml(self, encoding: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate XML in parts. Nodes are walked with an explicit stack,
+            so the depth of data is not limited
+            by the recursion limit of the interpreter
+        :param encoding: encoding for the XML declaration
+        :return: iterator over parts of XML
+        """
+        if self.xml_declaration:
+            yield '<?xml version="1.0" encoding="{0}"?>'.format(
+                encoding or 'utf-8')
+        stack = [(None, self._iter_children(self.data), frozenset())]
+        while stack:
+            tag, children, namespaces = stack[-1]
+            for child_tag, child_value in children:
+                if type(child_value) is str and child_tag[0] != '{':
+                    yield '<{0}>{1}</{0}>'.format(
+                        child_tag, self._escape_text(child_value) or ' ')
+                    continue
+                start_tag, text, child_nodes, child_namespaces = \
+                    self._get_node_parts(child_tag, child_value, namespaces)
+                if child_nodes is None:
+                    if text is None:
+                        yield start_tag[:-1] + '/>'
+                    else:
+                        yield start_tag + text + '</{0}>'.format(
+                            self._get_name(child_tag))
+                    continue
+                yield start_tag if text is None else start_tag + text
+                stack.append((child_tag, child_nodes, child_namespaces))
+                break
+            else:
+                stack.pop()
+                if tag is not None:
+                    yield '</{0}>'.format(self._get_name(tag))
+
+    def _get_node_parts(
+            self, tag: str, value: Any, namespaces: frozenset
+            ) -> Tuple[str, Optional[str], Optional[Iterator], frozenset]:
+        """
+        Prepare a node for writing
+        :param tag: tag of the node
+        :param value: value of the node from the dict
+        :param namespaces: namespaces declared by ancestors
+        :return: start tag, escaped text, iterator over child nodes
+            or None if there are no child nodes, and declared namespaces
+        """
+        attributes = dict()
+        child_nodes = None
+        if isinstance(value, Mapping):
+            text = value.get('#text')
+            has_children = False
+            for key, item in value.items():
+                if key.startswith('@'):
+                    attributes[key[1:]] = item
+                elif key != '#text':
+                    has_children = True
+            if has_children:
+                child_nodes = self._iter_children(value)
+        else:
+            text = value
+        if text is not None and not isinstance(text, str):
+            text = self._get_text(text, attributes)
+        namespaces, declarations = self._get_namespace_declarations(
+            tag, attributes, namespaces)
+        parts = ['<', self._get_name(tag)]
+        for name, attribute_value in attributes.items():
+            parts.append(' {0}="{1}"'.format(
+                self._get_name(name),
+                self._escape_attribute(str(attribute_value))))
+        parts.extend(declarations)
+        parts.append('>')
+        if text is not None:
+            # An empty element is read as None and text is stripped,
+            # so an empty string is written as a space
+            text = self._escape_text(text) or ' '
+        return ''.join(parts), text, child_nodes, namespaces
+
+    def _get_text(self, value: Any, attributes: Dict[str, Any]) -> str:
+        """
+        Convert a python value to text, using reverse transformation.
+            The key of a transformer is written into the attribute
+            of the transformer ("type" by default)
+        :param value: python value
+        :param attributes: attributes of the node
+        :return: text of the node
+        """
+        if self._pull_transformers is not None:
+            transformer = self._pull_transformers.get_reverse_transformer(
+                value)
+            if transformer is not None:
+                attributes.setdefault(transformer.attribute, transformer.key)
+                return transformer.get_text(value)
+        return str(value)
+
+    @staticmethod
+    def _iter_children(value: Dict) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over child nodes of a node. Lists are repeated nodes
+        :param value: value of a node
+        :return: iterator over pairs of a tag and a value
+        """
+        for key, item in value.items():
+            if key.startswith('@') or key == '#text':
+                continue
+            if isinstance(item, list):
+                for list_item in item:
+                    yield key, list_item
+            else:
+                yield key, item
+
+    def _get_namespace_declarations(
+            self, tag: str, attributes: Dict[str, Any],
+            namespaces: frozenset) -> Tuple[frozenset, List[str]]:
+        """
+        Get declarations of namespaces of a tag and attributes
+            which have not been declared by ancestors
+        :param tag: tag of the node
+        :param attributes: attributes of the node
+        :param namespaces: namespaces declared by ancestors
+        :return: namespaces declared for child nodes and declarations
+        """
+        declarations = list()
+        for name in (tag, *attributes):
+            if not name.startswith('{'):
+                continue
+            namespace = name[1:name.index('}')]
+            if namespace in namespaces:
+                continue
+            namespaces = namespaces | {namespace}
+            declarations.append(' xmlns:{0}="{1}"'.format(
+                self._get_prefix(namespace),
+                self._escape_attribute(namespace)))
+        return namespaces, declarations
+
+    def _get_name(self, name: str) -> str:
+        """
+        Replace a namespace in a name like "{uri}tag" by a prefix
+        :param name: name of a tag or an attribute
+        :return: name for XML
+        """
+        if not name.startswith('{'):
+            return name
+        namespace, local_name = name[1:].split('}', 1)
+        return '{0}:{1}'.format(self._get_prefix(namespace), local_name)
+
+    def _get_prefix(self, namespace: str) -> str:
+        """
+        Get a generated prefix of a namespace
+        :param namespace: URI of a namespace
+        :return: prefix
+        """
+        prefix = self._prefixes.get(namespace)
+        if prefix is None:
+            prefix = 'ns{0}'.format(len(self._prefixes))
+            self._prefixes[namespace] = prefix
+        return prefix
+
+    @staticmethod
+    def _escape_text(text: str) -> str:
+        """
+        Escape special characters of text
+        :param text: text of a node
+        :return: escaped text
+        """
+        if '&' in text:
+            text = text.replace('&', '&amp;')
+        if '<' in text:
+            text = text.replace('<', '&lt;')
+        if '>' in text:
+            text = text.replace('>', '&gt;')
+        return text
+
+    @staticmethod
+    def _escape_attribute(value: str) -> str:
+        """
+        Escape special characters of a value of an attribute
+        :param value: value of an attribute
+        :return: escaped value
+        """
+        value = DictToXml._escape_text(value)
+        if '"' in value:
+            value = value.replace('"', '&quot;')
+        for character in '\n\r\t':
+            if character in value:
+                value = value.replace(
+                    character, '&#{0};'.format(ord(character)))
+        return value
+
+    def use_pull_transformers(
+            self, pull_transformers: PullTransformers) -> None:
+        """
+        Set up pull_transformation for reverse transformation
+            of python values to text
+        :param pull_transformers: PullTransformers instance
+        """
+        if isinstance(pull_transformers, PullTransformers):
+            self._pull_transformers = pull_transformers
@@ -1,2 +1,6 @@
 class TransformerException(Exception):
     pass
+
+
+class PlanMismatchException(Exception):
+    pass
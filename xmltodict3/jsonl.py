@@ -0,0 +1,146 @@
+"""
+Export of XML to newline-delimited JSON (JSONL)
+"""
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+import datetime
+import itertools
+import json
+from typing import Any, Callable, Dict, IO, Iterable, List, Optional, Union
+
+from xmltodict3.transformers import PullTransformers
+from xmltodict3.xml_to_dict import XmlFileToDict
+
+
+Encoder = Callable[[Any], Union[str, bytes]]
+
+
+def get_json_value(value: Any) -> Any:
+    """
+    Convert values which are not supported by json:
+        datetime values are written in ISO-8601,
+        mappings (CompactNode, LazyNode) are written as objects
+    :param value: python value
+    :return: value for json
+    """
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError('{0} is not JSON serializable'.format(type(value)))
+
+
+def encode_json(value: Any) -> str:
+    """
+    Default encoder of records
+    :param value: python value
+    :return: JSON
+    """
+    return json.dumps(value, ensure_ascii=False, default=get_json_value)
+
+
+def export_jsonl(file_path: str, output: Union[str, IO],
+                 path: Optional[str] = None,
+                 ignore_namespace: bool = False,
+                 pull_transformers: Optional[PullTransformers] = None,
+                 encoder: Optional[Encoder] = None,
+                 workers: int = 0, batch_size: int = 1000) -> int:
+    """
+    Convert every element matching the path in a XML file
+        into a line of JSON. The file is parsed incrementally,
+        so memory usage does not depend on the size of the file
+    >>> export_jsonl('catalog.xml', 'catalog.jsonl', 'catalog/product')
+    :param file_path: path to a XML file
+    :param output: path to a JSONL file or a binary file object
+    :param path: path of the records from the root,
+        for example "catalog/product". The root element is
+        a record if the path is not passed
+    :param ignore_namespace: removing namespace from tags
+    :param pull_transformers: PullTransformers instance
+    :param encoder: function which converts a record into JSON
+        (str or bytes), for example orjson.dumps.
+        encode_json is used by default
+    :param workers: number of worker processes for encoding,
+        records are encoded in the current process if it is 0
+    :param batch_size: number of records which are encoded at once
+    :return: number of written records
+    """
+    xml_file_to_dict = XmlFileToDict(
+        file_path, ignore_namespace=ignore_namespace)
+    xml_file_to_dict.use_pull_transformers(pull_transformers)
+    items = xml_file_to_dict.iter_items(path)
+    if isinstance(output, str):
+        with open(output, 'wb') as output_file:
+            return write_jsonl(
+                items, output_file, encoder, workers, batch_size)
+    return write_jsonl(items, output, encoder, workers, batch_size)
+
+
+def write_jsonl(items: Iterable[Dict], output_file: IO,
+                encoder: Optional[Encoder] = None,
+                workers: int = 0, batch_size: int = 1000) -> int:
+    """
+    Write records into a binary file object as JSONL.
+        Worker processes get records in batches and the number of
+        batches in progress is limited, so memory usage is bounded
+    :param items: records
+    :param output_file: binary file object
+    :param encoder: function which converts a record into JSON,
+        it has to be picklable for worker processes
+    :param workers: number of worker processes for encoding,
+        records are encoded in the current process if it is 0
+    :param batch_size: number of records which are encoded at once
+    :return: number of written records
+    """
+    encoder = encoder or encode_json
+    batches = _get_batches(items, batch_size)
+    count = 0
+    if workers <= 0:
+        for batch in batches:
+            output_file.write(_encode_batch(batch, encoder))
+            count += len(batch)
+        return count
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = deque()
+        for batch in batches:
+            futures.append(executor.submit(_encode_batch, batch, encoder))
+            count += len(batch)
+            if len(futures) >= workers * 2:
+                output_file.write(futures.popleft().result())
+        while futures:
+            output_file.write(futures.popleft().result())
+    return count
+
+
+def _get_batches(items: Iterable[Dict],
+                 batch_size: int) -> Iterable[List[Dict]]:
+    """
+    Split records into batches
+    :param items: records
+    :param batch_size: number of records in a batch
+    :return: iterator over batches
+    """
+    items = iter(items)
+    batch = list(itertools.islice(items, batch_size))
+    while batch:
+        yield batch
+        batch = list(itertools.islice(items, batch_size))
+
+
+def _encode_batch(batch: List[Dict], encoder: Encoder) -> bytes:
+    """
+    Encode records into lines of JSON
+    :param batch: records
+    :param encoder: function which converts a record into JSON
+    :return: lines of JSON
+    """
+    lines = list()
+    for item in batch:
+        line = encoder(item)
+        if isinstance(line, str):
+            line = line.encode('utf-8')
+        lines.append(line)
+    lines.append(b'')
+    return b'\n'.join(lines)
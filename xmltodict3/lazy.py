@@ -0,0 +1,114 @@
+"""
+Lazy mappings over xml.etree.ElementTree objects,
+which convert data of nodes only when it is accessed
+"""
+from collections.abc import Mapping
+import xml.etree.ElementTree as ElementTree
+from typing import Any, Dict, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from xmltodict3.xml_to_dict import XmlToDict
+
+
+class LazyNode(Mapping):
+    """
+    Read-only mapping with data of a node with child nodes.
+        Child nodes and attributes are converted on first access
+        and the result is cached, so the mapping has the same
+        content as the dict from XmlToDict.get_dict
+    """
+    __slots__ = ('_node', '_xml_to_dict_node', '_children', '_values')
+
+    def __init__(self, node: ElementTree.Element,
+                 xml_to_dict_node: 'XmlToDict'):
+        """
+        Init instance
+        :param node: XML object with child nodes
+        :param xml_to_dict_node: XmlToDict instance
+            which options are used for conversion
+        """
+        self._node = node
+        self._xml_to_dict_node = xml_to_dict_node
+        self._children = None
+        self._values = dict()
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._values
+        if key in values:
+            return values[key]
+        children = self._get_children()
+        if key not in children:
+            raise KeyError(key)
+        value = self._get_value(children[key])
+        values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_children())
+
+    def __len__(self) -> int:
+        return len(self._get_children())
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._get_children()
+
+    def __repr__(self) -> str:
+        return '{0}(<{1}>)'.format(self.__class__.__name__, self._node.tag)
+
+    def to_dict(self) -> Dict:
+        """
+        Convert the node and all its descendants to python dicts
+        :return: node data as a python dict
+        """
+        return self._xml_to_dict_node._get_node_value(self._node)
+
+    def _get_children(self) -> Dict:
+        """
+        Group child nodes by tags and add attributes of the node
+            in the same order as XmlToDict.get_dict does
+        :return: lists of child nodes and values of attributes by keys
+        """
+        if self._children is None:
+            get_tag = self._xml_to_dict_node.get_tag_normalizer().get_tag
+            children = dict()
+            for child_node in self._node:
+                tag = get_tag(child_node.tag)
+                if tag in children:
+                    children[tag].append(child_node)
+                else:
+                    children[tag] = [child_node]
+            for attribute_name, attribute_value in self._node.attrib.items():
+                children['@' + attribute_name] = attribute_value
+            self._children = children
+        return self._children
+
+    def _get_value(self, child_data: Any) -> Any:
+        """
+        Convert child nodes with the same tag.
+            A single child node is converted into a value,
+            several child nodes are converted into a list
+        :param child_data: list of child nodes or value of attribute
+        :return: value of a key
+        """
+        if not isinstance(child_data, list):
+            return child_data
+        xml_to_dict_node = self._xml_to_dict_node
+        if len(child_data) == 1:
+            return get_lazy_value(child_data[0], xml_to_dict_node)
+        return [get_lazy_value(child_node, xml_to_dict_node)
+                for child_node in child_data]
+
+
+def get_lazy_value(node: ElementTree.Element,
+                   xml_to_dict_node: 'XmlToDict') -> Any:
+    """
+    Get lazy data of a node. Nodes without child nodes are
+        converted at once, other nodes are wrapped in LazyNode
+    :param node: XML object
+    :param xml_to_dict_node: XmlToDict instance
+        which options are used for conversion
+    :return: value of a node without children or LazyNode
+    """
+    if xml_to_dict_node._is_single_node(node):
+        return xml_to_dict_node._get_dict_from_single_node(node)
+    return LazyNode(node, xml_to_dict_node)
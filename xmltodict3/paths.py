@@ -0,0 +1,176 @@
+"""
+Selection of subtrees of XML by element paths
+"""
+import re
+import xml.etree.ElementTree as ElementTree
+from typing import Callable, Dict, FrozenSet, IO, Iterable, List, Tuple, Union
+
+Step = Tuple[str, bool]
+State = FrozenSet[Tuple[int, int]]
+
+
+class PathSelector:
+    """
+    Set of element paths which subtrees are converted.
+        A path is a simple subset of XPath: tags separated by "/",
+        "*" matches any tag and "//" matches any number of elements,
+        for example "catalog/product", "/catalog/*/name" or "//name".
+        Paths always start from the root
+    """
+    path_token_pattern = re.compile(r'//|/|(?:{[^}]*}|[^/])+')
+
+    def __init__(self, paths: Union[str, Iterable[str]]):
+        """
+        Init instance
+        :param paths: a path or paths of the elements to convert
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+        self.paths = [self.split_path(path) for path in paths]
+        self.initial_state = frozenset(
+            (path_index, 0) for path_index in range(len(self.paths)))
+        self.states = dict()
+
+    @classmethod
+    def split_path(cls, path: str) -> List[Step]:
+        """
+        Split a path into steps. Slashes inside of namespaces are ignored
+        >>> PathSelector.split_path('catalog//{http://a.com/ns}name')
+        [('catalog', False), ('{http://a.com/ns}name', True)]
+        :param path: path of the elements
+        :return: list of pairs of a tag and a flag of any depth
+        """
+        steps = list()
+        any_depth = False
+        for token in cls.path_token_pattern.findall(path):
+            if token == '//':
+                any_depth = True
+            elif token != '/':
+                steps.append((token, any_depth))
+                any_depth = False
+        if not steps:
+            raise ValueError('Path "{0}" has no tags'.format(path))
+        return steps
+
+    def get_next_state(self, state: State, tag: str) -> State:
+        """
+        Get a state of a child node from a state of its parent.
+            The state is a set of pairs of a path index and
+            a number of the matched steps of the path
+        :param state: state of the parent node
+        :param tag: tag of the child node
+        :return: state of the child node
+        """
+        key = (state, tag)
+        next_state = self.states.get(key)
+        if next_state is None:
+            next_state = set()
+            for path_index, step_index in state:
+                step_tag, any_depth = self.paths[path_index][step_index]
+                if any_depth:
+                    next_state.add((path_index, step_index))
+                if step_tag == '*' or step_tag == tag:
+                    next_state.add((path_index, step_index + 1))
+            next_state = frozenset(next_state)
+            self.states[key] = next_state
+        return next_state
+
+    def is_selected(self, state: State) -> bool:
+        """
+        Check that a node with the state matches with one of the paths
+        :param state: state of the node
+        :return: result of check
+        """
+        for path_index, step_index in state:
+            if step_index == len(self.paths[path_index]):
+                return True
+        return False
+
+    def get_selected_root(
+            self, source: Union[str, IO],
+            get_tag: Callable[[str], str]) -> ElementTree.Element:
+        """
+        Parse XML and build the tree which has only the selected
+            elements and their ancestors. Other elements are skipped
+            by the parser and are never created.
+            The root is kept even if nothing has been selected
+        :param source: a file path or a file object
+        :param get_tag: function which normalizes tags
+        :return: root of the tree
+        """
+        parser = ElementTree.XMLParser(
+            target=SelectingTreeBuilder(self, get_tag))
+        return ElementTree.parse(source, parser).getroot()
+
+
+class SelectingTreeBuilder:
+    """
+    Target of xml.etree.ElementTree.XMLParser which passes
+        the selected elements and their ancestors to TreeBuilder
+    """
+    def __init__(self, path_selector: PathSelector,
+                 get_tag: Callable[[str], str]):
+        """
+        Init instance
+        :param path_selector: PathSelector instance
+        :param get_tag: function which normalizes tags
+        """
+        self.path_selector = path_selector
+        self.get_tag = get_tag
+        self.tree_builder = ElementTree.TreeBuilder()
+        self.states = [path_selector.initial_state]
+        self.parents = list()
+        self.has_selected = [False]
+        self.depth = 0
+        self.subtree_depth = None
+        self.subtree_selected = False
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        self.depth += 1
+        if self.subtree_depth is not None:
+            if self.subtree_selected:
+                self.tree_builder.start(tag, attrib)
+            return
+        state = self.path_selector.get_next_state(
+            self.states[-1], self.get_tag(tag))
+        if not state and self.parents \
+                or self.path_selector.is_selected(state):
+            self.subtree_depth = self.depth
+            self.subtree_selected = bool(state)
+            if not state:
+                return
+            self.tree_builder.start(tag, attrib)
+        else:
+            self.states.append(state)
+            self.parents.append(self.tree_builder.start(tag, attrib))
+            self.has_selected.append(False)
+
+    def end(self, tag: str) -> None:
+        self.depth -= 1
+        subtree_depth = self.subtree_depth
+        if subtree_depth is not None and self.depth >= subtree_depth:
+            if self.subtree_selected:
+                self.tree_builder.end(tag)
+            return
+        if subtree_depth is not None:
+            self.subtree_depth = None
+            is_selected = self.subtree_selected
+            if not is_selected:
+                return
+            self.tree_builder.end(tag)
+        else:
+            self.states.pop()
+            node = self.tree_builder.end(tag)
+            self.parents.pop()
+            is_selected = self.has_selected.pop()
+            if not is_selected and self.parents:
+                self.parents[-1].remove(node)
+        if is_selected:
+            self.has_selected[-1] = True
+
+    def data(self, data: str) -> None:
+        if self.subtree_depth is None or self.subtree_selected:
+            self.tree_builder.data(data)
+
+    def close(self) -> ElementTree.Element:
+        return self.tree_builder.close()
@@ -0,0 +1,250 @@
+"""
+Classes to speed up transformation of records with the same structure
+from XML to python dictionary. A conversion plan is compiled
+from a sample element and converts elements with the same
+tags, attributes and cardinality of children without generic checks
+"""
+from collections import OrderedDict
+import sys
+import xml.etree.ElementTree as ElementTree
+from typing import Any, Callable, Dict, Hashable, List, Tuple, TYPE_CHECKING
+
+from xmltodict3.exceptions import PlanMismatchException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from xmltodict3.xml_to_dict import XmlToDict
+
+
+NodePlan = Callable[[ElementTree.Element, 'XmlToDict'], Any]
+
+
+class ConversionPlans:
+    """
+    LRU cache of conversion plans keyed by the shape of an element
+        (the tag, attribute names and tags of child nodes).
+        Elements which deviate from the plan of their shape deeper
+        than on the first level are converted in a generic way
+    """
+    def __init__(self, max_size: int = 128):
+        """
+        Init instance
+        :param max_size: max number of cached plans
+        """
+        self.max_size = max_size
+        self.plans = OrderedDict()
+
+    def get_node_value(self, xml_to_dict_node: 'XmlToDict') -> Any:
+        """
+        Extract data from the node of a XmlToDict instance,
+            using a cached plan or a new plan compiled from the node
+        :param xml_to_dict_node: XmlToDict instance
+        :return: node data
+        """
+        node = xml_to_dict_node.node
+        key = self.get_key(xml_to_dict_node)
+        node_plan = self.plans.get(key)
+        if node_plan is None:
+            node_plan = self._compile_or_none(xml_to_dict_node)
+            self._put_plan(key, node_plan)
+        else:
+            self.plans.move_to_end(key)
+
+        if node_plan is not None:
+            try:
+                return node_plan(node, xml_to_dict_node)
+            except PlanMismatchException:
+                pass
+        return xml_to_dict_node._get_node_value(node)
+
+    @staticmethod
+    def get_key(xml_to_dict_node: 'XmlToDict') -> Hashable:
+        """
+        Get the shape of the node of a XmlToDict instance
+            and options which are used for the compilation of a plan.
+            The tag normalizer and pull transformers are kept
+            with their versions, so a plan is not reused after
+            they have been changed
+        :param xml_to_dict_node: XmlToDict instance
+        :return: hashable key
+        """
+        node = xml_to_dict_node.node
+        tag_normalizer = xml_to_dict_node.get_tag_normalizer()
+        pull_transformers = xml_to_dict_node._pull_transformers
+        return (
+            tag_normalizer,
+            tag_normalizer.version,
+            pull_transformers,
+            pull_transformers.version
+            if pull_transformers is not None else None,
+            node.tag,
+            tuple(node.attrib),
+            tuple(child_node.tag for child_node in node),
+        )
+
+    def _put_plan(self, key: Hashable, node_plan: NodePlan) -> None:
+        """
+        Cache a plan, removing the least recently used plan
+            if the cache is full
+        :param key: shape of the node
+        :param node_plan: compiled plan or None
+        """
+        self.plans[key] = node_plan
+        if len(self.plans) > self.max_size:
+            self.plans.popitem(last=False)
+
+    def _compile_or_none(self, xml_to_dict_node: 'XmlToDict') -> NodePlan:
+        """
+        Compile a plan from the node of a XmlToDict instance.
+            None is returned if the node can not be converted
+            by a plan, for example if children with the same tag
+            are separated by other children
+        :param xml_to_dict_node: XmlToDict instance
+        :return: compiled plan or None
+        """
+        try:
+            return compile_plan(xml_to_dict_node.node, xml_to_dict_node)
+        except (PlanMismatchException, RecursionError):
+            return None
+
+    def clear(self) -> None:
+        """Remove all cached plans"""
+        self.plans.clear()
+
+
+def compile_plan(sample_node: ElementTree.Element,
+                 xml_to_dict_node: 'XmlToDict') -> NodePlan:
+    """
+    Compile a plan from a sample element.
+        Options (ignore_namespace, transformers) of the XmlToDict
+        instance are used by the plan
+    :param sample_node: XML object
+    :param xml_to_dict_node: XmlToDict instance
+    :return: function which extracts data from an element,
+        using a XmlToDict instance with the same options,
+        or raises PlanMismatchException
+    """
+    if xml_to_dict_node._is_single_node(sample_node):
+        return _compile_single_node_plan(sample_node, xml_to_dict_node)
+    return _compile_node_with_children_plan(sample_node, xml_to_dict_node)
+
+
+def _compile_single_node_plan(sample_node: ElementTree.Element,
+                              xml_to_dict_node: 'XmlToDict') -> NodePlan:
+    """
+    Compile a plan for a node without children.
+        A transformer of a node without attributes can be chosen
+        only by the tag, so it is chosen once for the plan.
+        Values of other nodes without attributes are interned
+        if pull transformers intern values
+    :param sample_node: XML object
+    :param xml_to_dict_node: XmlToDict instance
+    :return: compiled plan
+    """
+    attribute_names = sample_node.attrib.keys()
+    pull_transformers = xml_to_dict_node._pull_transformers
+    intern_values = pull_transformers is not None \
+        and pull_transformers.intern_values
+    leaf_function = None
+    if pull_transformers is not None and not attribute_names:
+        leaf_function = pull_transformers.get_leaf_function(
+            xml_to_dict_node._get_node_tag(sample_node), sample_node.attrib)
+
+    if not attribute_names and leaf_function is not None:
+        def transformed_single_node_plan(
+                node: ElementTree.Element,
+                xml_to_dict_node: 'XmlToDict') -> Any:
+            if len(node) or node.attrib:
+                raise PlanMismatchException
+            return xml_to_dict_node._group_leaf_data(leaf_function(
+                node.attrib, xml_to_dict_node._get_value(node)))
+        return transformed_single_node_plan
+
+    if not attribute_names:
+        def single_node_plan(node: ElementTree.Element,
+                             xml_to_dict_node: 'XmlToDict') -> Any:
+            if len(node) or node.attrib:
+                raise PlanMismatchException
+            value = node.text
+            if value is not None:
+                value = value.strip()
+                if intern_values:
+                    value = sys.intern(value)
+            return value
+        return single_node_plan
+
+    attribute_names = set(attribute_names)
+
+    def single_node_with_attributes_plan(
+            node: ElementTree.Element, xml_to_dict_node: 'XmlToDict') -> Any:
+        if len(node) or node.attrib.keys() != attribute_names:
+            raise PlanMismatchException
+        return xml_to_dict_node._get_dict_from_single_node(node)
+    return single_node_with_attributes_plan
+
+
+def _compile_node_with_children_plan(
+        sample_node: ElementTree.Element,
+        xml_to_dict_node: 'XmlToDict') -> NodePlan:
+    """
+    Compile a plan for a node with children. Children with the same tag
+        have to follow each other. Such children are converted to a list
+        if there are several of them in an element,
+        like in XmlToDict._group_children_data
+    :param sample_node: XML object
+    :param xml_to_dict_node: XmlToDict instance
+    :return: compiled plan
+    """
+    attribute_names = set(sample_node.attrib.keys())
+    child_groups = _get_child_groups(sample_node, xml_to_dict_node)
+
+    def node_with_children_plan(node: ElementTree.Element,
+                                xml_to_dict_node: 'XmlToDict') -> Dict:
+        if node.attrib.keys() != attribute_names:
+            raise PlanMismatchException
+        value = dict()
+        index = 0
+        count = len(node)
+        for raw_tag, tag, is_repeated, child_plan in child_groups:
+            if index >= count or node[index].tag != raw_tag:
+                raise PlanMismatchException
+            if not is_repeated:
+                value[tag] = child_plan(node[index], xml_to_dict_node)
+                index += 1
+                continue
+            items = list()
+            while index < count and node[index].tag == raw_tag:
+                items.append(child_plan(node[index], xml_to_dict_node))
+                index += 1
+            value[tag] = items if len(items) > 1 else items[0]
+        if index != count:
+            raise PlanMismatchException
+        for attribute_name, attribute_value in node.attrib.items():
+            value['@' + attribute_name] = attribute_value
+        return value
+    return node_with_children_plan
+
+
+def _get_child_groups(
+        sample_node: ElementTree.Element, xml_to_dict_node: 'XmlToDict'
+        ) -> List[Tuple[str, str, bool, NodePlan]]:
+    """
+    Group children of a sample node by runs of the same tag
+    :param sample_node: XML object
+    :param xml_to_dict_node: XmlToDict instance
+    :return: list of groups: a raw tag, a tag for the result,
+        a flag of repeated children and a plan for children
+    """
+    child_groups = list()
+    tags = set()
+    for child_node in sample_node:
+        tag = xml_to_dict_node._get_node_tag(child_node)
+        if child_groups and child_groups[-1][0] == child_node.tag:
+            child_groups[-1][2] = True
+            continue
+        if tag in tags:
+            raise PlanMismatchException(
+                'Children with tag "{0}" are not grouped'.format(tag))
+        tags.add(tag)
+        child_plan = compile_plan(child_node, xml_to_dict_node)
+        child_groups.append([child_node.tag, tag, False, child_plan])
+    return [tuple(child_group) for child_group in child_groups]
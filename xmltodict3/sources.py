@@ -0,0 +1,117 @@
+"""
+Sources of XML for parsers
+"""
+import bz2
+from contextlib import contextmanager
+import gzip
+import io
+import mmap
+import os
+from typing import Callable, Iterator, Optional, Union
+
+try:
+    import lzma
+except ImportError:  # pragma: no cover
+    lzma = None
+
+XmlSource = Union[str, io.IOBase]
+
+compression_openers = {
+    b'\x1f\x8b': gzip.open,
+    b'BZh': bz2.open,
+}
+if lzma is not None:
+    compression_openers[b'\xfd7zXZ\x00'] = lzma.open
+
+
+class MemoryMapFile(io.RawIOBase):
+    """
+    Read-only file object over a memory-mapped file.
+        Data is copied from the page cache once,
+        without buffers of a file object.
+        The memory map is released when the file is closed
+    """
+    def __init__(self, file_path: str):
+        """
+        Init instance
+        :param file_path: path to a XML file
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.position = 0
+        self.buffer = b''
+        if os.path.getsize(file_path):
+            with open(file_path, 'rb') as file:
+                self.buffer = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read the next part of the file
+        :param size: max size of the part,
+            all the rest of the file is read if it is negative
+        :return: part of the file, empty bytes at the end of the file
+        """
+        if self.closed:
+            raise ValueError('I/O operation on closed file')
+        start = self.position
+        if size is None or size < 0:
+            end = len(self.buffer)
+        else:
+            end = min(start + size, len(self.buffer))
+        if start >= end:
+            return b''
+        self.position = end
+        return self.buffer[start:end]
+
+    def readinto(self, buffer: bytearray) -> int:
+        """
+        Read the next part of the file into a buffer
+        :param buffer: writable buffer
+        :return: number of read bytes
+        """
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        """
+        Release the memory map
+        """
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        super().close()
+
+
+def get_compression_opener(
+        file_path: str) -> Optional[Callable[[str, str], io.IOBase]]:
+    """
+    Detect compression of a file by magic bytes
+        (gzip, bzip2 and xz are supported)
+    :param file_path: path to a file
+    :return: function which opens the compressed file
+        or None if the file is not compressed
+    """
+    with open(file_path, 'rb') as file:
+        beginning = file.read(6)
+    for magic_bytes, opener in compression_openers.items():
+        if beginning.startswith(magic_bytes):
+            return opener
+    return None
+
+
+@contextmanager
+def closing_source(source: XmlSource) -> Iterator[XmlSource]:
+    """
+    Close a file object after using. File paths are left as they are
+    :param source: a file path or a file object
+    :return: the same source
+    """
+    try:
+        yield source
+    finally:
+        if not isinstance(source, str):
+            source.close()
@@ -0,0 +1,239 @@
+"""
+Classes to collect statistics of transformation from XML
+to python dictionary
+"""
+from collections import defaultdict
+import functools
+import time
+import xml.etree.ElementTree as ElementTree
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple)
+
+from xmltodict3.transformers import PullTransformers
+
+
+class TransformerStats:
+    """
+    Statistics of calls of transformers with the same key.
+        Errors are exceptions raised by transformers, so errors
+        of transformers with ignore_errors are not counted
+    """
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.errors = 0
+
+    def as_dict(self) -> Dict:
+        return {'calls': self.calls, 'time': self.time,
+                'errors': self.errors}
+
+
+class ConversionStats:
+    """
+    Statistics of conversions: time of parsing XML,
+        time of conversion, number of nodes, max depth
+        and statistics of transformers by keys.
+        Statistics are collected only by conversions
+        which an instance is passed to, using use_stats
+    """
+    def __init__(self, callback: Optional[Callable[
+            ['ConversionStats'], Any]] = None):
+        """
+        Init instance
+        :param callback: function which is called with the instance
+            after every conversion of a node
+        """
+        self.callback = callback
+        self.parse_time = 0.0
+        self.conversion_time = 0.0
+        self.node_count = 0
+        self.max_depth = 0
+        self.transformers = defaultdict(TransformerStats)
+        self._instrumented_pull_transformers = dict()
+
+    def as_dict(self) -> Dict:
+        """
+        Get statistics as a python dict
+        :return: statistics
+        """
+        return {
+            'parse_time': self.parse_time,
+            'conversion_time': self.conversion_time,
+            'node_count': self.node_count,
+            'max_depth': self.max_depth,
+            'transformers': {
+                key: transformer_stats.as_dict()
+                for key, transformer_stats in self.transformers.items()},
+        }
+
+    def measure_events(self, events: Iterable) -> Iterator:
+        """
+        Measure time of getting every item from the iterator
+            as time of parsing
+        :param events: iterator over events of a parser
+        :return: iterator over the same events
+        """
+        events = iter(events)
+        while True:
+            start = time.perf_counter()
+            try:
+                event = next(events)
+            except StopIteration:
+                return
+            finally:
+                self.parse_time += time.perf_counter() - start
+            yield event
+
+    def add_nodes(self, root_node: ElementTree.Element,
+                  root_depth: int = 1) -> None:
+        """
+        Count nodes and max depth of the converted tree
+        :param root_node: XML object
+        :param root_depth: depth of the root node in a document
+        """
+        stack = [(root_node, root_depth)]
+        while stack:
+            node, depth = stack.pop()
+            self.node_count += 1
+            if depth > self.max_depth:
+                self.max_depth = depth
+            stack.extend((child_node, depth + 1) for child_node in node)
+
+    def instrument(self, pull_transformers: PullTransformers
+                   ) -> 'InstrumentedPullTransformers':
+        """
+        Wrap pull transformers to collect statistics of transformers.
+            The wrapper is refreshed if pull transformers have been
+            changed since the previous conversion
+        :param pull_transformers: PullTransformers instance
+        :return: PullTransformers instance with the same transformers
+        """
+        key = id(pull_transformers)
+        instrumented = self._instrumented_pull_transformers.get(key)
+        if instrumented is None \
+                or instrumented.pull_transformers is not pull_transformers:
+            instrumented = self._instrumented_pull_transformers[key] = \
+                InstrumentedPullTransformers(pull_transformers, self)
+        elif instrumented.version != pull_transformers.version:
+            instrumented.refresh()
+        return instrumented
+
+    def handle_conversion(self) -> None:
+        """Call the callback after a conversion"""
+        if self.callback is not None:
+            self.callback(self)
+
+
+class InstrumentedPullTransformers(PullTransformers):
+    """PullTransformers which collect statistics of transformers"""
+    def __init__(self, pull_transformers: PullTransformers,
+                 stats: ConversionStats):
+        super().__init__()
+        self.pull_transformers = pull_transformers
+        self.stats = stats
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Copy transformers and settings of wrapped pull transformers
+            and rebuild the dispatch table
+        """
+        pull_transformers = self.pull_transformers
+        self.transformers = pull_transformers.transformers
+        self.batch_mode = pull_transformers.batch_mode
+        self.intern_values = pull_transformers.intern_values
+        self.executor = pull_transformers.executor
+        self.chunk_size = pull_transformers.chunk_size
+        self.compile_dispatch_table()
+        self.version = pull_transformers.version
+
+    def transform_node(self, node_data: Dict) -> Dict:
+        transformer = self.get_node_data_transformer(node_data)
+        if transformer is None:
+            return self.pull_transformers.transform_node(node_data)
+        transformer_stats = self.stats.transformers[transformer.key]
+        transformer_stats.calls += 1
+        start = time.perf_counter()
+        try:
+            return self.pull_transformers.transform_node(node_data)
+        except Exception:
+            transformer_stats.errors += 1
+            raise
+        finally:
+            transformer_stats.time += time.perf_counter() - start
+
+    def get_leaf_function(
+            self, tag: Optional[str], attributes: Dict[str, str]
+            ) -> Optional[Callable[[Dict[str, str], Optional[str]], Any]]:
+        transformer = self.get_leaf_transformer(tag, attributes)
+        if transformer is None:
+            return None
+        return functools.partial(
+            self._transform_leaf, transformer.key,
+            self.pull_transformers.get_leaf_function(tag, attributes))
+
+    def _transform_leaf(
+            self, key: str,
+            leaf_function: Callable[[Dict[str, str], Optional[str]], Any],
+            attributes: Dict[str, str], text: Optional[str]) -> Any:
+        """
+        Transform a node, collecting statistics of the transformer
+        :param key: key of the transformer
+        :param leaf_function: function of pull transformers
+        :param attributes: attributes of the node without "@"
+        :param text: text of the node
+        :return: data of the node
+        """
+        transformer_stats = self.stats.transformers[key]
+        transformer_stats.calls += 1
+        start = time.perf_counter()
+        try:
+            return leaf_function(attributes, text)
+        except Exception:
+            transformer_stats.errors += 1
+            raise
+        finally:
+            transformer_stats.time += time.perf_counter() - start
+
+    def transform_nodes_with_key(
+            self, key: Optional[str], node_data_list: List[Dict]) -> None:
+        if self.get_transformer(key) is None:
+            return
+        transformer_stats = self.stats.transformers[key]
+        transformer_stats.calls += len(node_data_list)
+        start = time.perf_counter()
+        try:
+            self.pull_transformers.transform_nodes_with_key(
+                key, node_data_list)
+        except Exception:
+            transformer_stats.errors += 1
+            raise
+        finally:
+            transformer_stats.time += time.perf_counter() - start
+
+    def transform_leaves_with_key(
+            self, key: str,
+            leaves: List[Tuple[Dict[str, str], Optional[str]]]
+            ) -> List[Any]:
+        transformer_stats = self.stats.transformers[key]
+        transformer_stats.calls += len(leaves)
+        start = time.perf_counter()
+        try:
+            return self.pull_transformers.transform_leaves_with_key(
+                key, leaves)
+        except Exception:
+            transformer_stats.errors += 1
+            raise
+        finally:
+            transformer_stats.time += time.perf_counter() - start
+
+    def submit_leaves_with_key(
+            self, key: str,
+            leaves: List[Tuple[Dict[str, str], Optional[str]]]
+            ) -> Callable[[], List[Any]]:
+        """
+        Pass nodes to the executor. Only calls are counted,
+            because transformers work in other threads or processes
+        """
+        self.stats.transformers[key].calls += len(leaves)
+        return self.pull_transformers.submit_leaves_with_key(key, leaves)
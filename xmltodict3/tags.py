@@ -0,0 +1,103 @@
+"""
+Classes to normalize tags of XML elements
+during transformation from XML to python dictionary
+"""
+import sys
+from typing import Dict, Optional
+
+
+class TagNormalizer:
+    """
+    Memo from raw tags of xml.etree.ElementTree objects
+        ("{namespace}tag") to tags of the result.
+        Every raw tag is normalized once, so an instance should be
+        shared between conversions. Normalized tags are interned
+    """
+    _default_tag_normalizers = dict()
+
+    def __init__(self, ignore_namespace: bool = False,
+                 namespaces: Optional[Dict[str, str]] = None,
+                 max_size: int = 10000):
+        """
+        Init instance
+        >>> tag_normalizer = TagNormalizer(
+        ...     namespaces={'http://www.w3.org/2001/XMLSchema': 'xs'})
+        >>> tag_normalizer.get_tag('{http://www.w3.org/2001/XMLSchema}item')
+        'xs:item'
+        :param ignore_namespace: removing namespace from tags
+        :param namespaces: mapping from namespaces to prefixes,
+            which replace namespaces in tags. An empty prefix removes
+            a namespace
+        :param max_size: max number of normalized tags to keep
+        """
+        self.ignore_namespace = ignore_namespace
+        self.namespaces = dict(namespaces or dict())
+        self.max_size = max_size
+        self.tags = dict()
+        self.version = 0
+
+    @classmethod
+    def get_default(cls, ignore_namespace: bool = False) -> 'TagNormalizer':
+        """
+        Get an instance which is shared by all conversions
+            without own instance
+        :param ignore_namespace: removing namespace from tags
+        :return: TagNormalizer instance
+        """
+        if ignore_namespace not in cls._default_tag_normalizers:
+            cls._default_tag_normalizers[ignore_namespace] = cls(
+                ignore_namespace=ignore_namespace)
+        return cls._default_tag_normalizers[ignore_namespace]
+
+    def set_namespaces(self, namespaces: Dict[str, str]) -> None:
+        """
+        Set mapping from namespaces to prefixes.
+            Normalized tags are removed and the version is increased
+        :param namespaces: mapping from namespaces to prefixes
+        """
+        self.namespaces = dict(namespaces)
+        self.tags.clear()
+        self.version += 1
+
+    def set_ignore_namespace(self, ignore_namespace: bool) -> None:
+        """
+        Set removing namespace from tags.
+            Normalized tags are removed and the version is increased
+        :param ignore_namespace: removing namespace from tags
+        """
+        self.ignore_namespace = ignore_namespace
+        self.tags.clear()
+        self.version += 1
+
+    def get_tag(self, raw_tag: str) -> str:
+        """
+        Get a normalized tag
+        :param raw_tag: tag of xml.etree.ElementTree object
+        :return: a tag
+        """
+        try:
+            return self.tags[raw_tag]
+        except KeyError:
+            pass
+        if len(self.tags) >= self.max_size:
+            self.tags.clear()
+        tag = self.tags[raw_tag] = sys.intern(self.normalize_tag(raw_tag))
+        return tag
+
+    def normalize_tag(self, raw_tag: str) -> str:
+        """
+        Replace or remove namespace of a tag
+        :param raw_tag: tag of xml.etree.ElementTree object
+        :return: a tag
+        """
+        if raw_tag[:1] != '{' or '}' not in raw_tag:
+            return raw_tag
+        namespace, tag = raw_tag[1:].split('}', 1)
+        if not namespace:
+            return raw_tag
+        if namespace in self.namespaces:
+            prefix = self.namespaces[namespace]
+            return '{0}:{1}'.format(prefix, tag) if prefix else tag
+        if self.ignore_namespace:
+            return tag
+        return raw_tag
@@ -4,14 +4,29 @@ during transformation from XML to python dictionary
 """
 from abc import ABC, abstractmethod
 import datetime
-from typing import Dict, Any, Optional, Union
+import functools
+from collections import defaultdict, OrderedDict
+from concurrent.futures import Executor, Future
+import re
+import sys
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 
 from xmltodict3.exceptions import TransformerException
 
 
 class AbstractTransformer(ABC):
-    """Abstract class for implementation transformers"""
+    """
+    Abstract class for implementation transformers.
+        A transformer is chosen for a node if the attribute
+        of the transformer ("type" by default) has the value of the key
+        or if the tag of the node is in tags of the transformer
+    """
     key = None
+    value_type = None
+    attribute = 'type'
+    tags = ()
+    node_data_hooks = ('transform_node', 'check_node_data', 'get_value',
+                       'get_safe_value', 'remove_type_from_node_data')
 
     def __init__(self, ignore_errors: bool = False,
                  removing_types: bool = False):
@@ -27,8 +42,150 @@ class AbstractTransformer(ABC):
             node_data = self.remove_type_from_node_data(node_data)
         return node_data
 
+    def transform_nodes(self, node_data_list: List[Dict]) -> None:
+        """
+        Transform several nodes in place
+        :param node_data_list: list of node data
+        """
+        for node_data in node_data_list:
+            self.transform_node(node_data)
+
+    def transform_leaf(self, attributes: Dict[str, str],
+                       text: Optional[str]) -> Any:
+        """
+        Transform a node without child nodes which has been chosen
+            for the transformer, building its data for the result
+        :param attributes: attributes of the node without "@"
+        :param text: text of the node
+        :return: data of the node, see get_leaf_value
+        """
+        try:
+            value = self.get_node_value(attributes, text)
+        except TransformerException:
+            if not self.ignore_errors:
+                raise
+            value = text
+        return self.get_leaf_value(attributes, value)
+
+    def transform_leaf_node_data(self, attributes: Dict[str, str],
+                                 text: Optional[str]) -> Any:
+        """
+        Transform a node without child nodes through node data,
+            calling transform_node and methods of node data.
+            It is used for transformers which override them
+        :param attributes: attributes of the node without "@"
+        :param text: text of the node
+        :return: data of the node
+        """
+        return self.group_node_data(self.transform_node(
+            self.get_leaf_node_data(attributes, text)))
+
+    def uses_node_data_hooks(self) -> bool:
+        """
+        Check that methods of node data (node_data_hooks) are
+            overridden, so nodes have to be transformed through node data
+        :return: result of check
+        """
+        transformer_class = type(self)
+        return any(
+            getattr(transformer_class, method_name)
+            is not getattr(AbstractTransformer, method_name)
+            for method_name in self.node_data_hooks)
+
+    @staticmethod
+    def get_leaf_node_data(attributes: Dict[str, str],
+                           text: Optional[str]) -> Dict:
+        """
+        Build node data of a node without child nodes
+        :param attributes: attributes of the node without "@"
+        :param text: text of the node
+        :return: node data
+        """
+        node_data = {'@' + name: value for name, value in attributes.items()}
+        node_data['#text'] = text
+        return node_data
+
+    @staticmethod
+    def group_node_data(node_data: Any) -> Any:
+        """
+        Group node data if node data has just a value
+        :param node_data: transformed node data
+        :return: grouped node data
+        """
+        if isinstance(node_data, dict) and len(node_data) == 1 \
+                and '#text' in node_data:
+            return node_data['#text']
+        return node_data
+
+    def transform_leaves(
+            self, leaves: List[Tuple[Dict[str, str], Optional[str]]]
+            ) -> List[Any]:
+        """
+        Transform several nodes like transform_leaf
+        :param leaves: pairs of attributes and text of nodes
+        :return: data of the nodes
+        """
+        get_leaf_value = self.get_leaf_value
+        return [get_leaf_value(attributes, value) for (attributes, _), value
+                in zip(leaves, self.get_leaf_values(leaves))]
+
+    def get_leaf_values(
+            self, leaves: List[Tuple[Dict[str, str], Optional[str]]]
+            ) -> List[Any]:
+        """
+        Get transformed values of several nodes. If errors are ignored,
+            the value of a node which can not be transformed is its text
+        :param leaves: pairs of attributes and text of nodes
+        :return: transformed values
+        """
+        values = list()
+        for attributes, text in leaves:
+            try:
+                values.append(self.get_node_value(attributes, text))
+            except TransformerException:
+                if not self.ignore_errors:
+                    raise
+                values.append(text)
+        return values
+
+    def get_node_value(self, attributes: Dict[str, str],
+                       text: Optional[str]) -> Any:
+        """
+        Get a transformed value of a node
+        :param attributes: attributes of the node without "@"
+        :param text: text of the node
+        :return: transformed value
+        """
+        return self.get_value(self.get_leaf_node_data(attributes, text))
+
+    def get_leaf_value(self, attributes: Dict[str, str], value: Any) -> Any:
+        """
+        Build data of a transformed node for the result. The value
+            is returned as is if the node has no other attributes than
+            the attribute of the key and types are removed,
+            otherwise node data with attributes is built
+        :param attributes: attributes of the node without "@"
+        :param value: transformed value
+        :return: data of the node
+        """
+        if not attributes:
+            return value
+        if not self.removing_types:
+            node_data = {'@' + name: attribute_value
+                         for name, attribute_value in attributes.items()}
+        elif len(attributes) == 1 \
+                and attributes.get(self.attribute) == self.key:
+            return value
+        else:
+            node_data = {'@' + name: attribute_value
+                         for name, attribute_value in attributes.items()
+                         if name != self.attribute
+                         or attribute_value != self.key}
+        node_data['#text'] = value
+        return node_data
+
     def check_node_data(self, node_data: Dict) -> bool:
-        if node_data.get("@type") != self.key:
+        if node_data.get('@' + self.attribute) != self.key:
             return False
         if "#text" not in node_data:
             return False
@@ -52,9 +209,26 @@ class AbstractTransformer(ABC):
     def get_value_or_raise_exception(self, node_data: Dict) -> Any:
         pass
 
+    def check_value(self, value: Any) -> bool:
+        """
+        Check that a python value can be written back to XML
+            by the transformer (reverse transformation)
+        :param value: python value
+        :return: result of check
+        """
+        return self.value_type is not None and type(value) is self.value_type
+
+    def get_text(self, value: Any) -> str:
+        """
+        Convert a python value back to text of a node
+        :param value: python value
+        :return: text of a node
+        """
+        return str(value)
+
     def remove_type_from_node_data(self, node_data: Dict) -> Dict:
         if self.removing_types:
-            del node_data["@type"]
+            del node_data['@' + self.attribute]
         return node_data
 
     def set_ignore_errors(self, ignore_errors: bool) -> None:
@@ -63,21 +237,145 @@ class AbstractTransformer(ABC):
     def set_removing_types(self, removing_types: bool) -> None:
         self.removing_types = removing_types
 
+    def set_tags(self, *tags: str) -> None:
+        """
+        Set tags of nodes which are transformed whatever attributes
+            they have. Tags are compared with tags of the result
+            (without namespaces if they are ignored). Tags of a transformer
+            which has been added to PullTransformers are set
+            by PullTransformers.set_tags
+        :param tags: tags of nodes
+        """
+        self.tags = tags
+
+
+class AbstractTextTransformer(AbstractTransformer):
+    """
+    Abstract class for implementation transformers which use only
+        text of a node, so values are transformed without node data
+    """
+    def __init__(self, ignore_errors: bool = False,
+                 removing_types: bool = False):
+        super().__init__(ignore_errors=ignore_errors,
+                         removing_types=removing_types)
+        self.text_only = type(self).get_value_or_raise_exception \
+            is AbstractTextTransformer.get_value_or_raise_exception
+
+    def get_node_value(self, attributes: Dict[str, str],
+                       text: Optional[str]) -> Any:
+        if self.text_only:
+            return self.get_text_value(text)
+        return super().get_node_value(attributes, text)
+
+    def get_text_value(self, text: Optional[str]) -> Any:
+        try:
+            return self.get_text_value_or_raise_exception(text)
+        except Exception as e:
+            raise TransformerException(
+                '{0}: {1}'.format(self.__class__, str(e)))
+
+    def get_value_or_raise_exception(self, node_data: Dict) -> Any:
+        return self.get_text_value_or_raise_exception(node_data['#text'])
+
+    @abstractmethod
+    def get_text_value_or_raise_exception(self, text: str) -> Any:
+        pass
+
+
+class AbstractBatchTransformer(AbstractTextTransformer):
+    """
+    Abstract class for implementation transformers which convert
+        a list of values in one call, for example with NumPy.
+        If the conversion of a list fails, nodes are transformed
+        one by one, so errors are handled like in transform_node.
+        Lists are not converted in one call if a subclass overrides
+        get_text_value_or_raise_exception or get_value_or_raise_exception
+        without get_values_or_raise_exception, or methods of node data
+    """
+    def __init__(self, ignore_errors: bool = False,
+                 removing_types: bool = False):
+        super().__init__(ignore_errors=ignore_errors,
+                         removing_types=removing_types)
+        self.vectorized = self.text_only \
+            and not self.uses_node_data_hooks() \
+            and self._get_owner_index('get_values_or_raise_exception') \
+            <= self._get_owner_index('get_text_value_or_raise_exception')
+
+    @classmethod
+    def _get_owner_index(cls, method_name: str) -> int:
+        """
+        Get the index of the class which defines a method in the MRO,
+            the less index belongs to the more derived class
+        :param method_name: name of the method
+        :return: index in the MRO
+        """
+        for index, owner_class in enumerate(cls.__mro__):
+            if method_name in vars(owner_class):
+                return index
+        return len(cls.__mro__)
+
+    def transform_nodes(self, node_data_list: List[Dict]) -> None:
+        if not self.vectorized:
+            super().transform_nodes(node_data_list)
+            return
+        node_data_list = [
+            node_data for node_data in node_data_list
+            if self.check_node_data(node_data)]
+        try:
+            values = self.get_values(
+                [node_data['#text'] for node_data in node_data_list])
+        except TransformerException:
+            super().transform_nodes(node_data_list)
+            return
+        for node_data, value in zip(node_data_list, values):
+            node_data['#text'] = value
+        if self.removing_types:
+            attribute_key = '@' + self.attribute
+            for node_data in node_data_list:
+                del node_data[attribute_key]
+
+    def get_leaf_values(
+            self, leaves: List[Tuple[Dict[str, str], Optional[str]]]
+            ) -> List[Any]:
+        if not self.vectorized:
+            return super().get_leaf_values(leaves)
+        try:
+            return self.get_values([text for _, text in leaves])
+        except TransformerException:
+            return super().get_leaf_values(leaves)
+
+    def get_values(self, values: List[str]) -> List[Any]:
+        try:
+            return list(self.get_values_or_raise_exception(values))
+        except Exception as e:
+            raise TransformerException(
+                '{0}: {1}'.format(self.__class__, str(e)))
+
+    @abstractmethod
+    def get_values_or_raise_exception(self, values: List[str]) -> List[Any]:
+        pass
+
 
-class IntegerTransformer(AbstractTransformer):
+class IntegerTransformer(AbstractBatchTransformer):
     """Transformer for integers"""
     key = "integer"
+    value_type = int
 
-    def get_value_or_raise_exception(self, node_data: Dict) -> int:
-        return int(node_data['#text'])
+    def get_text_value_or_raise_exception(self, text: str) -> int:
+        return int(text)
 
+    def get_values_or_raise_exception(self, values: List[str]) -> List[int]:
+        return list(map(int, values))
 
-class BoolTransformer(AbstractTransformer):
+
+class BoolTransformer(AbstractBatchTransformer):
     """Transformer for booleans"""
     key = "bool"
+    value_type = bool
+    bool_values = {'true': True, 'false': False}
 
-    def get_value_or_raise_exception(self, node_data: Dict) -> bool:
-        value = node_data['#text'].lower()
+    def get_text_value_or_raise_exception(self, text: str) -> bool:
+        value = text.lower()
         if value == 'true':
             value = True
         elif value == 'false':
@@ -86,30 +384,206 @@ class BoolTransformer(AbstractTransformer):
             raise TypeError('Value has to be "true" or "false"')
         return value
 
+    def get_values_or_raise_exception(
+            self, values: List[str]) -> List[bool]:
+        bool_values = self.bool_values
+        return [bool_values[value.lower()] for value in values]
+
+    def get_text(self, value: bool) -> str:
+        return 'true' if value else 'false'
 
-class DateTimeTransformer(AbstractTransformer):
-    """Transformer for datetime.datetime"""
+
+class DateTimeTransformer(AbstractBatchTransformer):
+    """
+    Transformer for datetime.datetime.
+        Values are checked against datetime formats in order.
+        The default format and ISO-8601 are parsed without strptime.
+        Parsed values are kept in a bounded memo,
+        because the same timestamps are often repeated
+    """
     key = "datetime"
+    value_type = datetime.datetime
     datetime_format = "%Y-%m-%dT%H:%M:%SZ"
+    default_datetime_pattern = re.compile(
+        r'(\d{4})-(\d{2})-(\d{2})[Tt](\d{2}):(\d{2}):(\d{2})[Zz]$',
+        re.ASCII)
+    iso_datetime_pattern = re.compile(
+        r'(\d{4})-(\d{2})-(\d{2})'
+        r'(?:[Tt ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6})\d*)?)?)?'
+        r'(?:([Zz])|([+-])(\d{2}):?(\d{2}))?$',
+        re.ASCII)
+    memo_size = 1024
 
-    def get_value_or_raise_exception(
-            self, node_data: Dict) -> datetime.datetime:
-        value = node_data['#text'].lower()
-        value = datetime.datetime.strptime(value, self.datetime_format)
-        return value
+    def __init__(self, ignore_errors: bool = False,
+                 removing_types: bool = False):
+        super().__init__(ignore_errors=ignore_errors,
+                         removing_types=removing_types)
+        self.datetime_formats = [self.datetime_format]
+        self.iso_format = False
+        self.timezone_aware = False
+        self.memo = dict()
+
+    def get_text_value_or_raise_exception(
+            self, text: str) -> datetime.datetime:
+        return self.parse_datetime(text)
+
+    def get_values_or_raise_exception(
+            self, values: List[str]) -> List[datetime.datetime]:
+        return [self.parse_datetime(value) for value in values]
 
-    def set_datetime_format(self, datetime_format: str) -> None:
-        self.datetime_format = datetime_format
+    def parse_datetime(self, value: str) -> datetime.datetime:
+        """
+        Parse a value, using the memo
+        :param value: text of a node
+        :return: parsed value
+        """
+        try:
+            return self.memo[value]
+        except KeyError:
+            pass
+        parsed_value = self._parse_datetime(value)
+        if len(self.memo) >= self.memo_size:
+            self.memo.clear()
+        self.memo[value] = parsed_value
+        return parsed_value
+
+    def _parse_datetime(self, value: str) -> datetime.datetime:
+        """
+        Parse a value, trying datetime formats in order
+            and then ISO-8601 if it is allowed
+        :param value: text of a node
+        :return: parsed value
+        """
+        error = None
+        for datetime_format in self.datetime_formats:
+            try:
+                return self._parse_datetime_format(value, datetime_format)
+            except ValueError as e:
+                error = e
+        if self.iso_format:
+            parsed_value = self._parse_iso_datetime(value)
+            if parsed_value is not None:
+                return parsed_value
+            error = ValueError(
+                'Value {0} does not match ISO-8601'.format(repr(value)))
+        raise error
+
+    def _parse_datetime_format(self, value: str,
+                               datetime_format: str) -> datetime.datetime:
+        """
+        Parse a value with a datetime format.
+            The default format is parsed without strptime.
+            Values of formats which end with "Z" are in UTC
+            if timezone_aware or iso_format is True
+        :param value: text of a node
+        :param datetime_format: format for strptime
+        :return: parsed value
+        """
+        if datetime_format == DateTimeTransformer.datetime_format:
+            value_match = self.default_datetime_pattern.match(value)
+            if value_match is not None:
+                tzinfo = None
+                if self.timezone_aware or self.iso_format:
+                    tzinfo = datetime.timezone.utc
+                return datetime.datetime(
+                    *map(int, value_match.groups()), tzinfo=tzinfo)
+        parsed_value = datetime.datetime.strptime(value, datetime_format)
+        if (self.timezone_aware or self.iso_format) \
+                and parsed_value.tzinfo is None \
+                and datetime_format.endswith('Z'):
+            parsed_value = parsed_value.replace(tzinfo=datetime.timezone.utc)
+        return parsed_value
+
+    def _parse_iso_datetime(
+            self, value: str) -> Optional[datetime.datetime]:
+        """
+        Parse ISO-8601 value like 2020-02-12, 2020-02-12 20:20,
+            2020-02-12T20:20:46.123Z or 2020-02-12T20:20:46+03:00.
+            Values with an offset are timezone-aware
+        :param value: text of a node
+        :return: parsed value or None if the value does not match
+        """
+        value_match = self.iso_datetime_pattern.match(value)
+        if value_match is None:
+            return None
+        groups = value_match.groups()
+        date_time = [int(group or 0) for group in groups[:6]]
+        microsecond = int((groups[6] or '0').ljust(6, '0'))
+        tzinfo = None
+        if groups[7] is not None:
+            tzinfo = datetime.timezone.utc
+        elif groups[8] is not None:
+            offset = datetime.timedelta(
+                hours=int(groups[9]), minutes=int(groups[10]))
+            if groups[8] == '-':
+                offset = -offset
+            tzinfo = datetime.timezone(offset)
+        return datetime.datetime(
+            *date_time, microsecond=microsecond, tzinfo=tzinfo)
+
+    def get_text(self, value: datetime.datetime) -> str:
+        """
+        Format a value with the first datetime format.
+            Timezone-aware values are converted to UTC
+            if the format ends with "Z"
+        :param value: python value
+        :return: text of a node
+        """
+        if value.tzinfo is not None and self.datetime_format.endswith('Z'):
+            value = value.astimezone(datetime.timezone.utc)
+        return value.strftime(self.datetime_format)
+
+    def set_datetime_format(self, *datetime_formats: str) -> None:
+        """
+        Set datetime formats which are checked in order
+        :param datetime_formats: formats for strptime
+        """
+        if not datetime_formats:
+            raise ValueError('At least one datetime format has to be set')
+        self.datetime_format = datetime_formats[0]
+        self.datetime_formats = list(datetime_formats)
+        self.memo.clear()
+
+    def set_iso_format(self, iso_format: bool) -> None:
+        """
+        If iso_format is True then values which do not match
+            datetime formats are parsed as ISO-8601. Values with "Z"
+            or an offset are timezone-aware, including values
+            of formats which end with "Z"
+        :param iso_format: flag of parsing ISO-8601
+        """
+        self.iso_format = iso_format
+        self.memo.clear()
+
+    def set_timezone_aware(self, timezone_aware: bool) -> None:
+        """
+        If timezone_aware is True then values of formats
+            which end with "Z" are returned in UTC.
+            They are always timezone-aware if ISO-8601 is parsed
+        :param timezone_aware: flag of timezone-aware values
+        """
+        self.timezone_aware = timezone_aware
+        self.memo.clear()
 
 
 class PullTransformers:
     def __init__(self, *transformers):
         self.transformers = dict()
+        self.batch_mode = False
+        self.memo = None
+        self.memo_size = 0
+        self.intern_values = False
+        self.executor = None
+        self.chunk_size = 1000
+        self.attribute_dispatch = list()
+        self.tag_dispatch = dict()
+        self.version = 0
         self.add_transformers(*transformers)
 
     def add_transformers(self, *transformers) -> None:
         for transformer in transformers:
             self.__register_transformer(transformer)
+        self.compile_dispatch_table()
 
     def __register_transformer(
             self, transformer: Union[AbstractTransformer, type]) -> None:
@@ -125,14 +599,387 @@ class PullTransformers:
             return transformer()
         return transformer
 
+    def compile_dispatch_table(self) -> None:
+        """
+        Build tables which choose a transformer for a node by one lookup
+            for every attribute of transformers ("type" by default)
+            and one lookup by tag. Entries are pairs of a transformer and
+            a bound function which builds data of a node (with the memo
+            if it is set up). The table is built when transformers
+            are added and when the memo is set up.
+            The version of the instance is increased
+        """
+        attribute_tables = OrderedDict([('type', dict())])
+        tag_dispatch = dict()
+        for transformer in self.transformers.values():
+            if transformer.uses_node_data_hooks():
+                leaf_function = functools.partial(
+                    self._transform_leaf_node_data, transformer)
+            elif self.memo is not None:
+                leaf_function = functools.partial(
+                    self._transform_leaf_with_memo, transformer)
+            else:
+                leaf_function = transformer.transform_leaf
+            entry = (transformer, leaf_function)
+            if transformer.key is not None:
+                attribute_tables.setdefault(
+                    transformer.attribute, dict())[transformer.key] = entry
+            for tag in transformer.tags:
+                tag_dispatch[tag] = entry
+        self.attribute_dispatch = [
+            (attribute, '@' + attribute, table)
+            for attribute, table in attribute_tables.items() if table]
+        self.tag_dispatch = tag_dispatch
+        self.version += 1
+
+    def get_leaf_function(
+            self, tag: Optional[str], attributes: Dict[str, str]
+            ) -> Optional[Callable[[Dict[str, str], Optional[str]], Any]]:
+        """
+        Get a function which builds data of a node without
+            child nodes from attributes and text of the node.
+            Rules of attributes are checked before rules of tags
+        :param tag: tag of the node in the result
+        :param attributes: attributes of the node without "@"
+        :return: function or None if there is no transformer
+            for the node
+        """
+        if attributes:
+            for attribute, _, table in self.attribute_dispatch:
+                entry = table.get(attributes.get(attribute))
+                if entry is not None:
+                    return entry[1]
+        entry = self.tag_dispatch.get(tag)
+        if entry is not None:
+            return entry[1]
+        return None
+
+    def get_leaf_transformer(
+            self, tag: Optional[str], attributes: Dict[str, str]
+            ) -> Optional[AbstractTransformer]:
+        """
+        Get a transformer for a node without child nodes
+        :param tag: tag of the node in the result
+        :param attributes: attributes of the node without "@"
+        :return: transformer or None
+        """
+        if attributes:
+            for attribute, _, table in self.attribute_dispatch:
+                entry = table.get(attributes.get(attribute))
+                if entry is not None:
+                    return entry[0]
+        entry = self.tag_dispatch.get(tag)
+        if entry is not None:
+            return entry[0]
+        return None
+
+    def get_node_data_transformer(
+            self, node_data: Dict) -> Optional[AbstractTransformer]:
+        """
+        Get a transformer for node data by its attributes
+        :param node_data: node data
+        :return: transformer or None
+        """
+        for _, attribute_key, table in self.attribute_dispatch:
+            entry = table.get(node_data.get(attribute_key))
+            if entry is not None:
+                return entry[0]
+        return None
+
     def transform_node(self, node_data: Dict) -> Dict:
-        key = self.get_key(node_data)
-        if key is not None:
-            transformer = self.get_transformer(key)
-            if transformer is not None:
-                return transformer.transform_node(node_data)
+        transformer = self.get_node_data_transformer(node_data)
+        if transformer is not None:
+            if self.memo is not None:
+                return self._transform_node_with_memo(
+                    transformer, node_data)
+            return transformer.transform_node(node_data)
+        if self.intern_values:
+            text = node_data.get('#text')
+            if isinstance(text, str):
+                node_data['#text'] = sys.intern(text)
         return node_data
 
+    def _transform_leaf_node_data(
+            self, transformer: AbstractTransformer,
+            attributes: Dict[str, str], text: Optional[str]) -> Any:
+        """
+        Transform a node without child nodes through node data
+            for transformers which override methods of node data
+            (node_data_hooks), using the memo if it is set up
+        :param transformer: transformer for the node
+        :param attributes: attributes of the node without "@"
+        :param text: text of the node
+        :return: data of the node
+        """
+        if self.memo is None:
+            return transformer.transform_leaf_node_data(attributes, text)
+        node_data = self._transform_node_with_memo(
+            transformer, transformer.get_leaf_node_data(attributes, text))
+        return transformer.group_node_data(node_data)
+
+    def _transform_leaf_with_memo(
+            self, transformer: AbstractTransformer,
+            attributes: Dict[str, str], text: Optional[str]) -> Any:
+        """
+        Transform a node without child nodes, using the memo
+            of transformed values
+        :param transformer: transformer for the node
+        :param attributes: attributes of the node without "@"
+        :param text: text of the node
+        :return: data of the node
+        """
+        memo_key = (transformer.key, text)
+        try:
+            value = self.memo[memo_key]
+        except KeyError:
+            try:
+                value = transformer.get_node_value(attributes, text)
+            except TransformerException:
+                return transformer.transform_leaf(attributes, text)
+            self._put_into_memo(memo_key, value)
+        else:
+            self.memo.move_to_end(memo_key)
+        return transformer.get_leaf_value(attributes, value)
+
+    def _transform_node_with_memo(
+            self, transformer: AbstractTransformer, node_data: Dict) -> Dict:
+        """
+        Transform node data, using the memo of transformed values.
+            Values are memoized only if a transformation succeeds.
+            Transformers which override transform_node are not memoized
+        :param transformer: transformer for the node
+        :param node_data: data for transformation
+        :return: transformed data
+        """
+        if type(transformer).transform_node \
+                is not AbstractTransformer.transform_node:
+            return transformer.transform_node(node_data)
+        if not transformer.check_node_data(node_data):
+            return node_data
+        memo_key = (transformer.key, node_data['#text'])
+        try:
+            value = self.memo[memo_key]
+        except KeyError:
+            try:
+                value = transformer.get_value(node_data)
+            except TransformerException:
+                return transformer.transform_node(node_data)
+            self._put_into_memo(memo_key, value)
+        else:
+            self.memo.move_to_end(memo_key)
+        node_data['#text'] = value
+        return transformer.remove_type_from_node_data(node_data)
+
+    def _put_into_memo(self, memo_key: tuple, value: Any) -> None:
+        """
+        Put a transformed value into the memo,
+            removing the least recently used value if the memo is full
+        :param memo_key: pair of a key of a transformer and a raw value
+        :param value: transformed value
+        """
+        self.memo[memo_key] = value
+        if len(self.memo) > self.memo_size:
+            self.memo.popitem(last=False)
+
+    def transform_nodes(self, node_data_list: List[Dict]) -> None:
+        """
+        Transform nodes in place, passing all nodes with the same key
+            to a transformer at once
+        :param node_data_list: list of node data
+        """
+        node_data_by_key = defaultdict(list)
+        for node_data in node_data_list:
+            transformer = self.get_node_data_transformer(node_data)
+            if transformer is not None:
+                node_data_by_key[transformer.key].append(node_data)
+        for key, key_node_data_list in node_data_by_key.items():
+            self.transform_nodes_with_key(key, key_node_data_list)
+
+    def transform_nodes_with_key(
+            self, key: Optional[str], node_data_list: List[Dict]) -> None:
+        """
+        Transform nodes with the same key in place
+        :param key: key of the nodes
+        :param node_data_list: list of node data
+        """
+        transformer = self.get_transformer(key)
+        if transformer is None:
+            return
+        if self.memo is not None:
+            self._transform_nodes_with_memo(transformer, node_data_list)
+        else:
+            transformer.transform_nodes(node_data_list)
+
+    def _transform_nodes_with_memo(
+            self, transformer: AbstractTransformer,
+            node_data_list: List[Dict]) -> None:
+        """
+        Transform nodes in place, using the memo of transformed values.
+            Values which are not in the memo are passed to a transformer
+            at once. They are memoized if the transformer does not
+            ignore errors, so all of them have been transformed
+        :param transformer: transformer for the nodes
+        :param node_data_list: list of node data
+        """
+        memo = self.memo
+        missed_node_data_list = list()
+        for node_data in node_data_list:
+            if not transformer.check_node_data(node_data):
+                continue
+            memo_key = (transformer.key, node_data['#text'])
+            if memo_key in memo:
+                node_data['#text'] = memo[memo_key]
+                transformer.remove_type_from_node_data(node_data)
+            else:
+                missed_node_data_list.append((memo_key, node_data))
+        transformer.transform_nodes(
+            [node_data for _, node_data in missed_node_data_list])
+        if not transformer.ignore_errors:
+            for memo_key, node_data in missed_node_data_list:
+                self._put_into_memo(memo_key, node_data['#text'])
+
+    def transform_leaves_with_key(
+            self, key: str,
+            leaves: List[Tuple[Dict[str, str], Optional[str]]]
+            ) -> List[Any]:
+        """
+        Transform nodes without child nodes which have been chosen
+            for the transformer with the key, passing values which are
+            not in the memo to the transformer at once
+        :param key: key of the transformer
+        :param leaves: pairs of attributes and text of nodes
+        :return: data of the nodes
+        """
+        transformer = self.get_transformer(key)
+        if transformer.uses_node_data_hooks():
+            return [
+                self._transform_leaf_node_data(transformer, attributes, text)
+                for attributes, text in leaves]
+        if self.memo is None:
+            return transformer.transform_leaves(leaves)
+        values, missed_indexes = self._get_memoized_values(
+            transformer, leaves)
+        missed_values = transformer.get_leaf_values(
+            [leaves[index] for index in missed_indexes])
+        self._set_missed_values(
+            transformer, leaves, values, missed_indexes, missed_values)
+        return self._get_leaf_data_list(transformer, leaves, values)
+
+    def submit_leaves_with_key(
+            self, key: str,
+            leaves: List[Tuple[Dict[str, str], Optional[str]]]
+            ) -> Callable[[], List[Any]]:
+        """
+        Start transformation of nodes without child nodes
+            in the executor. Values are taken from the memo at once,
+            other values are transformed by the executor
+        :param key: key of the transformer
+        :param leaves: pairs of attributes and text of nodes
+        :return: function which waits for the executor
+            and returns data of the nodes. Transformers which override
+            methods of node data (node_data_hooks) get node data
+            without the memo
+        """
+        transformer = self.get_transformer(key)
+        if transformer.uses_node_data_hooks():
+            return self.executor.submit(
+                transform_leaf_node_data_in_executor, transformer,
+                leaves).result
+        values, missed_indexes = self._get_memoized_values(
+            transformer, leaves)
+        future = self.executor.submit(
+            get_leaf_values_in_executor, transformer,
+            [leaves[index] for index in missed_indexes])
+        return functools.partial(
+            self._get_submitted_leaf_data_list, transformer, leaves,
+            values, missed_indexes, future)
+
+    def _get_submitted_leaf_data_list(
+            self, transformer: AbstractTransformer,
+            leaves: List[Tuple[Dict[str, str], Optional[str]]],
+            values: List[Any], missed_indexes: List[int],
+            future: Future) -> List[Any]:
+        """
+        Wait for values from the executor and build data of nodes
+        :param transformer: transformer for the nodes
+        :param leaves: pairs of attributes and text of nodes
+        :param values: values from the memo
+        :param missed_indexes: indexes of nodes passed to the executor
+        :param future: future of values of the passed nodes
+        :return: data of the nodes
+        """
+        self._set_missed_values(
+            transformer, leaves, values, missed_indexes, future.result())
+        return self._get_leaf_data_list(transformer, leaves, values)
+
+    def _get_memoized_values(
+            self, transformer: AbstractTransformer,
+            leaves: List[Tuple[Dict[str, str], Optional[str]]]
+            ) -> Tuple[List[Any], List[int]]:
+        """
+        Get values of nodes from the memo
+        :param transformer: transformer for the nodes
+        :param leaves: pairs of attributes and text of nodes
+        :return: values (None if a value is not in the memo)
+            and indexes of nodes which values are not in the memo
+        """
+        values = [None] * len(leaves)
+        memo = self.memo
+        if memo is None:
+            return values, list(range(len(leaves)))
+        missed_indexes = list()
+        for index, (_, text) in enumerate(leaves):
+            memo_key = (transformer.key, text)
+            if memo_key in memo:
+                values[index] = memo[memo_key]
+            else:
+                missed_indexes.append(index)
+        return values, missed_indexes
+
+    def _set_missed_values(
+            self, transformer: AbstractTransformer,
+            leaves: List[Tuple[Dict[str, str], Optional[str]]],
+            values: List[Any], missed_indexes: List[int],
+            missed_values: List[Any]) -> None:
+        """
+        Set transformed values of nodes which were not in the memo.
+            They are memoized if the transformer does not ignore errors,
+            so all of them have been transformed
+        :param transformer: transformer for the nodes
+        :param leaves: pairs of attributes and text of nodes
+        :param values: values of the nodes
+        :param missed_indexes: indexes of the transformed nodes
+        :param missed_values: transformed values
+        """
+        memoizing = self.memo is not None and not transformer.ignore_errors
+        for index, value in zip(missed_indexes, missed_values):
+            values[index] = value
+            if memoizing:
+                self._put_into_memo((transformer.key, leaves[index][1]), value)
+
+    @staticmethod
+    def _get_leaf_data_list(
+            transformer: AbstractTransformer,
+            leaves: List[Tuple[Dict[str, str], Optional[str]]],
+            values: List[Any]) -> List[Any]:
+        """
+        Build data of transformed nodes
+        :param transformer: transformer for the nodes
+        :param leaves: pairs of attributes and text of nodes
+        :param values: transformed values
+        :return: data of the nodes
+        """
+        get_leaf_value = transformer.get_leaf_value
+        return [get_leaf_value(attributes, value)
+                for (attributes, _), value in zip(leaves, values)]
+
+    def get_deferred_transformation(self) -> 'DeferredTransformation':
+        """
+        Get a queue of nodes for transformation in batch mode
+        :return: DeferredTransformation instance
+        """
+        return DeferredTransformation(self)
+
     @staticmethod
     def get_key(node_data: Dict) -> Optional[str]:
         if '@type' in node_data:
@@ -143,17 +990,216 @@ class PullTransformers:
             return self.transformers[key]
         return None
 
+    def get_reverse_transformer(
+            self, value: Any) -> Optional[AbstractTransformer]:
+        """
+        Get a transformer which writes a python value back to XML
+        :param value: python value
+        :return: transformer or None if there is no suitable transformer
+        """
+        for transformer in self.transformers.values():
+            if transformer.check_value(value):
+                return transformer
+        return None
+
     def set_ignore_errors(self, ignore_errors: bool) -> None:
         for transformer_key in self.transformers:
             self.transformers[transformer_key].set_ignore_errors(
                 ignore_errors
             )
+        self.version += 1
 
     def set_removing_types(self, removing_types: bool) -> None:
         for transformer_key in self.transformers:
             self.transformers[transformer_key].set_removing_types(
                 removing_types
             )
+        self.version += 1
+
+    def set_tags(self, key: str, *tags: str) -> None:
+        """
+        Set tags of nodes for the transformer with the key
+            and rebuild the dispatch table
+        :param key: key of the transformer
+        :param tags: tags of nodes
+        """
+        self.transformers[key].set_tags(*tags)
+        self.compile_dispatch_table()
+
+    def set_memo_size(self, memo_size: int) -> None:
+        """
+        Set up LRU memo of transformed values keyed by a key of
+            a transformer and a raw value. It is useful if the same values
+            are repeated many times. Transformers should not depend on
+            other node data (e.g. attributes) and should return
+            immutable values, because values are shared between nodes.
+            The memo is disabled if memo_size is 0
+        :param memo_size: max number of memoized values
+        """
+        self.memo_size = memo_size
+        self.memo = OrderedDict() if memo_size > 0 else None
+        self.compile_dispatch_table()
+
+    def set_intern_values(self, intern_values: bool) -> None:
+        """
+        If intern_values is True then values of nodes without
+            a transformer are interned with sys.intern, so equal values
+            share memory in the result
+        :param intern_values: flag of interning
+        """
+        self.intern_values = intern_values
+        self.version += 1
+
+    def set_batch_mode(self, batch_mode: bool) -> None:
+        """
+        If batch_mode is True then XmlToDict collects typed nodes
+            of a document and transforms them after the conversion
+            by transform_leaves_with_key
+        :param batch_mode: flag of batch transformation
+        """
+        self.batch_mode = batch_mode
+        self.version += 1
+
+    def use_executor(self, executor: Executor,
+                     chunk_size: int = 1000) -> None:
+        """
+        Set up deferred transformation in an executor: ThreadPoolExecutor
+            for transformers which wait for I/O or release the GIL,
+            ProcessPoolExecutor for pure-Python CPU work (transformers
+            and values have to be picklable). Batch mode is switched on.
+            Typed nodes are collected during the conversion and every
+            chunk of nodes with the same key is transformed
+            in the executor while the conversion goes on
+        :param executor: concurrent.futures.Executor instance,
+            it is not shut down by PullTransformers
+        :param chunk_size: number of nodes which are passed
+            to the executor at once
+        """
+        if isinstance(executor, Executor):
+            self.executor = executor
+            self.chunk_size = chunk_size
+            self.batch_mode = True
+            self.version += 1
+
+
+class DeferredLeaf:
+    """
+    Node without child nodes which is transformed later.
+        It is kept in the result until its data is set
+    """
+    __slots__ = ('attributes', 'text', 'data')
+
+    def __init__(self, attributes: Dict[str, str], text: Optional[str]):
+        """
+        Init instance
+        :param attributes: attributes of the node without "@"
+        :param text: text of the node
+        """
+        self.attributes = attributes
+        self.text = text
+        self.data = None
+
+
+class DeferredTransformation:
+    """
+    Typed nodes of a document which are transformed after
+        the conversion in batch mode. If pull transformers have
+        an executor, full chunks of nodes with the same key are
+        submitted to the executor at once and results are collected
+        by finish
+    """
+    def __init__(self, pull_transformers: PullTransformers):
+        """
+        Init instance
+        :param pull_transformers: PullTransformers instance
+        """
+        self.pull_transformers = pull_transformers
+        self.executor = pull_transformers.executor
+        self.chunk_size = pull_transformers.chunk_size
+        self.leaves_by_key = defaultdict(list)
+        self.submitted = list()
+
+    def add_leaf(self, key: str, attributes: Dict[str, str],
+                 text: Optional[str]) -> DeferredLeaf:
+        """
+        Add a node without child nodes which has a transformer
+        :param key: key of the transformer
+        :param attributes: attributes of the node without "@"
+        :param text: text of the node
+        :return: DeferredLeaf instance, which gets data of the node
+            after finish
+        """
+        leaf = DeferredLeaf(attributes, text)
+        leaves = self.leaves_by_key[key]
+        leaves.append(leaf)
+        if self.executor is not None and len(leaves) >= self.chunk_size:
+            self._submit(key, leaves)
+            del self.leaves_by_key[key]
+        return leaf
+
+    def _submit(self, key: str, leaves: List[DeferredLeaf]) -> None:
+        """
+        Pass nodes with the same key to the executor
+        :param key: key of the transformer
+        :param leaves: DeferredLeaf instances
+        """
+        get_data_list = self.pull_transformers.submit_leaves_with_key(
+            key, [(leaf.attributes, leaf.text) for leaf in leaves])
+        self.submitted.append((leaves, get_data_list))
+
+    def finish(self) -> None:
+        """
+        Transform the rest of nodes and wait for the executor.
+            Errors of transformers are raised here
+        """
+        for key, leaves in self.leaves_by_key.items():
+            if self.executor is None:
+                self._set_data(leaves, self.pull_transformers
+                               .transform_leaves_with_key(
+                                   key, [(leaf.attributes, leaf.text)
+                                         for leaf in leaves]))
+            else:
+                self._submit(key, leaves)
+        self.leaves_by_key.clear()
+        submitted, self.submitted = self.submitted, list()
+        for leaves, get_data_list in submitted:
+            self._set_data(leaves, get_data_list())
+
+    @staticmethod
+    def _set_data(leaves: List[DeferredLeaf], data_list: List[Any]) -> None:
+        """
+        Set data of transformed nodes
+        :param leaves: DeferredLeaf instances
+        :param data_list: data of the nodes
+        """
+        for leaf, data in zip(leaves, data_list):
+            leaf.data = data
+
+
+def get_leaf_values_in_executor(
+        transformer: AbstractTransformer,
+        leaves: List[Tuple[Dict[str, str], Optional[str]]]) -> List[Any]:
+    """
+    Transform values of nodes in a worker of an executor.
+        Worker processes get a copy of the transformer
+    :param transformer: transformer for the nodes
+    :param leaves: pairs of attributes and text of nodes
+    :return: transformed values
+    """
+    return transformer.get_leaf_values(leaves)
+
+
+def transform_leaf_node_data_in_executor(
+        transformer: AbstractTransformer,
+        leaves: List[Tuple[Dict[str, str], Optional[str]]]) -> List[Any]:
+    """
+    Transform nodes through node data in a worker of an executor
+    :param transformer: transformer for the nodes
+    :param leaves: pairs of attributes and text of nodes
+    :return: data of the nodes
+    """
+    return [transformer.transform_leaf_node_data(attributes, text)
+            for attributes, text in leaves]
 
 
 DefaultTransformerList = [
@@ -3,16 +3,31 @@ Classes for transformation from XML files, string with XML and
 xml.etree.ElementTree objects to python dictionary
 """
 from collections import defaultdict
+import io
 import re
+import sys
+import time
 import xml.etree.ElementTree as ElementTree
-from typing import Union, Dict, List
+from typing import Any, Union, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from xmltodict3.backends import AbstractParserBackend
+from xmltodict3.columns import Column
+from xmltodict3.lazy import get_lazy_value
+from xmltodict3.paths import PathSelector
+from xmltodict3.plans import ConversionPlans
+from xmltodict3.sources import MemoryMapFile, XmlSource, closing_source
+from xmltodict3.sources import get_compression_opener
+from xmltodict3.stats import ConversionStats
+from xmltodict3.tags import TagNormalizer
 from xmltodict3.transformers import PullTransformers
 
 
 class XmlToDict:
     """Class to work with xml.etree.ElementTree objects"""
     _pull_transformers = None
+    _conversion_plans = None
+    _tag_normalizer = None
+    _stats = None
 
     def __init__(self, node: ElementTree, ignore_namespace: bool = False):
         """
@@ -22,7 +37,6 @@ class XmlToDict:
         """
         self.node = node
         self.ignore_namespace = ignore_namespace
-        self.child_nodes = list()
 
     def get_dict(self) -> Dict:
         """
@@ -30,14 +44,46 @@ class XmlToDict:
             which has been passed during initialization of an instance
         :return: extracted data as a python dict
         """
+        if self._stats is not None:
+            return self._get_dict_with_stats()
         tag = self.get_tag()
-        self.child_nodes = self._get_child_nodes()
-        if self._is_single_node():
-            value = self._get_dict_from_single_node()
+        if self._conversion_plans is not None:
+            value = self._conversion_plans.get_node_value(self)
         else:
-            value = self._get_dict_from_node_with_children()
+            value = self._get_node_value(self.node)
         return {tag: value}
 
+    def get_lazy_dict(self) -> Dict:
+        """
+        Extract data lazily: nodes with child nodes are returned
+            as LazyNode mappings, which convert child nodes and
+            attributes on first access. The content is the same
+            as the content of the dict from get_dict
+        :return: python dict with lazy data
+        """
+        return {self.get_tag(): get_lazy_value(self.node, self)}
+
+    def _get_dict_with_stats(self, root_depth: int = 1) -> Dict:
+        """
+        Extract data, collecting statistics of the conversion
+        :param root_depth: depth of the node in a document
+        :return: extracted data as a python dict
+        """
+        stats = self._stats
+        pull_transformers = self._pull_transformers
+        self._stats = None
+        if pull_transformers is not None:
+            self._pull_transformers = stats.instrument(pull_transformers)
+        start = time.perf_counter()
+        try:
+            return self.get_dict()
+        finally:
+            stats.conversion_time += time.perf_counter() - start
+            self._stats = stats
+            self._pull_transformers = pull_transformers
+            stats.add_nodes(self.node, root_depth)
+            stats.handle_conversion()
+
     def get_tag(self) -> str:
         """
         Get a tag of the current node.
@@ -45,78 +91,208 @@ class XmlToDict:
             namespace will be removed from a tag.
         :return: a tag
         """
-        tag = self.node.tag
-        if self.ignore_namespace:
-            tag = re.sub(r'{[^}]+}', '', tag)
-        return tag
+        return self._get_node_tag(self.node)
 
-    def _get_child_nodes(self) -> List:
+    def _get_node_tag(self, node: ElementTree.Element) -> str:
         """
-        Get child nodes of xml.etree.ElementTree object
-            which has been passed during initialization of an instance
-            as XmlToDict instances.
-            All options (ignore_namespace, transformers) of the current class
-            will be used for children nodes
-        :return: List of XmlToDict instances
-        """
-        child_nodes = []
-        for child_node in self.node:
-            xml_to_dict_node = XmlToDict(
-                child_node, ignore_namespace=self.ignore_namespace)
-            if self._pull_transformers is not None:
-                xml_to_dict_node.use_pull_transformers(
-                    self._pull_transformers)
-            child_nodes.append(xml_to_dict_node)
-        return child_nodes
-
-    def _is_single_node(self) -> bool:
+        Get a tag of the node.
+            If ignore_namespace is True then
+            namespace will be removed from a tag.
+        :param node: XML object
+        :return: a tag
+        """
+        return self.get_tag_normalizer().get_tag(node.tag)
+
+    def get_tag_normalizer(self) -> TagNormalizer:
+        """
+        Get an instance which normalizes tags of this conversion
+        :return: TagNormalizer instance
+        """
+        if self._tag_normalizer is not None:
+            return self._tag_normalizer
+        return TagNormalizer.get_default(self.ignore_namespace)
+
+    def _get_node_value(self, root_node: ElementTree.Element) -> Any:
+        """
+        Extract data from the node and all its descendants.
+            The tree is walked with an explicit stack instead of recursion,
+            so the depth of a document is not limited
+            by the recursion limit of the interpreter
+        :param root_node: XML object
+        :return: node data
+        """
+        if self._is_single_node(root_node):
+            return self._get_dict_from_single_node(root_node)
+
+        if self._pull_transformers is not None \
+                and self._pull_transformers.batch_mode:
+            return self._get_node_value_with_batch_transformation(root_node)
+
+        get_tag = self.get_tag_normalizer().get_tag
+        stack = [(root_node, iter(root_node), defaultdict(list))]
+        while True:
+            node, child_nodes, children_data = stack[-1]
+            for child_node in child_nodes:
+                if not self._is_single_node(child_node):
+                    stack.append(
+                        (child_node, iter(child_node), defaultdict(list)))
+                    break
+                tag = get_tag(child_node.tag)
+                children_data[tag].append(self._get_leaf_data(
+                    tag, child_node.attrib, self._get_value(child_node)))
+            else:
+                stack.pop()
+                value = self._get_dict_from_node_with_children(
+                    node, children_data)
+                if not stack:
+                    return value
+                stack[-1][2][get_tag(node.tag)].append(value)
+
+    def _get_node_value_with_batch_transformation(
+            self, root_node: ElementTree.Element) -> Any:
+        """
+        Extract data from the node and all its descendants like
+            _get_node_value, but single nodes which have a transformer
+            are collected and passed to transformers by lists
+            after the conversion, or to an executor of pull transformers
+            by chunks during the conversion. Collected nodes are kept
+            as DeferredLeaf instances until they are transformed
+            and then they are replaced by their data in place
+        :param root_node: XML object
+        :return: node data
+        """
+        get_tag = self.get_tag_normalizer().get_tag
+        get_leaf_transformer = self._pull_transformers.get_leaf_transformer
+        intern_values = self._pull_transformers.intern_values
+        deferred_transformation = \
+            self._pull_transformers.get_deferred_transformation()
+        locations = list()
+
+        stack = [(root_node, iter(root_node), defaultdict(list), list())]
+        while True:
+            node, child_nodes, children_data, typed_children = stack[-1]
+            for child_node in child_nodes:
+                if not self._is_single_node(child_node):
+                    stack.append((child_node, iter(child_node),
+                                  defaultdict(list), list()))
+                    break
+                tag = get_tag(child_node.tag)
+                sub_node_data = children_data[tag]
+                attributes = child_node.attrib
+                value = self._get_value(child_node)
+                transformer = get_leaf_transformer(tag, attributes)
+                if transformer is not None:
+                    typed_children.append((tag, len(sub_node_data)))
+                    sub_node_data.append(deferred_transformation.add_leaf(
+                        transformer.key, attributes, value))
+                    continue
+                if intern_values and value is not None:
+                    value = sys.intern(value)
+                sub_node_data.append(
+                    self._get_untyped_leaf_data(attributes, value))
+            else:
+                stack.pop()
+                value = self._get_dict_from_node_with_children(
+                    node, children_data)
+                for tag, index in typed_children:
+                    sub_node_data = children_data[tag]
+                    if len(sub_node_data) == 1:
+                        locations.append((value, tag))
+                    else:
+                        locations.append((sub_node_data, index))
+                if not stack:
+                    break
+                stack[-1][2][get_tag(node.tag)].append(value)
+
+        deferred_transformation.finish()
+        for container, key in locations:
+            container[key] = self._group_leaf_data(container[key].data)
+        return value
+
+    @staticmethod
+    def _is_single_node(node: ElementTree.Element) -> bool:
         """
         If node has no child nodes, this node is a single node
+        :param node: XML object
         :return: result of check
         """
-        return True if not self.child_nodes else False
+        return len(node) == 0
 
-    def _get_dict_from_single_node(self) -> Dict:
+    def _get_dict_from_single_node(self, node: ElementTree.Element) -> Any:
         """
-        Extract data from the current node, ignoring child nodes, and
+        Extract data from the node, ignoring child nodes, and
             transform result, using instance transformers
+        :param node: XML object
         :return: Python dict with data node
         """
-        data_node = self._get_single_data_node()
-        transformed_data_node = self._transform_node(data_node)
-        grouped_data_node = self._group_single_node_data(transformed_data_node)
-        return grouped_data_node
+        tag = None
+        if self._pull_transformers is not None \
+                and self._pull_transformers.tag_dispatch:
+            tag = self._get_node_tag(node)
+        return self._get_leaf_data(tag, node.attrib, self._get_value(node))
 
-    def _get_single_data_node(self) -> Dict:
+    def _get_leaf_data(self, tag: Optional[str], attributes: Dict[str, str],
+                       value: Optional[str]) -> Any:
         """
-        Extract value and attributes of the current node
-        :return: Python dict with data node
+        Get data of a node without child nodes. A transformer is chosen
+            by the dispatch table of pull transformers and builds
+            data of the node directly
+        :param tag: tag of the node in the result, it can be None
+            if pull transformers have no rules of tags
+        :param attributes: attributes of the node without "@"
+        :param value: node value
+        :return: node data
+        """
+        pull_transformers = self._pull_transformers
+        if pull_transformers is not None:
+            leaf_function = pull_transformers.get_leaf_function(
+                tag, attributes)
+            if leaf_function is not None:
+                return self._group_leaf_data(
+                    leaf_function(attributes, value))
+            if pull_transformers.intern_values and value is not None:
+                value = sys.intern(value)
+        return self._get_untyped_leaf_data(attributes, value)
+
+    def _get_untyped_leaf_data(self, attributes: Dict[str, str],
+                               value: Optional[str]) -> Any:
+        """
+        Get data of a node without child nodes and without a transformer
+        :param attributes: attributes of the node without "@"
+        :param value: node value
+        :return: node data
+        """
+        if not attributes:
+            return value
+        data_node = {'@' + attribute_name: attribute_value
+                     for attribute_name, attribute_value
+                     in attributes.items()}
+        data_node['#text'] = value
+        return self._group_single_node_data(data_node)
+
+    @staticmethod
+    def _group_leaf_data(leaf_data: Any) -> Any:
         """
-        attributes = self._get_attributes()
-        node_value = {'#text': self._get_value()}
-        data_node = {**attributes, **node_value}
-        return data_node
+        Group data of a transformed node. Transformers build
+            a value or a dict with attributes and "#text",
+            so the data is already grouped
+        :param leaf_data: data of the node from a transformer
+        :return: grouped node data
+        """
+        return leaf_data
 
-    def _get_value(self) -> Union[str, None]:
+    @staticmethod
+    def _get_value(node: ElementTree.Element) -> Union[str, None]:
         """
         Get node value
+        :param node: XML object
         :return: node value
         """
-        value = self.node.text
+        value = node.text
         if value is not None:
             value = value.strip()
         return value
 
-    def _transform_node(self, node_data: Dict) -> Dict:
-        """
-        Transform data node, using instance transformers
-        :param node_data: data for transformation
-        :return: transformed data
-        """
-        if self._pull_transformers is not None:
-            node_data = self._pull_transformers.transform_node(node_data)
-        return node_data
-
     @staticmethod
     def _group_single_node_data(node_data: Dict) -> Dict:
         """
@@ -126,44 +302,36 @@ class XmlToDict:
         :param node_data: node data to group
         :return:grouped node data
         """
-        if tuple(node_data.keys()) == ('#text',):
+        if len(node_data) == 1 and '#text' in node_data:
             node_data = node_data['#text']
         return node_data
 
-    def _get_dict_from_node_with_children(self) -> Dict:
+    def _get_dict_from_node_with_children(
+            self, node: ElementTree.Element,
+            children_data: defaultdict) -> Dict:
         """
         Get node attributes and data from child nodes
+        :param node: XML object
+        :param children_data: collected data from child nodes
         :return: node data
         """
-        attributes = self._get_attributes()
-        children_data = self._get_children_data()
-        value = {**children_data, **attributes}
+        value = self._group_children_data(children_data)
+        value.update(self._get_attributes(node))
         return value
 
-    def _get_attributes(self) -> Dict:
+    @staticmethod
+    def _get_attributes(node: ElementTree.Element) -> Dict:
         """
         Get node attributes.
             Attributes are marked with "@" in the attribute name
+        :param node: XML object
         :return: node attributes as dict
         """
         attributes = dict()
-        for attribute_name in self.node.attrib:
-            key = '@' + attribute_name
-            attributes[key] = self.node.attrib[attribute_name]
+        for attribute_name, attribute_value in node.attrib.items():
+            attributes['@' + attribute_name] = attribute_value
         return attributes
 
-    def _get_children_data(self) -> Dict:
-        """
-        Get data from child nodes
-        :return: nodes data as dict
-        """
-        node_data = defaultdict(list)
-        for child_node in self.child_nodes:
-            tag = child_node.get_tag()
-            node_data[tag].append(child_node.get_dict()[tag])
-        node_data = self._group_children_data(node_data)
-        return node_data
-
     @staticmethod
     def _group_children_data(children_data: defaultdict) -> Dict:
         """
@@ -195,40 +363,559 @@ class XmlToDict:
         if isinstance(pull_transformers, PullTransformers):
             self._pull_transformers = pull_transformers
 
+    def use_conversion_plans(
+            self, conversion_plans: ConversionPlans) -> None:
+        """
+        Set up cache of conversion plans to speed up
+            transformation of nodes with the same structure
+        :param conversion_plans: ConversionPlans instance
+        """
+        if isinstance(conversion_plans, ConversionPlans):
+            self._conversion_plans = conversion_plans
+
+    def use_tag_normalizer(self, tag_normalizer: TagNormalizer) -> None:
+        """
+        Set up normalization of tags, for example to replace namespaces
+            by prefixes. ignore_namespace is not used with it
+        :param tag_normalizer: TagNormalizer instance
+        """
+        if isinstance(tag_normalizer, TagNormalizer):
+            self._tag_normalizer = tag_normalizer
+
+    def use_stats(self, stats: ConversionStats) -> None:
+        """
+        Set up collecting of statistics of conversions
+        :param stats: ConversionStats instance
+        """
+        if isinstance(stats, ConversionStats):
+            self._stats = stats
+
+
+class XmlEventsToDict:
+    """
+    Class to work with events of xml.etree.ElementTree parsers
+        (iterparse, XMLPullParser). Every element matching the path
+        is converted as soon as its end tag has been parsed and
+        then removed from the tree, so memory usage does not depend on
+        the number of the elements
+    """
+    def __init__(self, path: Optional[str] = None,
+                 ignore_namespace: bool = False):
+        """
+        Init instance
+        :param path: path of the elements to extract from the root,
+            for example "catalog/product". The root element is
+            extracted if the path is not passed
+        :param ignore_namespace: removing namespace from tags
+        """
+        self.path = self.split_path(path)
+        self.ignore_namespace = ignore_namespace
+        self._pull_transformers = None
+        self._conversion_plans = None
+        self._tag_normalizer = None
+        self._stats = None
+        self._node_stack = list()
+        self._tag_stack = list()
+        self._record_depth = None
+
+    @staticmethod
+    def split_path(path: Optional[str]) -> List[str]:
+        """
+        Split a path into tags. Slashes inside of namespaces are ignored
+        >>> XmlEventsToDict.split_path('{http://a.com/ns}root/item')
+        ['{http://a.com/ns}root', 'item']
+        :param path: path of the elements
+        :return: list of tags
+        """
+        if not path:
+            return list()
+        return re.findall(r'(?:{[^}]*}|[^/])+', path)
+
+    def process_events(
+            self, events: Iterable[Tuple[str, ElementTree.Element]]
+            ) -> Iterator[Dict]:
+        """
+        Handle "start" and "end" events and extract data
+            from matched elements. The state is kept between calls,
+            so events of one document can be passed in parts
+        :param events: pairs of an event name and an element
+        :return: iterator over extracted data of the matched elements
+        """
+        if self._stats is not None:
+            events = self._stats.measure_events(events)
+        for event, node in events:
+            if event == 'start':
+                self._start_node(node)
+            elif event == 'end':
+                node_data = self._end_node(node)
+                if node_data is not None:
+                    yield node_data
+
+    def _start_node(self, node: ElementTree.Element) -> None:
+        """
+        Put the node into the stack of the open nodes
+        :param node: XML object
+        """
+        self._node_stack.append(node)
+        if self._record_depth is not None:
+            return
+        self._tag_stack.append(self._get_tag(node))
+        if self._is_matched_path():
+            self._record_depth = len(self._node_stack)
+
+    def _end_node(self, node: ElementTree.Element) -> Optional[Dict]:
+        """
+        Take the node from the stack of the open nodes.
+            The node is converted if it matches with the path.
+            The node is removed from the tree if it is not a part of
+            a matched element
+        :param node: XML object
+        :return: node data if the node matches with the path
+        """
+        depth = len(self._node_stack)
+        self._node_stack.pop()
+        if self._record_depth is not None and depth > self._record_depth:
+            return None
+        self._tag_stack.pop()
+
+        node_data = None
+        if depth == self._record_depth:
+            self._record_depth = None
+            node_data = self._get_dict(node)
+        self._remove_node(node)
+        return node_data
+
+    def _is_matched_path(self) -> bool:
+        """
+        Check that tags of the open nodes match with the path
+        :return: result of check
+        """
+        if not self.path:
+            return len(self._tag_stack) == 1
+        return self._tag_stack == self.path
+
+    def _get_tag(self, node: ElementTree.Element) -> str:
+        """
+        Get a tag of the node
+        :param node: XML object
+        :return: a tag
+        """
+        tag_normalizer = self._tag_normalizer
+        if tag_normalizer is None:
+            tag_normalizer = TagNormalizer.get_default(self.ignore_namespace)
+        return tag_normalizer.get_tag(node.tag)
+
+    def _get_dict(self, node: ElementTree.Element) -> Dict:
+        """
+        Extract data from the node
+        :param node: XML object
+        :return: extracted data as a python dict
+        """
+        xml_to_dict_node = self._get_xml_to_dict_node(node)
+        if self._stats is not None:
+            xml_to_dict_node.use_stats(self._stats)
+            return xml_to_dict_node._get_dict_with_stats(
+                len(self._node_stack) + 1)
+        return xml_to_dict_node.get_dict()
+
+    def _get_xml_to_dict_node(self, node: ElementTree.Element) -> XmlToDict:
+        """
+        Prepare a XmlToDict instance
+        :param node: XML object
+        :return: a XmlToDict instance with data
+        """
+        xml_to_dict_node = XmlToDict(
+            node, ignore_namespace=self.ignore_namespace)
+        if self._pull_transformers is not None:
+            xml_to_dict_node.use_pull_transformers(self._pull_transformers)
+        if self._conversion_plans is not None:
+            xml_to_dict_node.use_conversion_plans(self._conversion_plans)
+        if self._tag_normalizer is not None:
+            xml_to_dict_node.use_tag_normalizer(self._tag_normalizer)
+        return xml_to_dict_node
+
+    def _remove_node(self, node: ElementTree.Element) -> None:
+        """
+        Remove processed node from its parent to free memory
+        :param node: XML object
+        """
+        if self._node_stack:
+            self._node_stack[-1].remove(node)
+        else:
+            node.clear()
+
+    def use_pull_transformers(
+            self, pull_transformers: PullTransformers) -> None:
+        """
+        Set up pull_transformation for using into XmlToDict objects
+        :param pull_transformers: PullTransformers instance
+        """
+        if isinstance(pull_transformers, PullTransformers):
+            self._pull_transformers = pull_transformers
+
+    def use_conversion_plans(
+            self, conversion_plans: ConversionPlans) -> None:
+        """
+        Set up cache of conversion plans for using into XmlToDict objects
+        :param conversion_plans: ConversionPlans instance
+        """
+        if isinstance(conversion_plans, ConversionPlans):
+            self._conversion_plans = conversion_plans
+
+    def use_tag_normalizer(self, tag_normalizer: TagNormalizer) -> None:
+        """
+        Set up normalization of tags for matching with the path
+            and for using into XmlToDict objects
+        :param tag_normalizer: TagNormalizer instance
+        """
+        if isinstance(tag_normalizer, TagNormalizer):
+            self._tag_normalizer = tag_normalizer
+
+    def use_stats(self, stats: ConversionStats) -> None:
+        """
+        Set up collecting of statistics of parsing and conversions
+        :param stats: ConversionStats instance
+        """
+        if isinstance(stats, ConversionStats):
+            self._stats = stats
+
+
+class XmlEventsToColumns(XmlEventsToDict):
+    """
+    Class to collect data of elements matching the path into columns
+        from events of xml.etree.ElementTree parsers.
+        Leaf paths are relative to the matched element, for example
+        "@id", "#text", "price/#text" or "price/@currency".
+        Dicts of records are never created
+    """
+    def __init__(self, path: Optional[str] = None,
+                 ignore_namespace: bool = False):
+        """
+        Init instance
+        :param path: path of the records from the root,
+            for example "catalog/product"
+        :param ignore_namespace: removing namespace from tags
+        """
+        super().__init__(path, ignore_namespace=ignore_namespace)
+        self.columns = dict()
+        self.row_count = 0
+
+    def get_columns(self) -> Dict[str, Column]:
+        """
+        Get collected columns. All columns have the same length
+        :return: columns by leaf paths
+        """
+        for column in self.columns.values():
+            column.fill(self.row_count)
+        return self.columns
+
+    def _get_dict(self, node: ElementTree.Element) -> None:
+        """
+        Add data of the record into columns
+        :param node: XML object
+        """
+        row = self.row_count
+        self.row_count += 1
+        stack = [(node, self._get_tag(node), '')]
+        while stack:
+            node, tag, prefix = stack.pop()
+            attributes = node.attrib
+            transformer = None
+            if self._pull_transformers is not None and len(node) == 0:
+                transformer = self._pull_transformers.get_leaf_transformer(
+                    tag, attributes)
+            for name, value in attributes.items():
+                if transformer is not None and transformer.removing_types \
+                        and name == transformer.attribute \
+                        and value == transformer.key:
+                    continue
+                self._add_value(prefix + '@' + name, row, value, None)
+            if len(node):
+                for child_node in reversed(node):
+                    child_tag = self._get_tag(child_node)
+                    stack.append((child_node, child_tag, '{0}{1}/'.format(
+                        prefix, child_tag)))
+                continue
+            value = XmlToDict._get_value(node)
+            key = None
+            if transformer is not None:
+                key = transformer.key
+                if transformer.uses_node_data_hooks():
+                    value = transformer.transform_leaf_node_data(
+                        attributes, value)
+                    if isinstance(value, dict):
+                        value = value.get('#text')
+                else:
+                    value = transformer.get_leaf_values(
+                        [(attributes, value)])[0]
+            self._add_value(prefix + '#text', row, value, key)
+
+    def _add_value(self, leaf_path: str, row: int, value: Any,
+                   type_key: Optional[str]) -> None:
+        """
+        Add a value into the column of a leaf path
+        :param leaf_path: path of a leaf relative to the record
+        :param row: index of the record
+        :param value: value of the leaf
+        :param type_key: key of a transformer of the value
+        """
+        column = self.columns.get(leaf_path)
+        if column is None:
+            column = self.columns[leaf_path] = Column(
+                type_key if value is not None else None)
+        column.append(row, value)
+
+
+class XmlFeedToDict:
+    """
+    Class to work with XML which is received in parts,
+        for example from a socket or a body of HTTP response
+    """
+    def __init__(self, path: Optional[str] = None,
+                 ignore_namespace: bool = False):
+        """
+        Init instance
+        :param path: path of the elements to extract from the root,
+            for example "catalog/product". The root element is
+            extracted if the path is not passed
+        :param ignore_namespace: removing namespace from tags
+        """
+        self.path = path
+        self.ignore_namespace = ignore_namespace
+        self._parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        self._xml_events_to_dict = XmlEventsToDict(
+            path, ignore_namespace=ignore_namespace)
+
+    def feed(self, data: Union[bytes, str]) -> List[Dict]:
+        """
+        Parse the next part of XML
+        >>> xml_feed_to_dict = XmlFeedToDict('catalog/item')
+        >>> xml_feed_to_dict.feed(b'<catalog><item>1</item><it')
+        [{'item': '1'}]
+        >>> xml_feed_to_dict.feed(b'em>2</item></catalog>')
+        [{'item': '2'}]
+        :param data: part of XML
+        :return: extracted data of the elements
+            which have been completed by this part
+        """
+        self._parser.feed(data)
+        return self._read_items()
+
+    def close(self) -> List[Dict]:
+        """
+        Finish parsing. An exception is raised if XML is not complete
+        :return: extracted data of the remaining elements
+        """
+        self._parser.close()
+        return self._read_items()
+
+    def _read_items(self) -> List[Dict]:
+        """
+        Extract data from the elements completed by the parser
+        :return: list of extracted data
+        """
+        events = self._parser.read_events()
+        return list(self._xml_events_to_dict.process_events(events))
+
+    def use_pull_transformers(
+            self, pull_transformers: PullTransformers) -> None:
+        """
+        Set up pull_transformation for using into XmlToDict objects
+        :param pull_transformers: PullTransformers instance
+        """
+        self._xml_events_to_dict.use_pull_transformers(pull_transformers)
+
+    def use_conversion_plans(
+            self, conversion_plans: ConversionPlans) -> None:
+        """
+        Set up cache of conversion plans for using into XmlToDict objects
+        :param conversion_plans: ConversionPlans instance
+        """
+        self._xml_events_to_dict.use_conversion_plans(conversion_plans)
+
+    def use_tag_normalizer(self, tag_normalizer: TagNormalizer) -> None:
+        """
+        Set up normalization of tags for using into XmlToDict objects
+        :param tag_normalizer: TagNormalizer instance
+        """
+        self._xml_events_to_dict.use_tag_normalizer(tag_normalizer)
+
 
 class XmlTextToDict:
-    """Class to work with strings which contain XML"""
-    def __init__(self, xml_text: str, ignore_namespace: bool = False):
+    """Class to work with strings or bytes which contain XML"""
+    def __init__(self, xml_text: Union[str, bytes],
+                 ignore_namespace: bool = False):
         """
         Init instance
-        :param xml_text: string with XML
+        :param xml_text: string or bytes with XML. Bytes are decoded
+            by the parser according to the XML declaration
         :param ignore_namespace: removing namespace from tags
         """
         self.xml_text = xml_text
         self.ignore_namespace = ignore_namespace
         self._pull_transformers = None
+        self._conversion_plans = None
+        self._tag_normalizer = None
+        self._stats = None
+        self._path_selector = None
+        self._parser_backend = None
 
     def get_dict(self) -> Dict:
         """
         Extract data which has been passed during initialization of an instance
         :return: extracted data as a python dict
         """
-        xml_to_dict_node = self.get_xml_to_dict_node()
+        if self._parser_backend is not None \
+                and not self._parser_backend.builds_tree \
+                and self._path_selector is None:
+            return self._get_dict_without_tree()
+        start = time.perf_counter()
+        xml_to_dict_node = self._get_configured_xml_to_dict_node()
+        if self._stats is not None:
+            self._stats.parse_time += time.perf_counter() - start
+            xml_to_dict_node.use_stats(self._stats)
+        return xml_to_dict_node.get_dict()
+
+    def get_lazy_dict(self) -> Dict:
+        """
+        Parse XML and extract data lazily, see XmlToDict.get_lazy_dict
+        :return: python dict with lazy data
+        """
+        return self._get_configured_xml_to_dict_node().get_lazy_dict()
+
+    def _get_configured_xml_to_dict_node(self) -> XmlToDict:
+        """
+        Get XmlToDict instance with options of this instance
+        :return: XmlToDict instance
+        """
+        if self._path_selector is not None:
+            xml_to_dict_node = self._get_selected_xml_to_dict_node()
+        else:
+            xml_to_dict_node = self.get_xml_to_dict_node()
+        return self._configure_xml_to_dict_node(xml_to_dict_node)
+
+    def _get_dict_without_tree(self) -> Dict:
+        """
+        Extract data, using a parser backend which builds dicts
+            during parsing
+        :return: extracted data as a python dict
+        """
+        xml_to_dict_node = self._configure_xml_to_dict_node(
+            XmlToDict(None, ignore_namespace=self.ignore_namespace))
+        with closing_source(self.get_xml_source()) as xml_source:
+            return self._parser_backend.get_dict(
+                xml_source, xml_to_dict_node)
+
+    def _configure_xml_to_dict_node(
+            self, xml_to_dict_node: XmlToDict) -> XmlToDict:
+        """
+        Set up options of this instance for a XmlToDict instance
+        :param xml_to_dict_node: XmlToDict instance
+        :return: the same XmlToDict instance
+        """
         if self._pull_transformers is not None:
             xml_to_dict_node.use_pull_transformers(
                 self._pull_transformers)
-        return xml_to_dict_node.get_dict()
+        if self._conversion_plans is not None:
+            xml_to_dict_node.use_conversion_plans(self._conversion_plans)
+        if self._tag_normalizer is not None:
+            xml_to_dict_node.use_tag_normalizer(self._tag_normalizer)
+        return xml_to_dict_node
+
+    def iter_items(self, path: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Extract data from every element matching the path one by one.
+            The XML is parsed incrementally and processed elements
+            are dropped, so the whole tree is never kept in memory.
+            The source is closed when the iteration is finished
+        >>> text = '<catalog><item>1</item><item>2</item></catalog>'
+        >>> list(XmlTextToDict(text).iter_items('catalog/item'))
+        [{'item': '1'}, {'item': '2'}]
+        :param path: path of the elements from the root,
+            for example "catalog/product"
+        :return: iterator over extracted data as python dicts
+        """
+        xml_events_to_dict = XmlEventsToDict(
+            path, ignore_namespace=self.ignore_namespace)
+        if self._pull_transformers is not None:
+            xml_events_to_dict.use_pull_transformers(self._pull_transformers)
+        if self._conversion_plans is not None:
+            xml_events_to_dict.use_conversion_plans(self._conversion_plans)
+        if self._tag_normalizer is not None:
+            xml_events_to_dict.use_tag_normalizer(self._tag_normalizer)
+        if self._stats is not None:
+            xml_events_to_dict.use_stats(self._stats)
+        with closing_source(self.get_xml_source()) as xml_source:
+            events = ElementTree.iterparse(
+                xml_source, events=('start', 'end'))
+            yield from xml_events_to_dict.process_events(events)
+
+    def get_columns(self, path: Optional[str] = None) -> Dict[str, Column]:
+        """
+        Collect data of every element matching the path into columns
+            by leaf paths, like "@id" or "price/#text".
+            The XML is parsed incrementally and dicts of records
+            are never created
+        >>> text = '<catalog><item id="1"/><item id="2"/></catalog>'
+        >>> columns = XmlTextToDict(text).get_columns('catalog/item')
+        >>> columns['@id'].to_list()
+        ['1', '2']
+        :param path: path of the records from the root,
+            for example "catalog/product"
+        :return: columns by leaf paths
+        """
+        xml_events_to_columns = XmlEventsToColumns(
+            path, ignore_namespace=self.ignore_namespace)
+        if self._pull_transformers is not None:
+            xml_events_to_columns.use_pull_transformers(
+                self._pull_transformers)
+        if self._tag_normalizer is not None:
+            xml_events_to_columns.use_tag_normalizer(self._tag_normalizer)
+        with closing_source(self.get_xml_source()) as xml_source:
+            events = ElementTree.iterparse(
+                xml_source, events=('start', 'end'))
+            for _ in xml_events_to_columns.process_events(events):
+                pass
+        return xml_events_to_columns.get_columns()
 
     def get_xml_to_dict_node(self) -> XmlToDict:
         """
         Prepare a XmlToDict instance
         :return: a XmlToDict instance with data
         """
-        root_node = ElementTree.fromstring(self.xml_text)
+        if self._parser_backend is not None:
+            with closing_source(self.get_xml_source()) as xml_source:
+                root_node = self._parser_backend.get_root_node(xml_source)
+        else:
+            root_node = ElementTree.fromstring(self.xml_text)
         xml_to_dict_node = XmlToDict(
             root_node, ignore_namespace=self.ignore_namespace)
         return xml_to_dict_node
 
+    def get_xml_source(self) -> XmlSource:
+        """
+        Get source of XML for incremental parsing
+        :return: a file path or a file object
+        """
+        if isinstance(self.xml_text, (bytes, bytearray)):
+            return io.BytesIO(self.xml_text)
+        return io.StringIO(self.xml_text)
+
+    def _get_selected_xml_to_dict_node(self) -> XmlToDict:
+        """
+        Prepare a XmlToDict instance with the selected elements only.
+            Other elements are skipped during parsing
+            and are never converted
+        :return: a XmlToDict instance with data
+        """
+        tag_normalizer = self._tag_normalizer
+        if tag_normalizer is None:
+            tag_normalizer = TagNormalizer.get_default(self.ignore_namespace)
+        with closing_source(self.get_xml_source()) as xml_source:
+            root_node = self._path_selector.get_selected_root(
+                xml_source, tag_normalizer.get_tag)
+        return XmlToDict(root_node, ignore_namespace=self.ignore_namespace)
+
     def use_pull_transformers(
             self, pull_transformers: PullTransformers) -> None:
         """
@@ -238,6 +925,54 @@ class XmlTextToDict:
         if isinstance(pull_transformers, PullTransformers):
             self._pull_transformers = pull_transformers
 
+    def use_conversion_plans(
+            self, conversion_plans: ConversionPlans) -> None:
+        """
+        Set up cache of conversion plans for using into XmlToDict objects.
+            Plans speed up iter_items on records with the same structure
+        :param conversion_plans: ConversionPlans instance
+        """
+        if isinstance(conversion_plans, ConversionPlans):
+            self._conversion_plans = conversion_plans
+
+    def use_tag_normalizer(self, tag_normalizer: TagNormalizer) -> None:
+        """
+        Set up normalization of tags for using into XmlToDict objects
+        :param tag_normalizer: TagNormalizer instance
+        """
+        if isinstance(tag_normalizer, TagNormalizer):
+            self._tag_normalizer = tag_normalizer
+
+    def use_stats(self, stats: ConversionStats) -> None:
+        """
+        Set up collecting of statistics of parsing and conversions
+        :param stats: ConversionStats instance
+        """
+        if isinstance(stats, ConversionStats):
+            self._stats = stats
+
+    def use_path_selector(self, path_selector: PathSelector) -> None:
+        """
+        Set up paths of the elements to extract by get_dict.
+            Only the selected elements and their ancestors
+            are converted
+        :param path_selector: PathSelector instance
+        """
+        if isinstance(path_selector, PathSelector):
+            self._path_selector = path_selector
+
+    def use_parser_backend(
+            self, parser_backend: AbstractParserBackend) -> None:
+        """
+        Set up a parser backend for get_dict and get_lazy_dict,
+            for example LxmlBackend or ExpatBackend.
+            xml.etree.ElementTree is used without a backend
+            and for selection of paths
+        :param parser_backend: AbstractParserBackend instance
+        """
+        if isinstance(parser_backend, AbstractParserBackend):
+            self._parser_backend = parser_backend
+
 
 class XmlFileToDict(XmlTextToDict):
     """Class to work with XML files"""
@@ -250,14 +985,46 @@ class XmlFileToDict(XmlTextToDict):
         self.file_path = file_path
         self.ignore_namespace = ignore_namespace
         self._pull_transformers = None
+        self._conversion_plans = None
+        self._tag_normalizer = None
+        self._stats = None
+        self._path_selector = None
+        self._parser_backend = None
+        self.memory_map = False
 
     def get_xml_to_dict_node(self) -> XmlToDict:
         """
         Prepare a XmlToDict instance
         :return: a XmlToDict instance with data
         """
-        tree_node = ElementTree.parse(self.file_path)
-        root_node = tree_node.getroot()
+        with closing_source(self.get_xml_source()) as xml_source:
+            if self._parser_backend is not None:
+                root_node = self._parser_backend.get_root_node(xml_source)
+            else:
+                root_node = ElementTree.parse(xml_source).getroot()
         xml_to_dict_node = XmlToDict(
             root_node, ignore_namespace=self.ignore_namespace)
         return xml_to_dict_node
+
+    def get_xml_source(self) -> XmlSource:
+        """
+        Get source of XML for incremental parsing.
+            Compressed files (gzip, bzip2, xz) are detected
+            by magic bytes and decompressed during reading
+        :return: a file path or a file object
+        """
+        compression_opener = get_compression_opener(self.file_path)
+        if compression_opener is not None:
+            return compression_opener(self.file_path, 'rb')
+        if self.memory_map:
+            return MemoryMapFile(self.file_path)
+        return self.file_path
+
+    def set_memory_map(self, memory_map: bool) -> None:
+        """
+        Set up reading of the file through a memory map
+            instead of a buffered file object.
+            Compressed files are read without a memory map
+        :param memory_map: flag of using a memory map
+        """
+        self.memory_map = memory_map